@@ -0,0 +1,72 @@
+from time import perf_counter
+
+import numpy as np
+
+from simpli.physics import BarnesHutTree, PairwiseInteractions
+
+
+def exact_attraction(
+        positions: np.ndarray,
+        strengths: np.ndarray,
+        ranges: np.ndarray,
+        chunk_size: int = 1_000,
+) -> np.ndarray:
+    forces: np.ndarray = np.zeros_like(positions)
+    parameters: np.ndarray = np.column_stack([strengths, ranges, np.full(len(positions), 0.25)])
+
+    for start in range(0, len(positions), chunk_size):
+        PairwiseInteractions.add_pairwise_forces(
+            forces[start:start + chunk_size],
+            np.arange(len(positions)) - start,
+            positions,
+            positions[start:start + chunk_size],
+            parameters,
+            None,
+        )
+
+    return forces
+
+
+def barnes_hut_attraction(
+        positions: np.ndarray,
+        strengths: np.ndarray,
+        ranges: np.ndarray,
+        theta: float,
+) -> np.ndarray:
+    tree: BarnesHutTree = BarnesHutTree(
+        positions,
+        strengths,
+        ranges,
+        np.full(len(positions), 0.25),
+        np.arange(len(positions)),
+    )
+    return tree.attraction(positions, theta)
+
+
+def main() -> None:
+    generator: np.random.Generator = np.random.default_rng(0)
+
+    for count in (1_000, 4_000, 16_000):
+        positions: np.ndarray = generator.uniform((-6400, -3600), (6400, 3600), (count, 2))
+        strengths: np.ndarray = np.full(count, 0.25)
+        ranges: np.ndarray = np.full(count, 20_000.0)
+
+        started: float = perf_counter()
+        exact: np.ndarray = exact_attraction(positions, strengths, ranges)
+        exact_time: float = perf_counter() - started
+
+        print(f"n={count:>6} exact {exact_time * 1000:9.1f} ms")
+
+        for theta in (0.3, 0.5, 0.8, 1.0):
+            started = perf_counter()
+            approximate: np.ndarray = barnes_hut_attraction(positions, strengths, ranges, theta)
+            approximate_time: float = perf_counter() - started
+
+            error: float = float(
+                np.linalg.norm(approximate - exact, axis=1).mean() / np.linalg.norm(exact, axis=1).mean()
+            )
+            print(f"         theta={theta:.1f} {approximate_time * 1000:9.1f} ms  mean relative error {error:.2e}")
+
+
+if __name__ == "__main__":
+    main()
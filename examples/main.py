@@ -9,8 +9,12 @@ class MyApp(Simpli):
             button: MouseButton,
     ) -> None:
         if button == MouseButton.LEFT:
-            for i in range(5):
-                self.entities.new(CellEntity, position + Vector.random() * 50, 40)
+            self.entities.new_many(
+                CellEntity,
+                5,
+                position=[position + Vector.random(self.rng("clicks")) * 50 for _ in range(5)],
+                radius=40,
+            )
         else:
             repulsion_radius: float = 500
 
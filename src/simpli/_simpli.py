@@ -0,0 +1,634 @@
+from random import Random, SystemRandom
+from threading import Lock
+from math import isfinite
+from time import perf_counter, sleep
+from typing import Any, Type, TYPE_CHECKING, Callable, Dict, List
+
+from simpli.camera import AbstractCamera, Camera
+from simpli.components import PositionComponent, VelocityComponent, AirFrictionComponent, ShapeComponent
+from simpli.entities import AbstractEntityHolder, EntityHolder, ArchetypeEntityHolder, Entity, AbstractEntity, \
+    BackgroundEntity, AbstractCommandBuffer, CommandBuffer, AbstractTransformHierarchy, TransformHierarchy
+from simpli.enums import MouseButton, LayerGroup
+from simpli.internal import Shaders
+from simpli.shapes import Circle, InstancedCircle
+from simpli.shapes import ShapeHolder, AbstractShapeHolder
+from simpli.physics import Kinematics, PairwiseInteractions, ParallelInteractions
+from simpli.profiler import AbstractProfiler, Profiler, ProfilerSnapshot
+from simpli.replay import InputEvent, AbstractInputJournal, InputJournal
+from simpli.snapshots import AbstractSnapshotter, Snapshotter
+from simpli.systems import AbstractSystemHolder, SystemHolder, TickSystem, RenderSystem, VelocitySystem, \
+    AirFrictionSystem, ShapeUpdateSystem, RepulsionSystem, AttractionSystem, VectorizedVelocitySystem, \
+    VectorizedAirFrictionSystem, PairwiseInteractionSystem
+from simpli.utils import Color, Vector
+
+if TYPE_CHECKING:
+    from pyglet.graphics import Batch
+    from pyglet.graphics.shader import ShaderProgram
+    from pyglet.window import Window
+    from simpli.shapes._circle_renderer import CircleRenderer
+else:
+    Batch = Any
+    ShaderProgram = Any
+    Window = Any
+    CircleRenderer = Any
+
+_REFERENCE_TPS: float = 60.0
+
+
+class Simpli:
+    def __init__(
+            self,
+            title: str = "Simpli",
+            *,
+            window_width: int = 1280,
+            window_height: int = 720,
+            window_background_color: Color = Color(0.95, 0.95, 0.95),
+            tps: float = 60.0,
+            timestep: float | None = None,
+            fps: float = 60.0,
+            max_catch_up_ticks: int = 5,
+            entity_holder_type: Type[AbstractEntityHolder] = EntityHolder,
+            vectorized: bool = False,
+            barnes_hut_theta: float | None = None,
+            physics_workers: int | None = None,
+            system_workers: int | None = None,
+            deterministic_systems: bool = False,
+            headless: bool = False,
+            seed: int | None = None,
+            record_input: bool = False,
+            profile: bool = False,
+            profiler_window: int = 240,
+            instanced_circles: bool = False,
+            tessellation_budget: int = 256,
+            **window_kwargs: Any
+    ) -> None:
+        if tps <= 0:
+            raise ValueError("Ticks per second must be positive")
+
+        if timestep is not None and (timestep <= 0 or not isfinite(timestep)):
+            raise ValueError("Timestep must be positive and finite")
+
+        if fps <= 0:
+            raise ValueError("Frames per second must be positive")
+
+        if max_catch_up_ticks < 1:
+            raise ValueError("At least one tick must be allowed per frame")
+
+        if tessellation_budget < 1:
+            raise ValueError("At least one shape must be rebuilt per frame")
+
+        if barnes_hut_theta is not None and not vectorized:
+            raise ValueError("Barnes-Hut attraction requires the vectorized backend")
+
+        if physics_workers is not None and not vectorized:
+            raise ValueError("Parallel physics requires the vectorized backend")
+
+        self._title: str = title
+        self._window_width: int = window_width
+        self._window_height: int = window_height
+        self._window_background_color: Color = window_background_color
+        self._tps: float = tps
+        self._timestep: float = timestep or (1 / tps if isfinite(tps) else 1 / 60)
+        self._fps: float = fps
+        self._max_catch_up_ticks: int = max_catch_up_ticks
+        self._headless: bool = headless
+        self._seed: int = SystemRandom().getrandbits(63) if seed is None else seed
+        self._rngs: Dict[str, Random] = {}
+        self._instanced_circles: bool = instanced_circles
+        self._tessellation_budget: int = tessellation_budget
+
+        self._ticks: int = 0
+        self._epoch: int = 0
+        self._epoch_lock: Lock = Lock()
+        self._accumulator: float = 0.0
+        self._interpolation: float = 1.0
+        self._last_frame: float = perf_counter()
+
+        self._window: Window | None = None
+        self._batch: Batch | None = None
+        self._program: ShaderProgram | None = None
+        self._layout_program: ShaderProgram | None = None
+        self._grid_program: ShaderProgram | None = None
+        self._circle_program: ShaderProgram | None = None
+        self._circle_renderer: CircleRenderer | None = None
+
+        if not headless:
+            self._create_window(**window_kwargs)
+
+        self._profiler: AbstractProfiler = Profiler(app=self, enabled=profile, window=profiler_window)
+        self._journal: AbstractInputJournal = InputJournal(app=self, recording=record_input)
+        self._camera: AbstractCamera = Camera(app=self)
+        self._systems: AbstractSystemHolder = SystemHolder(
+            app=self,
+            workers=system_workers,
+            deterministic=deterministic_systems,
+        )
+        self._entities: AbstractEntityHolder = entity_holder_type(app=self)
+        self._commands: AbstractCommandBuffer = CommandBuffer(app=self)
+        self._transforms: AbstractTransformHierarchy = TransformHierarchy(app=self)
+        self._shapes: AbstractShapeHolder = ShapeHolder(app=self)
+        self._snapshots: AbstractSnapshotter = Snapshotter(app=self)
+
+        self._kinematics: Kinematics | None = None
+        self._interactions: PairwiseInteractions | None = None
+
+        if vectorized:
+            self._kinematics = Kinematics(app=self)
+
+        if vectorized and physics_workers is not None:
+            self._interactions = ParallelInteractions(
+                app=self,
+                kinematics=self._kinematics,
+                barnes_hut_theta=barnes_hut_theta,
+                workers=physics_workers,
+            )
+        elif vectorized:
+            self._interactions = PairwiseInteractions(
+                app=self,
+                kinematics=self._kinematics,
+                barnes_hut_theta=barnes_hut_theta,
+            )
+
+        if vectorized:
+            self._systems.add(
+                VectorizedVelocitySystem,
+                VectorizedAirFrictionSystem,
+                PairwiseInteractionSystem,
+            )
+        else:
+            self._systems.add(
+                VelocitySystem,
+                AirFrictionSystem,
+                AttractionSystem,
+                RepulsionSystem,
+            )
+
+        if not headless:
+            self._systems.add(ShapeUpdateSystem)
+
+        self._window_mouse_position: Vector = Vector.zero()
+
+        self._entities.new(BackgroundEntity)
+
+        if not headless:
+            self._window.set_handler("on_draw", self._frame)
+            self._window.set_handler("on_mouse_motion", self._mouse_move)
+            self._window.set_handler("on_mouse_press", self._mouse_click)
+            self._window.set_handler("on_mouse_scroll", self._mouse_scroll)
+            self._window.set_handler("on_key_press", self._key_press)
+            self._window.set_handler("on_resize", self._resize)
+
+        self.on_startup()
+
+    @property
+    def title(self) -> str:
+        return self._title
+
+    @property
+    def window_width(self) -> int:
+        if self._window is not None:
+            return self._window.width
+
+        return self._window_width
+
+    @property
+    def window_height(self) -> int:
+        if self._window is not None:
+            return self._window.height
+
+        return self._window_height
+
+    @property
+    def window_background_color(self) -> Color:
+        return self._window_background_color
+
+    @property
+    def tps(self) -> float:
+        return self._tps
+
+    @property
+    def fps(self) -> float:
+        return self._fps
+
+    @property
+    def tick_interval(self) -> float:
+        return 1 / self._tps
+
+    @property
+    def timestep(self) -> float:
+        return self._timestep
+
+    @property
+    def tick_scale(self) -> float:
+        return self._timestep * _REFERENCE_TPS
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def interpolation(self) -> float:
+        return self._interpolation
+
+    @property
+    def epoch(self) -> int:
+        return self._epoch
+
+    @property
+    def headless(self) -> bool:
+        return self._headless
+
+    @property
+    def window(self) -> Window | None:
+        return self._window
+
+    @property
+    def batch(self) -> Batch | None:
+        return self._batch
+
+    @property
+    def program(self) -> ShaderProgram | None:
+        return self._program
+
+    @property
+    def layout_program(self) -> ShaderProgram | None:
+        return self._layout_program
+
+    @property
+    def grid_program(self) -> ShaderProgram | None:
+        return self._grid_program
+
+    @property
+    def circle_program(self) -> ShaderProgram | None:
+        return self._circle_program
+
+    @property
+    def circle_renderer(self) -> CircleRenderer | None:
+        return self._circle_renderer
+
+    @property
+    def circle_shape_type(self) -> Type[Circle | InstancedCircle]:
+        return InstancedCircle if self._instanced_circles else Circle
+
+    @property
+    def tessellation_budget(self) -> int:
+        return self._tessellation_budget
+
+    @property
+    def camera(self) -> AbstractCamera:
+        return self._camera
+
+    @property
+    def systems(self) -> AbstractSystemHolder:
+        return self._systems
+
+    @property
+    def entities(self) -> AbstractEntityHolder:
+        return self._entities
+
+    @property
+    def journal(self) -> AbstractInputJournal:
+        return self._journal
+
+    @property
+    def commands(self) -> AbstractCommandBuffer:
+        return self._commands
+
+    @property
+    def transforms(self) -> AbstractTransformHierarchy:
+        return self._transforms
+
+    @property
+    def snapshots(self) -> AbstractSnapshotter:
+        return self._snapshots
+
+    @property
+    def shapes(self) -> AbstractShapeHolder:
+        return self._shapes
+
+    @property
+    def profiler(self) -> AbstractProfiler:
+        return self._profiler
+
+    @property
+    def kinematics(self) -> Kinematics | None:
+        return self._kinematics
+
+    @property
+    def interactions(self) -> PairwiseInteractions | None:
+        return self._interactions
+
+    @property
+    def mouse_position(self) -> Vector:
+        return self._camera.target_position_from_window(self.window_mouse_position)
+
+    @property
+    def window_mouse_position(self) -> Vector:
+        return self._window_mouse_position
+
+    def run(self) -> None:
+        self._accumulator = 0.0
+        self._last_frame = perf_counter()
+
+        try:
+            self._run()
+        finally:
+            self._systems.close()
+
+    def _run(self) -> None:
+        if not self._headless:
+            from pyglet.app import run
+
+            run(interval=1 / self._fps)
+            return
+
+        interval: float = self.tick_interval
+        next_tick: float = perf_counter()
+
+        while True:
+            self._tick()
+
+            if interval == 0:
+                continue
+
+            next_tick += interval
+            delay: float = next_tick - perf_counter()
+
+            if delay > 0:
+                sleep(delay)
+            else:
+                next_tick = perf_counter()
+
+    def invalidate_bindings(self) -> None:
+        with self._epoch_lock:
+            self._epoch += 1
+
+    def rng(self, stream: str = "default") -> Random:
+        rng: Random | None = self._rngs.get(stream)
+
+        if rng is None:
+            rng = Random(f"{self._seed}:{stream}")
+            self._rngs[stream] = rng
+
+        return rng
+
+    def step(self, ticks: int = 1) -> None:
+        for _ in range(ticks):
+            self._tick()
+
+    def replay(self, journal: AbstractInputJournal, ticks: int | None = None) -> List[ProfilerSnapshot]:
+        if not self._headless:
+            raise ValueError("Replay requires a headless app")
+
+        if journal.seed != self._seed:
+            raise ValueError(f"Journal was recorded with seed {journal.seed}, app uses {self._seed}")
+
+        end: int = journal.ticks if ticks is None else ticks
+        profiler: AbstractProfiler = self._profiler
+        enabled: bool = profiler.enabled
+        snapshots: List[ProfilerSnapshot] = []
+
+        profiler.enabled = True
+
+        try:
+            while self._ticks < end:
+                for event in journal.at(self._ticks):
+                    self._feed(event)
+
+                profiler.reset()
+                self._tick()
+                snapshots.append(profiler.snapshot())
+        finally:
+            profiler.enabled = enabled
+
+        return snapshots
+
+    def on_startup(self) -> None:
+        pass
+
+    def on_tick(self) -> None:
+        pass
+
+    def on_mouse_move(
+            self,
+            position: Vector,
+            distance: Vector,
+    ) -> None:
+        pass
+
+    def on_mouse_click(
+            self,
+            position: Vector,
+            button: MouseButton,
+    ) -> None:
+        pass
+
+    def on_mouse_scroll(
+            self,
+            position: Vector,
+            scroll: float,
+    ) -> None:
+        pass
+
+    def _create_window(self, **window_kwargs: Any) -> None:
+        from pyglet.gl import Config, glClearColor
+        from pyglet.graphics import Batch
+        from pyglet.graphics.shader import ShaderProgram, Shader
+        from pyglet.window import Window, FPSDisplay
+
+        self._window = Window(
+            caption=self._title,
+            width=self._window_width,
+            height=self._window_height,
+            config=Config(sample_buffers=1, samples=4),
+            **window_kwargs
+        )
+
+        glClearColor(*self._window_background_color.as_tuple)
+
+        self._batch = Batch()
+        self._groups = {layer_group: layer_group.value for layer_group in LayerGroup}
+
+        self._program = ShaderProgram(
+            Shader(Shaders.VERTEX_SHADER, "vertex"),
+            Shader(Shaders.FRAGMENT_SHADER, "fragment"),
+        )
+        self._layout_program = ShaderProgram(
+            Shader(Shaders.LAYOUT_VERTEX_SHADER, "vertex"),
+            Shader(Shaders.LAYOUT_FRAGMENT_SHADER, "fragment"),
+        )
+        self._grid_program = ShaderProgram(
+            Shader(Shaders.GRID_VERTEX_SHADER, "vertex"),
+            Shader(Shaders.GRID_FRAGMENT_SHADER, "fragment"),
+        )
+
+        if self._instanced_circles:
+            from simpli.shapes._circle_renderer import CircleRenderer
+
+            self._circle_program = ShaderProgram(
+                Shader(Shaders.CIRCLE_VERTEX_SHADER, "vertex"),
+                Shader(Shaders.CIRCLE_FRAGMENT_SHADER, "fragment"),
+            )
+            self._circle_renderer = CircleRenderer(app=self)
+
+        self.a = FPSDisplay(self._window)
+
+    def _tick(self) -> None:
+        self._ticks += 1
+        self.invalidate_bindings()
+        self._interpolation = 1.0
+        self._journal._ticked(self._ticks)
+
+        if self._profiler.enabled:
+            self._profiled_tick()
+            return
+
+        self.on_tick()
+        self._commands.apply()
+        self._camera.tick()
+
+        for stage in self._systems.stages(TickSystem):
+            self._systems.execute(stage, lambda system: system.tick())
+            self._commands.apply()
+
+    def _profiled_tick(self) -> None:
+        profiler: AbstractProfiler = self._profiler
+        start: float = perf_counter()
+
+        profiler.measure("on_tick", self.on_tick)
+        profiler.measure("commands", self._commands.apply)
+        profiler.measure("camera.tick", self._camera.tick)
+
+        for stage in self._systems.stages(TickSystem):
+            self._systems.execute(stage, lambda system: profiler.measure(f"tick.{system.tag()}", system.tick))
+            profiler.measure("commands", self._commands.apply)
+
+        profiler.record("tick", perf_counter() - start)
+
+    def _advance(self) -> None:
+        now: float = perf_counter()
+        interval: float = self.tick_interval
+
+        self._accumulator += now - self._last_frame
+        self._last_frame = now
+
+        for _ in range(self._max_catch_up_ticks):
+            if self._accumulator < interval:
+                break
+
+            self._tick()
+            self._accumulator -= interval
+        else:
+            self._accumulator = min(self._accumulator, interval)
+
+        self._interpolation = min(self._accumulator / interval, 1.0) if interval > 0 else 1.0
+
+    def _frame(self) -> None:
+        profiler: AbstractProfiler = self._profiler
+        start: float = perf_counter()
+
+        self._window.clear()
+        self._advance()
+        self.invalidate_bindings()
+
+        for system in self._systems.by_system(RenderSystem):
+            if profiler.enabled:
+                profiler.measure(f"render.{system.tag()}", system.render)
+            else:
+                system.render()
+
+            self._commands.apply()
+
+        self._program["u_window_size"] = self._window.size
+        self._program["u_camera_position"] = self._camera.position.as_tuple
+        self._program["u_zoom"] = self._camera.zoom
+
+        self._layout_program["u_window_size"] = (*self._window.size, 0)
+        self._layout_program["u_camera_position"] = (*self._camera.position.as_tuple, 0)
+        self._layout_program["u_zoom"] = self._camera.zoom
+
+        self._grid_program["u_window_size"] = self._window.size
+        self._grid_program["u_camera_position"] = self._camera.position.as_tuple
+        self._grid_program["u_zoom"] = self._camera.zoom
+
+        if self._circle_program is not None:
+            self._circle_program["u_window_size"] = self._window.size
+            self._circle_program["u_camera_position"] = self._camera.position.as_tuple
+            self._circle_program["u_zoom"] = self._camera.zoom
+
+        if profiler.enabled:
+            profiler.measure("batch.draw", self._batch.draw)
+        else:
+            self._batch.draw()
+
+        self.a.draw()
+
+        if profiler.enabled:
+            profiler.record("frame", perf_counter() - start)
+            profiler.draw()
+
+    def _feed(self, event: InputEvent) -> None:
+        handlers: Dict[str, Callable[..., None]] = {
+            "mouse_move": self._mouse_move,
+            "mouse_click": self._mouse_click,
+            "mouse_scroll": self._mouse_scroll,
+            "resize": self._resize,
+        }
+
+        handlers[event.kind](*event.arguments)
+
+    def _resize(self, width: int, height: int) -> None:
+        self._journal.record("resize", width, height)
+        self._window_width = width
+        self._window_height = height
+        self._shapes.mark_all_dirty()
+
+    def _key_press(self, symbol: int, modifiers: int) -> None:
+        from pyglet.window import key
+
+        if symbol == key.F3:
+            self._profiler.overlay_visible = not self._profiler.overlay_visible
+
+    def _mouse_move(
+            self,
+            x: int,
+            y: int,
+            dx: int,
+            dy: int,
+    ) -> None:
+        self._journal.record("mouse_move", x, y, dx, dy)
+        self._window_mouse_position = Vector(x, y)
+        self.on_mouse_move(self.mouse_position, self._camera.position_from_window(Vector(dx, dy)))
+
+    def _mouse_click(
+            self,
+            x: int,
+            y: int,
+            button: int,
+            modifiers: int,
+    ) -> None:
+        self._journal.record("mouse_click", x, y, button, modifiers)
+
+        try:
+            button: MouseButton = MouseButton(button)
+        except ValueError:
+            return
+
+        self.on_mouse_click(self._camera.position_from_window(Vector(x, y)), button)
+
+    def _mouse_scroll(
+            self,
+            x: int,
+            y: int,
+            scroll_x: float,
+            scroll_y: float,
+    ) -> None:
+        self._journal.record("mouse_scroll", x, y, scroll_x, scroll_y)
+        scroll: float = scroll_y if abs(scroll_y) >= abs(scroll_x) else scroll_x
+
+        self._camera.adjust_zoom_by_scroll(scroll)
+        self.on_mouse_scroll(self._camera.position_from_window(Vector(x, y)), scroll)
@@ -0,0 +1,21 @@
+from ._runner import BenchmarkResult, Regression, IMPORT_MODULES, run_benchmarks, measure_imports, results_to_json, \
+    results_from_json, compare
+from ._scenario import Scenario, UniformScenario, ClusteredScenario, SpawnBurstScenario, MassDestructionScenario, \
+    HolderScenario, BindingScenario, SCENARIOS
+
+__all__ = [
+    BenchmarkResult,
+    Regression,
+    Scenario,
+    UniformScenario,
+    ClusteredScenario,
+    SpawnBurstScenario,
+    MassDestructionScenario,
+    HolderScenario,
+    BindingScenario,
+    run_benchmarks,
+    measure_imports,
+    results_to_json,
+    results_from_json,
+    compare,
+]
@@ -0,0 +1,74 @@
+import json
+import sys
+from argparse import ArgumentParser, Namespace
+from typing import Any, Dict, List
+
+from . import SCENARIOS, BenchmarkResult, Regression, run_benchmarks, measure_imports, results_to_json, \
+    results_from_json, compare
+
+
+def parse_arguments(arguments: List[str] | None = None) -> Namespace:
+    parser: ArgumentParser = ArgumentParser(prog="python -m simpli.bench", description="Run Simpli benchmarks")
+    parser.add_argument(
+        "-s", "--scenarios",
+        nargs="+",
+        choices=sorted(SCENARIOS),
+        default=list(SCENARIOS),
+    )
+    parser.add_argument("-n", "--counts", nargs="+", type=int, default=[1_000, 10_000, 100_000])
+    parser.add_argument("-t", "--ticks", type=int, default=10)
+    parser.add_argument("-q", "--queries", type=int, default=1000)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--backend", choices=("scalar", "vectorized"), default="scalar")
+    parser.add_argument("--imports", action="store_true", help="also time importing the package in fresh interpreters")
+    parser.add_argument("-o", "--output", help="write the results to this JSON file instead of stdout")
+    parser.add_argument("-c", "--compare", metavar="BASELINE", help="flag regressions against a stored JSON run")
+    parser.add_argument("--threshold", type=float, default=0.2, help="relative slowdown counted as a regression")
+    return parser.parse_args(arguments)
+
+
+def main(arguments: List[str] | None = None) -> int:
+    options: Namespace = parse_arguments(arguments)
+
+    results: List[BenchmarkResult] = run_benchmarks(
+        [SCENARIOS[name] for name in options.scenarios],
+        options.counts,
+        ticks=options.ticks,
+        queries=options.queries,
+        seed=options.seed,
+        vectorized=options.backend == "vectorized",
+    )
+
+    if options.imports:
+        results.extend(measure_imports())
+
+    report: Dict[str, Any] = results_to_json(results, backend=options.backend, seed=options.seed)
+
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(report, file, indent=2)
+    else:
+        json.dump(report, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+
+    if not options.compare:
+        return 0
+
+    with open(options.compare) as file:
+        baseline: List[BenchmarkResult] = results_from_json(json.load(file))
+
+    regressions: List[Regression] = compare(results, baseline, threshold=options.threshold)
+
+    for regression in regressions:
+        print(
+            f"REGRESSION {regression.scenario} n={regression.count} {regression.metric}: "
+            f"{regression.baseline * 1000:.3f} ms -> {regression.current * 1000:.3f} ms "
+            f"(x{regression.ratio:.2f})",
+            file=sys.stderr,
+        )
+
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
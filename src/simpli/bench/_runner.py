@@ -0,0 +1,162 @@
+import gc
+import os
+import platform
+import subprocess
+import sys
+from dataclasses import dataclass, asdict
+from random import Random
+from statistics import median
+from typing import Any, Dict, Iterable, List, Tuple, Type
+
+from ._scenario import Scenario
+
+IMPORT_MODULES: Tuple[str, ...] = (
+    "simpli",
+    "simpli.utils",
+    "simpli.components",
+    "simpli.entities",
+    "simpli.systems",
+)
+
+_IMPORT_PROBE: str = """
+import sys
+from time import perf_counter
+
+start = perf_counter()
+__import__(sys.argv[1])
+seconds = perf_counter() - start
+
+print(seconds)
+print(" ".join(name for name in sys.modules if name.startswith(("pyglet.gl", "pyglet.window", "pyglet.graphics"))))
+"""
+
+
+@dataclass(kw_only=True, slots=True)
+class BenchmarkResult:
+    scenario: str
+    count: int
+    metric: str
+    seconds: float
+
+    @property
+    def key(self) -> Tuple[str, int, str]:
+        return self.scenario, self.count, self.metric
+
+
+@dataclass(kw_only=True, slots=True)
+class Regression:
+    scenario: str
+    count: int
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def ratio(self) -> float:
+        if self.baseline == 0:
+            return float("inf")
+
+        return self.current / self.baseline
+
+
+def run_benchmarks(
+        scenarios: Iterable[Type[Scenario]],
+        counts: Iterable[int],
+        *,
+        ticks: int = 10,
+        queries: int = 1000,
+        seed: int = 0,
+        vectorized: bool = False,
+) -> List[BenchmarkResult]:
+    from simpli import Simpli
+
+    results: List[BenchmarkResult] = []
+
+    for scenario_type in scenarios:
+        scenario: Scenario = scenario_type(ticks=ticks, queries=queries)
+
+        for count in counts:
+            gc.collect()
+
+            app: Simpli = Simpli(headless=True, vectorized=vectorized, seed=seed)
+
+            for metric, seconds in scenario.measure(app, count, Random(seed)).items():
+                results.append(BenchmarkResult(
+                    scenario=scenario_type.name(),
+                    count=count,
+                    metric=metric,
+                    seconds=seconds,
+                ))
+
+            del app
+
+    return results
+
+
+def measure_imports(modules: Iterable[str] = IMPORT_MODULES, *, repeats: int = 5) -> List[BenchmarkResult]:
+    return [
+        BenchmarkResult(
+            scenario="import",
+            count=0,
+            metric=module,
+            seconds=median(_import_seconds(module) for _ in range(repeats)),
+        )
+        for module in modules
+    ]
+
+
+def _import_seconds(module: str) -> float:
+    source: str = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    path: str = os.pathsep.join(filter(None, (source, os.environ.get("PYTHONPATH"))))
+
+    output: List[str] = subprocess.run(
+        [sys.executable, "-c", _IMPORT_PROBE, module],
+        check=True,
+        capture_output=True,
+        text=True,
+        env={**os.environ, "PYTHONPATH": path},
+    ).stdout.splitlines()
+
+    if len(output) > 1 and output[1]:
+        raise RuntimeError(f"Importing {module} loaded {output[1]}")
+
+    return float(output[0])
+
+
+def results_to_json(results: Iterable[BenchmarkResult], **metadata: Any) -> Dict[str, Any]:
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        **metadata,
+        "results": [asdict(result) for result in results],
+    }
+
+
+def results_from_json(data: Dict[str, Any]) -> List[BenchmarkResult]:
+    return [BenchmarkResult(**result) for result in data["results"]]
+
+
+def compare(
+        results: Iterable[BenchmarkResult],
+        baseline: Iterable[BenchmarkResult],
+        *,
+        threshold: float = 0.2,
+) -> List[Regression]:
+    baseline_seconds: Dict[Tuple[str, int, str], float] = {result.key: result.seconds for result in baseline}
+    regressions: List[Regression] = []
+
+    for result in results:
+        previous: float | None = baseline_seconds.get(result.key)
+
+        if previous is None or result.seconds <= previous * (1 + threshold):
+            continue
+
+        regressions.append(Regression(
+            scenario=result.scenario,
+            count=result.count,
+            metric=result.metric,
+            baseline=previous,
+            current=result.seconds,
+        ))
+
+    return regressions
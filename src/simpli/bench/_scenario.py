@@ -0,0 +1,292 @@
+from abc import ABC, abstractmethod
+from random import Random
+from statistics import median
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Dict, List, Type
+
+from simpli.components import PositionComponent
+from simpli.entities import CellEntity
+from simpli.interfaces import Identifiable
+from simpli.systems import TickSystem
+from simpli.utils import Vector, Holder, Value, Binding, FieldBinding, resolve
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+    from simpli.entities import AbstractEntity
+else:
+    Simpli = Any
+    AbstractEntity = Any
+
+WORLD_WIDTH: float = 12800
+WORLD_HEIGHT: float = 7200
+
+
+class Scenario(ABC):
+    @classmethod
+    @abstractmethod
+    def name(cls) -> str:
+        raise NotImplementedError
+
+    @abstractmethod
+    def populate(self, app: Simpli, count: int, rng: Random) -> None:
+        raise NotImplementedError
+
+    def __init__(self, *, ticks: int = 10, queries: int = 1000, query_radius: float = 250) -> None:
+        self._ticks: int = ticks
+        self._queries: int = queries
+        self._query_radius: float = query_radius
+
+    def measure(self, app: Simpli, count: int, rng: Random) -> Dict[str, float]:
+        results: Dict[str, float] = {}
+
+        start: float = perf_counter()
+        self.populate(app, count, rng)
+        results["populate"] = perf_counter() - start
+
+        results.update(self.measure_systems(app))
+        results.update(self.measure_nearby(app, rng))
+        results.update(self.measure_frames(app))
+        return results
+
+    def measure_systems(self, app: Simpli) -> Dict[str, float]:
+        samples: Dict[str, List[float]] = {}
+
+        for _ in range(self._ticks):
+            for system in app.systems.by_system(TickSystem):
+                start: float = perf_counter()
+                system.tick()
+                samples.setdefault(f"tick.{system.tag()}", []).append(perf_counter() - start)
+
+        return {metric: median(values) for metric, values in samples.items()}
+
+    def measure_nearby(self, app: Simpli, rng: Random) -> Dict[str, float]:
+        centers: List[Vector] = [self.random_position(rng) for _ in range(self._queries)]
+
+        start: float = perf_counter()
+
+        for center in centers:
+            for _ in app.entities.nearby(center, self._query_radius, PositionComponent):
+                pass
+
+        return {"nearby": (perf_counter() - start) / max(self._queries, 1)}
+
+    def measure_frames(self, app: Simpli) -> Dict[str, float]:
+        samples: List[float] = []
+
+        for _ in range(self._ticks):
+            start: float = perf_counter()
+            app.step()
+            samples.append(perf_counter() - start)
+
+        return {"frame": median(samples)}
+
+    @staticmethod
+    def random_position(rng: Random) -> Vector:
+        return Vector(
+            (rng.random() - 0.5) * WORLD_WIDTH,
+            (rng.random() - 0.5) * WORLD_HEIGHT,
+        )
+
+    @staticmethod
+    def spawn_cell(app: Simpli, position: Vector, rng: Random) -> CellEntity:
+        return app.entities.new(CellEntity, position, rng.uniform(10, 30))
+
+
+class UniformScenario(Scenario):
+    @classmethod
+    def name(cls) -> str:
+        return "uniform"
+
+    def populate(self, app: Simpli, count: int, rng: Random) -> None:
+        for _ in range(count):
+            self.spawn_cell(app, self.random_position(rng), rng)
+
+
+class ClusteredScenario(Scenario):
+    def __init__(self, *, cluster_size: int = 500, spread: float = 150, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._cluster_size: int = cluster_size
+        self._spread: float = spread
+
+    @classmethod
+    def name(cls) -> str:
+        return "clustered"
+
+    def populate(self, app: Simpli, count: int, rng: Random) -> None:
+        centers: List[Vector] = [
+            self.random_position(rng) * 0.8 for _ in range(max(count // self._cluster_size, 1))
+        ]
+
+        for index in range(count):
+            center: Vector = centers[index % len(centers)]
+            self.spawn_cell(app, center + Vector(rng.gauss(0, self._spread), rng.gauss(0, self._spread)), rng)
+
+
+class SpawnBurstScenario(UniformScenario):
+    @classmethod
+    def name(cls) -> str:
+        return "spawn_burst"
+
+    def measure(self, app: Simpli, count: int, rng: Random) -> Dict[str, float]:
+        self.populate(app, count // 2, rng)
+        app.step()
+
+        positions: List[Vector] = [self.random_position(rng) for _ in range(count)]
+
+        start: float = perf_counter()
+
+        for position in positions:
+            self.spawn_cell(app, position, rng)
+
+        burst: float = perf_counter() - start
+        app.step()
+
+        return {
+            "spawn": burst,
+            "spawn.per_entity": burst / max(count, 1),
+            **self.measure_frames(app),
+        }
+
+
+class MassDestructionScenario(UniformScenario):
+    @classmethod
+    def name(cls) -> str:
+        return "mass_destruction"
+
+    def measure(self, app: Simpli, count: int, rng: Random) -> Dict[str, float]:
+        self.populate(app, count, rng)
+        app.step()
+
+        cells: List[CellEntity] = [entity for entity in app.entities if isinstance(entity, CellEntity)]
+        rng.shuffle(cells)
+
+        start: float = perf_counter()
+
+        for cell in cells:
+            cell.destroy()
+
+        destruction: float = perf_counter() - start
+
+        return {
+            "destroy": destruction,
+            "destroy.per_entity": destruction / max(len(cells), 1),
+            **self.measure_frames(app),
+        }
+
+
+class _Item(Identifiable):
+    __slots__ = (
+        "_identifier",
+    )
+
+    def __init__(self) -> None:
+        self._identifier: int | None = None
+
+    @property
+    def identifier(self) -> int:
+        return self._identifier
+
+    def set_identifier_if_none(self, identifier: int) -> None:
+        self._identifier = identifier
+
+
+class HolderScenario(Scenario):
+    @classmethod
+    def name(cls) -> str:
+        return "holder"
+
+    def populate(self, app: Simpli, count: int, rng: Random) -> None:
+        pass
+
+    def measure(self, app: Simpli, count: int, rng: Random) -> Dict[str, float]:
+        holder: Holder[_Item] = Holder()
+        items: List[_Item] = [_Item() for _ in range(count)]
+
+        start: float = perf_counter()
+
+        for item in items:
+            holder.add(item)
+
+        add: float = perf_counter() - start
+
+        identifiers: List[int] = [item.identifier for item in items]
+        rng.shuffle(identifiers)
+
+        start = perf_counter()
+
+        for identifier in identifiers:
+            holder.remove(identifier)
+
+        remove: float = perf_counter() - start
+
+        return {
+            "holder.add": add / max(count, 1),
+            "holder.remove": remove / max(count, 1),
+        }
+
+
+class BindingScenario(Scenario):
+    def __init__(self, *, reads: int = 4, **kwargs: Any) -> None:
+        super().__init__(**kwargs)
+        self._reads: int = reads
+
+    @classmethod
+    def name(cls) -> str:
+        return "bindings"
+
+    def populate(self, app: Simpli, count: int, rng: Random) -> None:
+        for _ in range(count):
+            app.entities.new(components=[(PositionComponent, {"position": self.random_position(rng)})])
+
+    def measure(self, app: Simpli, count: int, rng: Random) -> Dict[str, float]:
+        self.populate(app, count, rng)
+        entities: List[AbstractEntity] = list(app.entities.by_components(PositionComponent))
+
+        bindings: Dict[str, List[Any]] = {
+            "value": [
+                Value(lambda entity=entity: entity.components.get(PositionComponent).position)
+                for entity in entities
+            ],
+            "binding": [
+                Binding(lambda entity=entity: entity.components.get(PositionComponent).position, app=app)
+                for entity in entities
+            ],
+            "field_binding": [FieldBinding(entity, PositionComponent, "position") for entity in entities],
+        }
+        results: Dict[str, float] = {}
+
+        for kind, values in bindings.items():
+            app.invalidate_bindings()
+            start: float = perf_counter()
+
+            for value in values:
+                for _ in range(self._reads):
+                    value.x
+
+            results[f"{kind}.read"] = (perf_counter() - start) / max(len(values) * self._reads, 1)
+
+            app.invalidate_bindings()
+            start = perf_counter()
+
+            for value in values:
+                resolved: Vector = resolve(value)
+
+                for _ in range(self._reads):
+                    resolved.x
+
+            results[f"{kind}.resolve"] = (perf_counter() - start) / max(len(values) * self._reads, 1)
+
+        return results
+
+
+SCENARIOS: Dict[str, Type[Scenario]] = {
+    scenario.name(): scenario
+    for scenario in (
+        UniformScenario,
+        ClusteredScenario,
+        SpawnBurstScenario,
+        MassDestructionScenario,
+        HolderScenario,
+        BindingScenario,
+    )
+}
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, Tuple
 
 from simpli.interfaces import AppDependant
 from simpli.utils import Vector
@@ -41,6 +41,11 @@ class AbstractCamera(AppDependant, ABC):
     def target_zoom(self, value: float) -> None:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def view_bounds(self) -> Tuple[Vector, Vector]:
+        raise NotImplementedError
+
     @abstractmethod
     def tick(self) -> None:
         raise NotImplementedError
@@ -134,8 +139,15 @@ class Camera(AbstractCamera):
     def max_y_position(self) -> float:
         return (self._area_height - self.app.window_height / self.target_zoom) / 2
 
+    @property
+    def view_bounds(self) -> Tuple[Vector, Vector]:
+        half_size: Vector = Vector(self.app.window_width / self._zoom / 2, self.app.window_height / self._zoom / 2)
+        return self._position - half_size, self._position + half_size
+
     def tick(self) -> None:
         if self._zoom != self._target_zoom:
+            self.app.shapes.mark_all_dirty()
+
             if abs(self._zoom - self._target_zoom) < 0.001:
                 self._zoom = self._target_zoom
             else:
@@ -158,13 +170,13 @@ class Camera(AbstractCamera):
 
     def position_from_window(self, window_position: Vector) -> Vector:
         return (
-                (window_position - Vector(self.app.window.width / 2, self.app.window.height / 2))
+                (window_position - Vector(self.app.window_width / 2, self.app.window_height / 2))
                 * (1 / self._zoom) + self._position
         )
 
     def target_position_from_window(self, window_position: Vector) -> Vector:
         return (
-                (window_position - Vector(self.app.window.width / 2, self.app.window.height / 2))
+                (window_position - Vector(self.app.window_width / 2, self.app.window_height / 2))
                 * (1 / self._target_zoom) + self._target_position
         )
 
@@ -1,37 +1,222 @@
+from abc import ABC, abstractmethod
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Tuple
 
 from simpli.shapes import Shape
 from simpli.utils import Vector, Color
 from ._component import Component
-from ._component_holder import AbstractComponentHolder, ComponentHolder
+from ._archetype import Archetype, ArchetypeStorage
+from ._component_holder import AbstractComponentHolder, ComponentHolder, ArchetypeComponentHolder
 
+if TYPE_CHECKING:
+    from simpli import Simpli
+    from simpli.entities import AbstractEntity
+    from simpli.physics import Kinematics
+else:
+    Simpli = Any
+    AbstractEntity = Any
+    Kinematics = Any
+
+
+@dataclass(kw_only=True, slots=True, init=False)
+class KinematicComponent(Component, ABC):
+    _kinematics: Kinematics | None
+    _slot: int
+    _synced: int
+
+    def __init__(self, *, _app: Simpli, _entity: AbstractEntity) -> None:
+        self._app = _app
+        self._entity = _entity
+        self._kinematics = None
+        self._slot = -1
+        self._synced = -1
+
+    def _bind(self, kinematics: Kinematics, slot: int) -> None:
+        self._kinematics = kinematics
+        self._slot = slot
+        self._synced = kinematics.version
+
+    def _move(self, slot: int) -> None:
+        self._slot = slot
+
+    @abstractmethod
+    def _unbind(self) -> None:
+        raise NotImplementedError
 
-@dataclass(kw_only=True, slots=True)
-class PositionComponent(Component):
-    position: Vector = Vector.zero()
+
+@dataclass(kw_only=True, slots=True, init=False)
+class PositionComponent(KinematicComponent):
+    _position: Vector
+    _previous_position: Vector
+    _moved_tick: int
+
+    def __init__(self, *, _app: Simpli, _entity: AbstractEntity, position: Vector = Vector.zero()) -> None:
+        super(PositionComponent, self).__init__(_app=_app, _entity=_entity)
+        self._position = position
+        self._previous_position = position
+        self._moved_tick = -1
 
     @classmethod
     def tag(cls) -> str:
         return "position"
 
+    @classmethod
+    def snapshot_fields(cls) -> Tuple[str, ...]:
+        return ("position",)
 
-@dataclass(kw_only=True, slots=True)
-class VelocityComponent(Component):
-    velocity: Vector = Vector.zero()
+    @property
+    def position(self) -> Vector:
+        if self._kinematics is not None and self._synced != self._kinematics.version:
+            self._position = self._kinematics.position(self._slot)
+            self._synced = self._kinematics.version
+
+        return self._position
+
+    @position.setter
+    def position(self, value: Vector) -> None:
+        if self._kinematics is None and self._moved_tick != self._app.ticks:
+            self._previous_position = self._position
+            self._moved_tick = self._app.ticks
+
+        self._position = value
+
+        if self._kinematics is not None:
+            self._kinematics.set_position(self._slot, value)
+            self._synced = self._kinematics.version
+
+        self._app.entities._position_changed(self._entity, value)
+        self._app.shapes._entity_changed(self._entity)
+        self._app.transforms._anchor_moved(self._entity)
+
+    @property
+    def interpolated_position(self) -> Vector:
+        alpha: float = self._app.interpolation
+
+        if self._kinematics is not None:
+            return self._kinematics.interpolated_position(self._slot, alpha)
+
+        if alpha >= 1 or self._moved_tick != self._app.ticks:
+            return self._position
+
+        return self._previous_position + (self._position - self._previous_position) * alpha
+
+    def _unbind(self) -> None:
+        self._position = self.position
+        self._previous_position = self._position
+        self._kinematics = None
+        self._slot = -1
+
+
+@dataclass(kw_only=True, slots=True, init=False)
+class VelocityComponent(KinematicComponent):
+    _velocity: Vector
+
+    def __init__(self, *, _app: Simpli, _entity: AbstractEntity, velocity: Vector = Vector.zero()) -> None:
+        super(VelocityComponent, self).__init__(_app=_app, _entity=_entity)
+        self._velocity = velocity
 
     @classmethod
     def tag(cls) -> str:
         return "velocity"
 
+    @classmethod
+    def snapshot_fields(cls) -> Tuple[str, ...]:
+        return ("velocity",)
 
-@dataclass(kw_only=True, slots=True)
-class AirFrictionComponent(Component):
-    air_friction: float = 0.035
+    @property
+    def velocity(self) -> Vector:
+        if self._kinematics is not None and self._synced != self._kinematics.version:
+            self._velocity = self._kinematics.velocity(self._slot)
+            self._synced = self._kinematics.version
+
+        return self._velocity
+
+    @velocity.setter
+    def velocity(self, value: Vector) -> None:
+        self._velocity = value
+
+        if self._kinematics is not None:
+            self._kinematics.set_velocity(self._slot, value)
+            self._synced = self._kinematics.version
+
+    def _unbind(self) -> None:
+        self._velocity = self.velocity
+        self._kinematics = None
+        self._slot = -1
+
+
+@dataclass(kw_only=True, slots=True, init=False)
+class AirFrictionComponent(KinematicComponent):
+    _air_friction: float
+
+    def __init__(self, *, _app: Simpli, _entity: AbstractEntity, air_friction: float = 0.035) -> None:
+        super(AirFrictionComponent, self).__init__(_app=_app, _entity=_entity)
+        self._air_friction = air_friction
 
     @classmethod
     def tag(cls) -> str:
         return "air_friction"
 
+    @classmethod
+    def snapshot_fields(cls) -> Tuple[str, ...]:
+        return ("air_friction",)
+
+    @property
+    def air_friction(self) -> float:
+        return self._air_friction
+
+    @air_friction.setter
+    def air_friction(self, value: float) -> None:
+        self._air_friction = value
+
+        if self._kinematics is not None:
+            self._kinematics.set_air_friction(self._slot, value)
+
+    def _unbind(self) -> None:
+        self._kinematics = None
+        self._slot = -1
+
+
+@dataclass(kw_only=True, slots=True, init=False)
+class TransformComponent(Component):
+    _local_position: Vector
+
+    def __init__(self, *, _app: Simpli, _entity: AbstractEntity, local_position: Vector = Vector.zero()) -> None:
+        self._app = _app
+        self._entity = _entity
+        self._local_position = local_position
+
+    @classmethod
+    def tag(cls) -> str:
+        return "transform"
+
+    @classmethod
+    def snapshot_fields(cls) -> Tuple[str, ...]:
+        return ("local_position",)
+
+    @property
+    def local_position(self) -> Vector:
+        return self._local_position
+
+    @local_position.setter
+    def local_position(self, value: Vector) -> None:
+        self._local_position = value
+        self._app.transforms._local_changed(self._entity, value)
+
+        entity: AbstractEntity | None = self._entity
+
+        while entity is not None:
+            self._app.shapes._entity_changed(entity)
+            entity = entity.parent
+
+    @property
+    def position(self) -> Vector:
+        return self._app.transforms.position(self._entity)
+
+    @property
+    def interpolated_position(self) -> Vector:
+        return self._app.transforms.interpolated_position(self._entity)
+
 
 @dataclass(kw_only=True, slots=True)
 class AttractionComponent(Component):
@@ -69,6 +254,12 @@ class CircleComponent(Component):
     radius: float = 50
     color: Color = Color.black()
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        super(CircleComponent, self).__setattr__(name, value)
+
+        if name == "radius" or name == "color":
+            self._app.shapes._entity_changed(self._entity)
+
     @classmethod
     def tag(cls) -> str:
         return "circle"
@@ -76,10 +267,15 @@ class CircleComponent(Component):
 
 __all__ = [
     Component,
+    AbstractComponentHolder,
     ComponentHolder,
+    ArchetypeComponentHolder,
+    Archetype,
+    ArchetypeStorage,
     PositionComponent,
     VelocityComponent,
     AirFrictionComponent,
+    TransformComponent,
     RepulsionComponent,
     ShapeComponent,
 ]
@@ -0,0 +1,110 @@
+from typing import Dict, FrozenSet, List, TYPE_CHECKING, Any, Iterable, Tuple
+
+from ._component import Component
+
+if TYPE_CHECKING:
+    from simpli.entities import AbstractEntity
+    from ._component_holder import ArchetypeComponentHolder
+else:
+    AbstractEntity = Any
+    ArchetypeComponentHolder = Any
+
+
+class Archetype:
+    __slots__ = (
+        "_signature",
+        "_holders",
+        "_entities",
+        "_columns",
+    )
+
+    def __init__(self, signature: FrozenSet[str]) -> None:
+        self._signature: FrozenSet[str] = signature
+        self._holders: List[ArchetypeComponentHolder] = []
+        self._entities: List[AbstractEntity] = []
+        self._columns: Dict[str, List[Component]] = {tag: [] for tag in signature}
+
+    @property
+    def signature(self) -> FrozenSet[str]:
+        return self._signature
+
+    @property
+    def entities(self) -> List[AbstractEntity]:
+        return self._entities
+
+    def column(self, tag: str) -> List[Component]:
+        return self._columns[tag]
+
+    def append(self, holder: ArchetypeComponentHolder, components: Dict[str, Component]) -> int:
+        self._holders.append(holder)
+        self._entities.append(holder.entity)
+
+        for tag, column in self._columns.items():
+            column.append(components[tag])
+
+        return len(self._entities) - 1
+
+    def swap_remove(self, row: int) -> Dict[str, Component]:
+        components: Dict[str, Component] = {tag: column[row] for tag, column in self._columns.items()}
+
+        for column in self._columns.values():
+            column[row] = column[-1]
+            column.pop()
+
+        self._entities[row] = self._entities[-1]
+        self._entities.pop()
+
+        self._holders[row] = self._holders[-1]
+        self._holders.pop()
+
+        if row < len(self._holders):
+            self._holders[row]._relocate(self, row)
+
+        return components
+
+    def __len__(self) -> int:
+        return len(self._entities)
+
+
+class ArchetypeStorage:
+    __slots__ = (
+        "_archetypes",
+        "_matches",
+    )
+
+    def __init__(self) -> None:
+        self._archetypes: Dict[FrozenSet[str], Archetype] = {}
+        self._matches: Dict[FrozenSet[str], Tuple[Archetype, ...]] = {}
+
+    def insert(self, holder: ArchetypeComponentHolder, components: Dict[str, Component]) -> None:
+        signature: FrozenSet[str] = frozenset(components)
+        archetype: Archetype | None = self._archetypes.get(signature)
+
+        if archetype is None:
+            archetype = Archetype(signature)
+            self._archetypes[signature] = archetype
+            self._matches.clear()
+
+        holder._relocate(archetype, archetype.append(holder, components))
+
+    def remove(self, holder: ArchetypeComponentHolder, archetype: Archetype, row: int) -> Dict[str, Component]:
+        components: Dict[str, Component] = archetype.swap_remove(row)
+        holder._relocate(None, -1)
+        return components
+
+    def matching(self, tags: Iterable[str]) -> Tuple[Archetype, ...]:
+        tags: FrozenSet[str] = frozenset(tags)
+
+        try:
+            return self._matches[tags]
+        except KeyError:
+            pass
+
+        matches: Tuple[Archetype, ...] = tuple(
+            archetype for signature, archetype in self._archetypes.items() if tags <= signature
+        )
+        self._matches[tags] = matches
+        return matches
+
+    def __iter__(self) -> Iterable[Archetype]:
+        return self._archetypes.values().__iter__()
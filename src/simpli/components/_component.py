@@ -1,6 +1,6 @@
 from abc import ABC
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+from dataclasses import dataclass, fields
+from typing import TYPE_CHECKING, Any, Tuple
 
 from simpli.interfaces import AppDependant, EntityDependant, Tagged
 
@@ -17,6 +17,10 @@ class Component(AppDependant, EntityDependant, Tagged, ABC):
     _app: Simpli
     _entity: AbstractEntity
 
+    @classmethod
+    def snapshot_fields(cls) -> Tuple[str, ...]:
+        return tuple(field.name for field in fields(cls) if not field.name.startswith("_"))
+
     @property
     def app(self) -> Simpli:
         return self._app
@@ -1,6 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import Dict, TYPE_CHECKING, Any, TypeVar, Type
+from typing import Dict, FrozenSet, TYPE_CHECKING, Any, TypeVar, Type
 
+from ._archetype import Archetype, ArchetypeStorage
 from ._component import Component
 from ..interfaces import AppDependant, EntityDependant
 
@@ -31,9 +32,15 @@ class AbstractComponentHolder(AppDependant, EntityDependant, ABC):
     def remove(self, component_type: Type[_CT]) -> None:
         raise NotImplementedError
 
+    @property
+    @abstractmethod
+    def signature(self) -> FrozenSet[str]:
+        raise NotImplementedError
+
     def __init__(self, *, app: Simpli, entity: AbstractEntity) -> None:
         self._app: Simpli = app
         self._entity: AbstractEntity = entity
+        self._attached: bool = False
 
     @property
     def app(self) -> Simpli:
@@ -49,6 +56,18 @@ class AbstractComponentHolder(AppDependant, EntityDependant, ABC):
     def has_all(self, *component_types: Type[_CT]) -> bool:
         return all(self.has(component_type) for component_type in component_types)
 
+    def _attach(self) -> None:
+        if self._attached:
+            raise ValueError("Component holder is already attached")
+
+        self._attached = True
+
+    def _detach(self) -> None:
+        if not self._attached:
+            raise ValueError("Component holder is not attached")
+
+        self._attached = False
+
 
 class ComponentHolder(AbstractComponentHolder):
     def __init__(self, *, app: Simpli, entity: AbstractEntity) -> None:
@@ -56,8 +75,12 @@ class ComponentHolder(AbstractComponentHolder):
         self._components: Dict[str, Component] = {}
 
     def add(self, component_type: Type[_CT], **kwargs: Any) -> _CT:
-        component: _CT = component_type(_app=self.app, _entity=self.entity, **kwargs)
+        component: _CT = component_type(_app=self._app, _entity=self._entity, **kwargs)
         self._components[component_type.tag()] = component
+
+        if self._attached:
+            self._app.entities._component_added(self._entity, component)
+
         return component
 
     def get(self, component_type: Type[_CT]) -> _CT:
@@ -71,6 +94,90 @@ class ComponentHolder(AbstractComponentHolder):
 
     def remove(self, component_type: Type[_CT]) -> None:
         try:
-            self._components.pop(component_type.tag())
+            component: Component = self._components.pop(component_type.tag())
+        except KeyError:
+            raise KeyError(f"Component \"{component_type.tag()}\" was not found")
+
+        if self._attached:
+            self._app.entities._component_removed(self._entity, component)
+
+    @property
+    def signature(self) -> FrozenSet[str]:
+        return frozenset(self._components)
+
+
+class ArchetypeComponentHolder(AbstractComponentHolder):
+    def __init__(self, *, app: Simpli, entity: AbstractEntity, storage: ArchetypeStorage) -> None:
+        super().__init__(app=app, entity=entity)
+        self._storage: ArchetypeStorage = storage
+        self._archetype: Archetype | None = None
+        self._row: int = -1
+        self._detached: Dict[str, Component] = {}
+
+    @property
+    def archetype(self) -> Archetype | None:
+        return self._archetype
+
+    def add(self, component_type: Type[_CT], **kwargs: Any) -> _CT:
+        component: _CT = component_type(_app=self._app, _entity=self._entity, **kwargs)
+
+        if self._archetype is None:
+            self._detached[component_type.tag()] = component
+        else:
+            components: Dict[str, Component] = self._storage.remove(self, self._archetype, self._row)
+            components[component_type.tag()] = component
+            self._storage.insert(self, components)
+
+        if self._attached:
+            self._app.entities._component_added(self._entity, component)
+
+        return component
+
+    def get(self, component_type: Type[_CT]) -> _CT:
+        try:
+            if self._archetype is None:
+                return self._detached[component_type.tag()]
+
+            return self._archetype.column(component_type.tag())[self._row]
         except KeyError:
             raise KeyError(f"Component \"{component_type.tag()}\" was not found")
+
+    def has(self, component_type: Type[_CT]) -> bool:
+        if self._archetype is None:
+            return component_type.tag() in self._detached
+
+        return component_type.tag() in self._archetype.signature
+
+    def remove(self, component_type: Type[_CT]) -> None:
+        if not self.has(component_type):
+            raise KeyError(f"Component \"{component_type.tag()}\" was not found")
+
+        if self._archetype is None:
+            component: Component = self._detached.pop(component_type.tag())
+        else:
+            components: Dict[str, Component] = self._storage.remove(self, self._archetype, self._row)
+            component: Component = components.pop(component_type.tag())
+            self._storage.insert(self, components)
+
+        if self._attached:
+            self._app.entities._component_removed(self._entity, component)
+
+    @property
+    def signature(self) -> FrozenSet[str]:
+        if self._archetype is None:
+            return frozenset(self._detached)
+
+        return self._archetype.signature
+
+    def _attach(self) -> None:
+        super()._attach()
+        self._storage.insert(self, self._detached)
+        self._detached = {}
+
+    def _detach(self) -> None:
+        super()._detach()
+        self._detached = self._storage.remove(self, self._archetype, self._row)
+
+    def _relocate(self, archetype: Archetype | None, row: int) -> None:
+        self._archetype = archetype
+        self._row = row
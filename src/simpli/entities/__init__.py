@@ -1,12 +1,15 @@
-from typing import TYPE_CHECKING, Any, Sequence, Tuple, Type, Dict
+from random import Random
+from typing import TYPE_CHECKING, Any, Sequence, Tuple, Type, Dict, List
 
 from simpli.components import Component, PositionComponent, CircleComponent, ShapeComponent, VelocityComponent, \
-    AirFrictionComponent, RepulsionComponent, AttractionComponent
+    AirFrictionComponent, RepulsionComponent, AttractionComponent, TransformComponent
 from simpli.enums import LayerGroup
-from simpli.shapes import Circle, BackgroundRectangle
-from simpli.utils import Vector, Color, Value
+from simpli.shapes import BackgroundRectangle
+from simpli.utils import Vector, Color, FieldBinding
 from ._entity import AbstractEntity, Entity
-from ._entity_holder import AbstractEntityHolder, EntityHolder
+from ._entity_holder import AbstractEntityHolder, EntityHolder, ArchetypeEntityHolder
+from ._command_buffer import AbstractCommandBuffer, CommandBuffer
+from ._transform_hierarchy import AbstractTransformHierarchy, TransformHierarchy
 
 if TYPE_CHECKING:
     from simpli import Simpli
@@ -32,40 +35,100 @@ class CircleEntity(Entity):
             parent=parent,
             components=[
                 (PositionComponent, {"position": position or Vector.zero()}),
-                (CircleComponent, {"radius": radius or 50, "color": color or Color.random()}),
+                (CircleComponent, {"radius": radius or 50, "color": color or Color.random(app.rng("colors"))}),
                 *(components or []),
             ],
         )
 
-        self.set_child(
-            app.entities.new(
-                name="main_circle",
-                components=[
-                    (ShapeComponent, {"shape": app.shapes.new(
-                        Circle,
-                        position=Value(lambda: self.components.get(PositionComponent).position),
-                        radius=Value(lambda: self.components.get(CircleComponent).radius),
-                        color=Value(lambda: self.components.get(CircleComponent).color),
-                    )})
-                ],
-            ),
+        main_circle: AbstractEntity = self.set_child(app.entities.new(
+            name="main_circle",
+            components=[(TransformComponent, {})],
+        ))
+        main_circle.components.add(ShapeComponent, shape=app.shapes.new(
+            app.circle_shape_type,
+            watch=self,
+            position=FieldBinding(main_circle, TransformComponent, "interpolated_position"),
+            radius=FieldBinding(self, CircleComponent, "radius"),
+            color=FieldBinding(self, CircleComponent, "color"),
+        ))
+
+        shadow_circle: AbstractEntity = self.set_child(app.entities.new(
+            name="shadow_circle",
+            components=[(TransformComponent, {"local_position": Vector(5, -5)})],
+        ))
+        shadow_circle.components.add(ShapeComponent, shape=app.shapes.new(
+            app.circle_shape_type,
+            watch=self,
+            layer_group=LayerGroup.SHADOW,
+            position=FieldBinding(shadow_circle, TransformComponent, "interpolated_position"),
+            radius=FieldBinding(self, CircleComponent, "radius"),
+            color=Color.shadow(),
+        ))
+
+    @classmethod
+    def _new_many(cls, app: Simpli, count: int, columns: Dict[str, Sequence[Any]]) -> List[AbstractEntity]:
+        if cls.__init__ is not CircleEntity.__init__:
+            return super()._new_many(app, count, columns)
+
+        components: Sequence[Any] = columns.pop("components", None) or [None] * count
+        circles: List[CircleEntity] = cls._new_circles(app, count, columns)
+
+        for circle, extra in zip(circles, components):
+            for component_type, kwargs in extra or []:
+                circle.components.add(component_type, **kwargs)
+
+            app.entities._register(circle)
+
+        return circles
+
+    @classmethod
+    def _new_circles(cls, app: Simpli, count: int, columns: Dict[str, Sequence[Any]]) -> List['CircleEntity']:
+        positions, radii, colors, names, parents = (
+            columns.pop(key, None) or [None] * count for key in ("position", "radius", "color", "name", "parent")
         )
 
-        self.set_child(
-            app.entities.new(
+        if columns:
+            raise TypeError(f"{cls.__name__}() got an unexpected keyword argument '{next(iter(columns))}'")
+
+        app.entities._reserve(3 * count)
+        rng: Random = app.rng("colors")
+        circles: List[CircleEntity] = []
+        children: List[Entity] = []
+
+        for position, radius, color, name, parent in zip(positions, radii, colors, names, parents):
+            circle: CircleEntity = cls.__new__(cls)
+            Entity.__init__(circle, app=app, name=name, parent=parent, components=[
+                (PositionComponent, {"position": position or Vector.zero()}),
+                (CircleComponent, {"radius": radius or 50, "color": color or Color.random(rng)}),
+            ])
+            circles.append(circle)
+            children.append(Entity(app=app, name="main_circle", components=[(TransformComponent, {})]))
+            children.append(Entity(
+                app=app,
                 name="shadow_circle",
-                components=[
-                    (ShapeComponent, {"shape": app.shapes.new(
-                        Circle,
-                        layer_group=LayerGroup.SHADOW,
-                        position=Value(lambda: self.components.get(PositionComponent).position + Vector(5, -5)),
-                        radius=Value(lambda: self.components.get(CircleComponent).radius),
-                        color=Color.shadow(),
-                    )})
-                ],
-            ),
+                components=[(TransformComponent, {"local_position": Vector(5, -5)})],
+            ))
+
+        shadow: Color = Color.shadow()
+        shapes: List[Any] = app.shapes.new_many(
+            app.circle_shape_type,
+            2 * count,
+            watch=[circle for circle in circles for _ in range(2)],
+            layer_group=[LayerGroup.GEOMETRY, LayerGroup.SHADOW] * count,
+            position=[FieldBinding(child, TransformComponent, "interpolated_position") for child in children],
+            radius=[FieldBinding(circle, CircleComponent, "radius") for circle in circles for _ in range(2)],
+            color=[
+                value for circle in circles for value in (FieldBinding(circle, CircleComponent, "color"), shadow)
+            ],
         )
 
+        for index, (child, shape) in enumerate(zip(children, shapes)):
+            child.components.add(ShapeComponent, shape=shape)
+            app.entities._register(child)
+            circles[index // 2].set_child(child)
+
+        return circles
+
 
 class CellEntity(CircleEntity):
     def __init__(
@@ -92,20 +155,52 @@ class CellEntity(CircleEntity):
             components=[
                 (VelocityComponent, {"velocity": initial_velocity or Vector.zero()}),
                 (AirFrictionComponent, {}),
-                (AttractionComponent, {
-                    "strength": attraction_strength or 0.25,
-                    "range": Value(lambda: self.components.get(CircleComponent).radius * 10),
-                    "power_factor": 0.25,
-                }),
-                (RepulsionComponent, {
-                    "strength": repulsion_strength or 2,
-                    "range": Value(lambda: self.components.get(CircleComponent).radius * 2.5),
-                    "power_factor": 1.25,
-                }),
-                *(components or []),
             ],
         )
 
+        self._add_interactions(attraction_strength, repulsion_strength, components)
+
+    @classmethod
+    def _new_many(cls, app: Simpli, count: int, columns: Dict[str, Sequence[Any]]) -> List[AbstractEntity]:
+        if cls.__init__ is not CellEntity.__init__:
+            return super()._new_many(app, count, columns)
+
+        velocities, attractions, repulsions, components = (
+            columns.pop(key, None) or [None] * count
+            for key in ("initial_velocity", "attraction_strength", "repulsion_strength", "components")
+        )
+        cells: List[CellEntity] = cls._new_circles(app, count, columns)
+
+        for cell, velocity, attraction, repulsion, extra in zip(cells, velocities, attractions, repulsions, components):
+            cell.components.add(VelocityComponent, velocity=velocity or Vector.zero())
+            cell.components.add(AirFrictionComponent)
+            cell._add_interactions(attraction, repulsion, extra)
+            app.entities._register(cell)
+
+        return cells
+
+    def _add_interactions(
+            self,
+            attraction_strength: float | None,
+            repulsion_strength: float | None,
+            components: Sequence[Tuple[Type[Component], Dict[str, Any]]] | None,
+    ) -> None:
+        self.components.add(
+            AttractionComponent,
+            strength=attraction_strength or 0.25,
+            range=FieldBinding(self, CircleComponent, "radius", scale=10),
+            power_factor=0.25,
+        )
+        self.components.add(
+            RepulsionComponent,
+            strength=repulsion_strength or 2,
+            range=FieldBinding(self, CircleComponent, "radius", scale=2.5),
+            power_factor=1.25,
+        )
+
+        for component_type, kwargs in components or []:
+            self.components.add(component_type, **kwargs)
+
 
 class BackgroundEntity(Entity):
     def __init__(self, *, app: Simpli) -> None:
@@ -125,4 +220,9 @@ __all__ = [
     Entity,
     AbstractEntityHolder,
     EntityHolder,
+    ArchetypeEntityHolder,
+    AbstractCommandBuffer,
+    CommandBuffer,
+    AbstractTransformHierarchy,
+    TransformHierarchy,
 ]
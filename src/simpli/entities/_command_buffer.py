@@ -0,0 +1,116 @@
+from abc import ABC, abstractmethod
+from threading import Lock
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Type, TypeVar
+
+from simpli.components import Component
+from simpli.entities import AbstractEntity
+from simpli.interfaces import AppDependant
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+else:
+    Simpli = Any
+
+_CT = TypeVar("_CT", bound=Component)
+_AET = TypeVar("_AET", bound=AbstractEntity)
+
+
+class AbstractCommandBuffer(AppDependant, ABC):
+    @abstractmethod
+    def spawn(self, entity_type: Type[_AET] | None = None, *args: Any, **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def destroy(self, entity: AbstractEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def add_component(self, entity: AbstractEntity, component_type: Type[_CT], **kwargs: Any) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def remove_component(self, entity: AbstractEntity, component_type: Type[_CT]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def apply(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __init__(self, *, app: Simpli) -> None:
+        self._app: Simpli = app
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+
+class CommandBuffer(AbstractCommandBuffer):
+    def __init__(self, *, app: Simpli) -> None:
+        super().__init__(app=app)
+        self._spawns: List[Tuple[Type[AbstractEntity] | None, Tuple[Any, ...], Dict[str, Any]]] = []
+        self._additions: List[Tuple[AbstractEntity, Type[Component], Dict[str, Any]]] = []
+        self._removals: List[Tuple[AbstractEntity, Type[Component]]] = []
+        self._destructions: Dict[int, AbstractEntity] = {}
+        self._lock: Lock = Lock()
+
+    def spawn(self, entity_type: Type[_AET] | None = None, *args: Any, **kwargs: Any) -> None:
+        with self._lock:
+            self._spawns.append((entity_type, args, kwargs))
+
+    def destroy(self, entity: AbstractEntity) -> None:
+        with self._lock:
+            self._destructions[entity.identifier] = entity
+
+    def add_component(self, entity: AbstractEntity, component_type: Type[_CT], **kwargs: Any) -> None:
+        with self._lock:
+            self._additions.append((entity, component_type, kwargs))
+
+    def remove_component(self, entity: AbstractEntity, component_type: Type[_CT]) -> None:
+        with self._lock:
+            self._removals.append((entity, component_type))
+
+    def apply(self) -> None:
+        if len(self) > 0:
+            self.app.entities.defer(self._apply)
+
+    def __len__(self) -> int:
+        return len(self._spawns) + len(self._additions) + len(self._removals) + len(self._destructions)
+
+    def _apply(self) -> None:
+        while len(self) > 0:
+            with self._lock:
+                spawns, self._spawns = self._spawns, []
+                additions, self._additions = self._additions, []
+                removals, self._removals = self._removals, []
+                destructions, self._destructions = self._destructions, {}
+
+            for entity_type, args, kwargs in spawns:
+                self.app.entities.new(entity_type, *args, **kwargs)
+
+            for entity, component_type, kwargs in additions:
+                if self._alive(entity) and entity.identifier not in destructions:
+                    entity.components.add(component_type, **kwargs)
+
+            for entity, component_type in removals:
+                if (
+                        self._alive(entity)
+                        and entity.identifier not in destructions
+                        and entity.components.has(component_type)
+                ):
+                    entity.components.remove(component_type)
+
+            self.app.entities.remove_many(sorted(
+                identifier
+                for identifier, entity in destructions.items()
+                if self._alive(entity)
+            ))
+
+    def _alive(self, entity: AbstractEntity) -> bool:
+        try:
+            return self.app.entities[entity.identifier] is entity
+        except KeyError:
+            return False
@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any, TypeVar, Iterable, Optional, Sequence, Tuple, Type, Dict
+from typing import TYPE_CHECKING, Any, TypeVar, Iterable, Optional, Sequence, Tuple, Type, Dict, List
 
-from simpli.components import AbstractComponentHolder, ComponentHolder
+from simpli.components import AbstractComponentHolder
 from simpli.components import Component
 from simpli.interfaces import AppDependant, Identifiable
 from simpli.utils import AbstractIdentifierHolder, IdentifierHolder
@@ -55,6 +55,20 @@ class AbstractEntity(AppDependant, Identifiable, ABC):
         self._app: Simpli = app
         self._identifier: int | None = None
 
+    @classmethod
+    def _new_many(cls, app: Simpli, count: int, columns: Dict[str, Sequence[Any]]) -> List['AbstractEntity']:
+        rows: List[Dict[str, Any]] = [dict(zip(columns, row)) for row in zip(*columns.values())] if columns \
+            else [{} for _ in range(count)]
+
+        registered: int = len(app.entities)
+        entities: List[AbstractEntity] = [app.entities.new(cls, **rows[0])]
+        app.entities._reserve((len(app.entities) - registered) * (count - 1))
+
+        for row in rows[1:]:
+            entities.append(app.entities.new(cls, **row))
+
+        return entities
+
     @property
     def app(self) -> Simpli:
         return self._app
@@ -92,8 +106,8 @@ class Entity(AbstractEntity):
 
         self._name: str | None = name
         self._parent: AbstractEntity | None = parent
-        self._children: AbstractIdentifierHolder = IdentifierHolder()
-        self._components: AbstractComponentHolder = ComponentHolder(app=app, entity=self)
+        self._children: AbstractIdentifierHolder | None = None
+        self._components: AbstractComponentHolder = app.entities.new_component_holder(self)
 
         if components:
             for component_type, kwargs in components:
@@ -109,6 +123,9 @@ class Entity(AbstractEntity):
 
     @property
     def children(self) -> Iterable[AbstractEntity]:
+        if self._children is None:
+            return iter(())
+
         return map(self.app.entities.__getitem__, self._children.__iter__())
 
     @property
@@ -117,23 +134,27 @@ class Entity(AbstractEntity):
 
     def _set_parent(self, parent: AbstractEntity | None) -> None:
         self._parent = parent
+        self.app.transforms._parent_changed(self)
 
     def set_child(self, child: _AET) -> _AET:
-        if child.identifier in self._children:
+        if self.has_child(child.identifier):
             raise ValueError(f"Entity {child.identifier} is already a child of {self.identifier}")
 
         if child.parent is not None:
             child.parent.remove_child(child.identifier)
 
+        if self._children is None:
+            self._children = IdentifierHolder()
+
         self._children.add(child.identifier)
         child._set_parent(self)
         return child
 
     def has_child(self, identifier) -> bool:
-        return identifier in self._children
+        return self._children is not None and identifier in self._children
 
     def remove_child(self, identifier: int) -> AbstractEntity:
-        if identifier not in self._children:
+        if not self.has_child(identifier):
             raise KeyError(f"Entity {identifier} is not a child of {self.identifier}")
 
         self._children.remove(identifier)
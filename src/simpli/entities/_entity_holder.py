@@ -1,10 +1,15 @@
 from abc import ABC, abstractmethod
-from typing import Type, TYPE_CHECKING, Any, Iterable, TypeVar, overload
+from contextlib import contextmanager
+from itertools import starmap
+from threading import RLock
+from typing import Type, TYPE_CHECKING, Any, Iterable, TypeVar, overload, Tuple, Dict, FrozenSet, Callable, List, \
+    Sequence, Iterator
 
-from simpli.components import Component, PositionComponent
+from simpli.components import Component, PositionComponent, ShapeComponent, AbstractComponentHolder, \
+    ComponentHolder, ArchetypeComponentHolder, ArchetypeStorage
 from simpli.entities import Entity, AbstractEntity
 from simpli.interfaces import AppDependant
-from simpli.utils import Holder, Vector
+from simpli.utils import Holder, Vector, AbstractSpatialIndex, SpatialHash
 
 if TYPE_CHECKING:
     from simpli import Simpli
@@ -55,6 +60,28 @@ class AbstractEntityHolder(AppDependant, ABC):
     def nearby(self, position: Vector, radius: float, *component_types: Type[_CT]) -> Iterable[AbstractEntity]:
         raise NotImplementedError
 
+    @abstractmethod
+    def observe(
+            self,
+            component_types: Sequence[Type[_CT]],
+            on_enter: Callable[[AbstractEntity], None],
+            on_exit: Callable[[AbstractEntity], None],
+            on_enter_many: Callable[[List[AbstractEntity]], None] | None = None,
+    ) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _register(self, entity: AbstractEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _component_added(self, entity: AbstractEntity, component: Component) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _component_removed(self, entity: AbstractEntity, component: Component) -> None:
+        raise NotImplementedError
+
     def __init__(self, *, app: Simpli) -> None:
         self._app: Simpli = app
 
@@ -62,31 +89,174 @@ class AbstractEntityHolder(AppDependant, ABC):
     def app(self) -> Simpli:
         return self._app
 
+    def remove_many(self, identifiers: Iterable[int]) -> List[AbstractEntity]:
+        entities: List[AbstractEntity] = [self[identifier] for identifier in identifiers]
+
+        for entity in entities:
+            self.remove(entity.identifier)
+
+        return entities
+
+    def defer(self, operation: Callable[[], None]) -> None:
+        operation()
+
+    def new_component_holder(self, entity: AbstractEntity) -> AbstractComponentHolder:
+        return ComponentHolder(app=self.app, entity=entity)
+
+    def query(self, *component_types: Type[_CT]) -> Iterable[Tuple[Component, ...]]:
+        for entity in self.by_components(*component_types):
+            components: AbstractComponentHolder = entity.components
+            yield tuple(components.get(component_type) for component_type in component_types)
+
+    def new_many(self, entity_type: Type[_AET] | None, count: int, **columns: Any) -> List[_AET]:
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        values: Dict[str, Sequence[Any]] = self._columns(count, columns)
+
+        if count == 0:
+            return []
+
+        with self.app.shapes.deferred(), self._batched():
+            return (entity_type or Entity)._new_many(self.app, count, values)
+
+    @staticmethod
+    def _columns(count: int, columns: Dict[str, Any]) -> Dict[str, Sequence[Any]]:
+        values: Dict[str, Sequence[Any]] = {}
+
+        for name, column in columns.items():
+            if hasattr(column, "to_vectors"):
+                column = column.to_vectors()
+            elif getattr(column, "ndim", 0) > 0:
+                column = list(starmap(Vector, column.tolist())) if column.ndim == 2 else column.tolist()
+            elif not isinstance(column, (list, tuple, range)):
+                column = [column] * count
+
+            if len(column) != count:
+                raise ValueError(f"Column \"{name}\" has {len(column)} values, expected {count}")
+
+            values[name] = column
+
+        return values
+
+    def _reserve(self, count: int) -> None:
+        pass
+
+    @contextmanager
+    def _batched(self) -> Iterator[None]:
+        yield
+
+    def _position_changed(self, entity: AbstractEntity, position: Vector) -> None:
+        pass
+
+    def _positions_invalidated(self) -> None:
+        pass
+
 
 class EntityHolder(AbstractEntityHolder):
-    def __init__(self, *, app: Simpli) -> None:
+    def __init__(
+            self,
+            *,
+            app: Simpli,
+            spatial_hash_enabled: bool = True,
+            spatial_cell_size: float | None = None,
+    ) -> None:
         super().__init__(app=app)
         self._entities: Holder[Entity] = Holder[Entity]()
 
+        self._spatial_cell_size: float | None = spatial_cell_size
+        self._spatial_hash: AbstractSpatialIndex | None = None
+        self._spatial_hash_stale: bool = False
+
+        self._queries: Dict[FrozenSet[str], Tuple[Tuple[Type[Component], ...], Dict[int, Entity]]] = {}
+        self._observers: Dict[FrozenSet[str], List[Tuple[
+            Callable[[Entity], None],
+            Callable[[Entity], None],
+            Callable[[List[Entity]], None] | None,
+        ]]] = {}
+        self._batch: Dict[int, Entity] | None = None
+        self._lock: RLock = RLock()
+        self._query_cache_hits: int = 0
+        self._query_cache_misses: int = 0
+
+        if spatial_hash_enabled:
+            self.spatial_hash_enabled = True
+
+    @property
+    def query_cache_hits(self) -> int:
+        return self._query_cache_hits
+
+    @property
+    def query_cache_misses(self) -> int:
+        return self._query_cache_misses
+
+    @property
+    def spatial_hash_enabled(self) -> bool:
+        return self._spatial_hash is not None
+
+    @spatial_hash_enabled.setter
+    def spatial_hash_enabled(self, value: bool) -> None:
+        if value == self.spatial_hash_enabled:
+            return
+
+        if not value:
+            self._spatial_hash = None
+            return
+
+        self._spatial_hash = SpatialHash(self._spatial_cell_size or 50)
+
+        for entity in self.by_components(PositionComponent):
+            self._spatial_hash.insert(entity.identifier, entity.components.get(PositionComponent).position)
+
+    @property
+    def spatial_cell_size(self) -> float | None:
+        return self._spatial_cell_size
+
+    @spatial_cell_size.setter
+    def spatial_cell_size(self, value: float | None) -> None:
+        self._spatial_cell_size = value
+
+        if value is not None and self._spatial_hash is not None:
+            self._spatial_hash.cell_size = value
+
     def new(self, entity_type: Type[_ET] | None = None, *args: Any, **kwargs: Any) -> _ET:
         if entity_type is None:
             entity_type = Entity
 
         entity: _ET = entity_type(app=self.app, *args, **kwargs)
-        self._entities.add(entity)
-
+        self._register(entity)
         return entity
 
     def remove(self, identifier: int) -> Entity:
         entity: Entity = self[identifier]
+        self.remove_many((identifier,))
+        return entity
+
+    def remove_many(self, identifiers: Iterable[int]) -> List[Entity]:
+        removed: Dict[int, Entity] = {}
+        pending: List[Entity] = [self[identifier] for identifier in identifiers]
+
+        while pending:
+            entity: Entity = pending.pop()
+
+            if entity.identifier not in removed:
+                removed[entity.identifier] = entity
+                pending.extend(entity.children)
+
+        entities: List[Entity] = list(removed.values())
 
-        for child in entity.children:
-            self.remove(child.identifier)
+        for entity in reversed(entities):
+            self._release(entity)
 
-        if entity.parent is not None:
-            entity.parent.remove_child(entity.identifier)
+        self._entities.remove_many(removed)
 
-        return self._entities.remove(identifier)
+        for entity in entities:
+            entity.components._detach()
+
+        return entities
+
+    def defer(self, operation: Callable[[], None]) -> None:
+        self._entities.defer(operation)
 
     def __getitem__(self, identifier: int) -> Entity:
         try:
@@ -104,11 +274,244 @@ class EntityHolder(AbstractEntityHolder):
         return self._entities.__iter__()
 
     def by_components(self, *component_types: Type[_CT]) -> Iterable[Entity]:
-        for entity in self._entities:
-            if entity.components.has_all(*component_types):
-                yield entity
+        signature: FrozenSet[str] = frozenset(component_type.tag() for component_type in component_types)
+
+        with self._lock:
+            try:
+                _, matches = self._queries[signature]
+            except KeyError:
+                self._query_cache_misses += 1
+
+                matches: Dict[int, Entity] = {
+                    entity.identifier: entity
+                    for entity in self._entities
+                    if entity.components.has_all(*component_types)
+                }
+                self._queries[signature] = (component_types, matches)
+            else:
+                self._query_cache_hits += 1
+
+            return tuple(matches.values()).__iter__()
 
     def nearby(self, position: Vector, radius: float, *component_types: Type[_CT]) -> Iterable[Entity]:
-        for entity in self.by_components(PositionComponent, *component_types):
-            if (entity.components.get(PositionComponent).position - position).length < radius:
+        if self._spatial_hash is None:
+            for entity in self.by_components(PositionComponent, *component_types):
+                if (entity.components.get(PositionComponent).position - position).length < radius:
+                    yield entity
+
+            return
+
+        radius: float = radius.real
+
+        with self._lock:
+            if self._spatial_cell_size is None and radius > self._spatial_hash.cell_size:
+                self._spatial_hash.cell_size = radius
+
+            if self._spatial_hash_stale:
+                self._spatial_hash_stale = False
+
+                for entity in self.by_components(PositionComponent):
+                    self._spatial_hash.move(entity.identifier, entity.components.get(PositionComponent).position)
+
+            identifiers: List[int] = self._spatial_hash.query(position, radius)
+
+        for identifier in identifiers:
+            entity: Entity = self._entities[identifier]
+
+            if entity.components.has_all(*component_types):
                 yield entity
+
+    def observe(
+            self,
+            component_types: Sequence[Type[_CT]],
+            on_enter: Callable[[Entity], None],
+            on_exit: Callable[[Entity], None],
+            on_enter_many: Callable[[List[Entity]], None] | None = None,
+    ) -> None:
+        signature: FrozenSet[str] = frozenset(component_type.tag() for component_type in component_types)
+        matches: Iterable[Entity] = EntityHolder.by_components(self, *component_types)
+
+        self._observers.setdefault(signature, []).append((on_enter, on_exit, on_enter_many))
+
+        for entity in matches:
+            on_enter(entity)
+
+    def _register(self, entity: Entity) -> None:
+        self._entities.add(entity)
+        entity.components._attach()
+
+        if self._batch is not None:
+            self._batch[entity.identifier] = entity
+            return
+
+        with self._lock:
+            if self._spatial_hash is not None and entity.components.has(PositionComponent):
+                self._spatial_hash.insert(entity.identifier, entity.components.get(PositionComponent).position)
+
+            for signature, (component_types, matches) in tuple(self._queries.items()):
+                if entity.components.has_all(*component_types):
+                    self._set_match(signature, matches, entity, True)
+
+    def _reserve(self, count: int) -> None:
+        self._entities.reserve(count)
+
+    @contextmanager
+    def _batched(self) -> Iterator[None]:
+        if self._batch is not None:
+            yield
+            return
+
+        self._batch = {}
+
+        try:
+            yield
+        finally:
+            entities: List[Entity] = list(self._batch.values())
+            self._batch = None
+
+            with self._lock:
+                self._register_many(entities)
+
+    def _register_many(self, entities: List[Entity]) -> None:
+        signatures: List[FrozenSet[str]] = [entity.components.signature for entity in entities]
+
+        if self._spatial_hash is not None:
+            position: str = PositionComponent.tag()
+
+            for entity, components in zip(entities, signatures):
+                if position in components:
+                    self._spatial_hash.insert(entity.identifier, entity.components.get(PositionComponent).position)
+
+        for signature, (_, matches) in tuple(self._queries.items()):
+            matched: Dict[FrozenSet[str], bool] = {components: signature <= components for components in set(signatures)}
+            entering: List[Entity] = [
+                entity for entity, components in zip(entities, signatures) if matched[components]
+            ]
+
+            if not entering:
+                continue
+
+            matches.update((entity.identifier, entity) for entity in entering)
+
+            for on_enter, _, on_enter_many in self._observers.get(signature, ()):
+                if on_enter_many is not None:
+                    on_enter_many(entering)
+                    continue
+
+                for entity in entering:
+                    on_enter(entity)
+
+    def _component_added(self, entity: Entity, component: Component) -> None:
+        if self._batching(entity):
+            return
+
+        with self._lock:
+            if self._spatial_hash is not None and isinstance(component, PositionComponent):
+                self._spatial_hash.insert(entity.identifier, component.position)
+
+            self._refresh_queries(entity, component.tag())
+
+    def _component_removed(self, entity: Entity, component: Component) -> None:
+        if self._batching(entity):
+            return
+
+        with self._lock:
+            if self._spatial_hash is not None and isinstance(component, PositionComponent):
+                self._spatial_hash.discard(entity.identifier)
+
+            self._refresh_queries(entity, component.tag())
+
+    def _position_changed(self, entity: Entity, position: Vector) -> None:
+        if self._spatial_hash is None:
+            return
+
+        try:
+            identifier: int = entity.identifier
+        except ValueError:
+            return
+
+        with self._lock:
+            if identifier in self._spatial_hash:
+                self._spatial_hash.move(identifier, position)
+
+    def _positions_invalidated(self) -> None:
+        self._spatial_hash_stale = self._spatial_hash is not None
+
+    def _refresh_queries(self, entity: Entity, tag: str) -> None:
+        for signature, (component_types, matches) in tuple(self._queries.items()):
+            if tag not in signature:
+                continue
+
+            self._set_match(signature, matches, entity, entity.components.has_all(*component_types))
+
+    def _set_match(self, signature: FrozenSet[str], matches: Dict[int, Entity], entity: Entity, matched: bool) -> None:
+        if matched == (entity.identifier in matches):
+            return
+
+        if matched:
+            matches[entity.identifier] = entity
+        else:
+            del matches[entity.identifier]
+
+        for on_enter, on_exit, _ in self._observers.get(signature, ()):
+            if matched:
+                on_enter(entity)
+            else:
+                on_exit(entity)
+
+    def _release(self, entity: Entity) -> None:
+        identifier: int = entity.identifier
+
+        if self._batching(entity):
+            del self._batch[identifier]
+
+        if entity.parent is not None and entity.parent.has_child(identifier):
+            entity.parent.remove_child(identifier)
+
+        with self._lock:
+            if self._spatial_hash is not None:
+                self._spatial_hash.discard(identifier)
+
+            for signature, (_, matches) in tuple(self._queries.items()):
+                self._set_match(signature, matches, entity, False)
+
+        if entity.components.has(ShapeComponent):
+            self.app.shapes.remove(entity.components.get(ShapeComponent).shape.identifier)
+
+        self.app.shapes._entity_removed(entity)
+
+    def _batching(self, entity: Entity) -> bool:
+        return self._batch is not None and entity.identifier in self._batch
+
+
+class ArchetypeEntityHolder(EntityHolder):
+    def __init__(
+            self,
+            *,
+            app: Simpli,
+            spatial_hash_enabled: bool = True,
+            spatial_cell_size: float | None = None,
+    ) -> None:
+        self._storage: ArchetypeStorage = ArchetypeStorage()
+        super().__init__(app=app, spatial_hash_enabled=spatial_hash_enabled, spatial_cell_size=spatial_cell_size)
+
+    @property
+    def storage(self) -> ArchetypeStorage:
+        return self._storage
+
+    def new_component_holder(self, entity: Entity) -> ArchetypeComponentHolder:
+        return ArchetypeComponentHolder(app=self.app, entity=entity, storage=self._storage)
+
+    def by_components(self, *component_types: Type[_CT]) -> Iterable[Entity]:
+        for archetype in self._storage.matching(component_type.tag() for component_type in component_types):
+            yield from tuple(archetype.entities)
+
+    def query(self, *component_types: Type[_CT]) -> Iterable[Tuple[Component, ...]]:
+        tags: Tuple[str, ...] = tuple(component_type.tag() for component_type in component_types)
+
+        for archetype in self._storage.matching(tags):
+            if not tags:
+                yield from (() for _ in tuple(archetype.entities))
+                continue
+
+            yield from zip(*(tuple(archetype.column(tag)) for tag in tags))
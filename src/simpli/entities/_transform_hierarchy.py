@@ -0,0 +1,292 @@
+from abc import ABC, abstractmethod
+from itertools import groupby
+from threading import RLock
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from simpli.components import PositionComponent, TransformComponent
+from simpli.entities import AbstractEntity
+from simpli.interfaces import AppDependant
+from simpli.utils import Vector
+
+if TYPE_CHECKING:
+    import numpy as np
+    from simpli import Simpli
+    from simpli.physics import Kinematics
+else:
+    Simpli = Any
+    Kinematics = Any
+
+
+class AbstractTransformHierarchy(AppDependant, ABC):
+    @abstractmethod
+    def position(self, entity: AbstractEntity) -> Vector:
+        raise NotImplementedError
+
+    @abstractmethod
+    def interpolated_position(self, entity: AbstractEntity) -> Vector:
+        raise NotImplementedError
+
+    @abstractmethod
+    def propagate(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _local_changed(self, entity: AbstractEntity, value: Vector) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _parent_changed(self, entity: AbstractEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _anchor_moved(self, entity: AbstractEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+    def __init__(self, *, app: Simpli) -> None:
+        self._app: Simpli = app
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+
+class TransformHierarchy(AbstractTransformHierarchy):
+    def __init__(self, *, app: Simpli) -> None:
+        super().__init__(app=app)
+        self._members: Dict[AbstractEntity, TransformComponent] = {}
+        self._stale: bool = True
+        self._stale_reads: int = 0
+        self._epoch: int = -1
+        self._lock: RLock = RLock()
+
+        self._rows: Dict[AbstractEntity, int] = {}
+        self._parents: List[int] = []
+        self._anchors: List[AbstractEntity | None] = []
+        self._anchor_indices: List[int] = []
+        self._levels: List[Tuple[int, int]] = []
+        self._locals: List[Vector] | np.ndarray = []
+        self._positions: List[Vector] | List[List[float]] = []
+        self._interpolated_positions: List[Vector] | List[List[float]] = []
+
+        try:
+            import numpy
+        except ImportError:
+            numpy = None
+
+        self._numpy: Any = numpy
+
+        app.entities.observe((TransformComponent,), self._insert, self._discard)
+
+    def position(self, entity: AbstractEntity) -> Vector:
+        return self._read(entity, interpolated=False)
+
+    def interpolated_position(self, entity: AbstractEntity) -> Vector:
+        return self._read(entity, interpolated=True)
+
+    def propagate(self) -> None:
+        with self._lock:
+            if self._stale:
+                self._rebuild()
+
+            self._epoch = self.app.epoch
+
+            if not self._rows:
+                return
+
+            if self._numpy is None:
+                self._propagate_vectors()
+            else:
+                self._propagate_arrays()
+
+    def __len__(self) -> int:
+        return len(self._members)
+
+    def _local_changed(self, entity: AbstractEntity, value: Vector) -> None:
+        row: int | None = self._rows.get(entity)
+
+        if row is not None and not self._stale:
+            self._locals[row] = value.as_tuple if self._numpy is not None else value
+
+        self._epoch = -1
+
+    def _parent_changed(self, entity: AbstractEntity) -> None:
+        if entity in self._members:
+            self._stale = True
+            self._epoch = -1
+
+    def _anchor_moved(self, entity: AbstractEntity) -> None:
+        self._epoch = -1
+
+    def _insert(self, entity: AbstractEntity) -> None:
+        self._members[entity] = entity.components.get(TransformComponent)
+        self._stale = True
+        self._epoch = -1
+
+    def _discard(self, entity: AbstractEntity) -> None:
+        del self._members[entity]
+        self._stale = True
+        self._epoch = -1
+
+    def _read(self, entity: AbstractEntity, *, interpolated: bool) -> Vector:
+        if entity not in self._members:
+            return self._walk(entity, interpolated=interpolated)
+
+        with self._lock:
+            if self._stale and self._stale_reads < len(self._members):
+                self._stale_reads += 1
+                return self._walk(entity, interpolated=interpolated)
+
+            if self._epoch != self.app.epoch or self._stale:
+                self.propagate()
+
+            try:
+                row: int = self._rows[entity]
+            except KeyError:
+                raise KeyError(f"Entity {entity.identifier} has no transform")
+
+            values: List[Vector] | List[List[float]] = (
+                self._interpolated_positions if interpolated else self._positions
+            )
+
+        if self._numpy is None:
+            return values[row]
+
+        return Vector(*values[row])
+
+    def _rebuild(self) -> None:
+        depths: Dict[AbstractEntity, int] = {}
+
+        for entity in self._members:
+            self._depth(entity, depths)
+
+        order: List[AbstractEntity] = sorted(self._members, key=depths.__getitem__)
+        anchors: Dict[AbstractEntity | None, int] = {}
+
+        self._rows = {entity: row for row, entity in enumerate(order)}
+        self._parents = []
+        self._anchor_indices = []
+
+        for entity in order:
+            parent: AbstractEntity | None = entity.parent
+
+            if parent in self._members:
+                self._parents.append(self._rows[parent])
+            else:
+                self._parents.append(-1)
+                self._anchor_indices.append(anchors.setdefault(parent, len(anchors)))
+
+        self._anchors = list(anchors)
+        self._levels = []
+        start: int = 0
+
+        for _, level in groupby(order, key=depths.__getitem__):
+            end: int = start + sum(1 for _ in level)
+            self._levels.append((start, end))
+            start = end
+
+        local_positions: List[Vector] = [self._members[entity].local_position for entity in order]
+
+        if self._numpy is None:
+            self._locals = local_positions
+        else:
+            np: Any = self._numpy
+            self._locals = np.array([local.as_tuple for local in local_positions], dtype=np.float64).reshape(-1, 2)
+            self._parents = np.array(self._parents, dtype=np.intp)
+            self._anchor_indices = np.array(self._anchor_indices, dtype=np.intp)
+
+        self._stale = False
+        self._stale_reads = 0
+
+    def _walk(self, entity: AbstractEntity, *, interpolated: bool) -> Vector:
+        if not entity.components.has(TransformComponent):
+            raise KeyError(f"Entity {entity.identifier} has no transform")
+
+        offset: Vector = Vector.zero()
+
+        while entity is not None and entity.components.has(TransformComponent):
+            offset += entity.components.get(TransformComponent).local_position
+            entity = entity.parent
+
+        position, interpolated_position = self._anchor_positions(entity)
+        return (interpolated_position if interpolated else position) + offset
+
+    def _depth(self, entity: AbstractEntity, depths: Dict[AbstractEntity, int]) -> None:
+        chain: List[AbstractEntity] = []
+
+        while entity in self._members and entity not in depths:
+            chain.append(entity)
+            entity = entity.parent
+
+        depth: int = depths.get(entity, -1)
+
+        for member in reversed(chain):
+            depth += 1
+            depths[member] = depth
+
+    def _anchor_positions(self, anchor: AbstractEntity | None) -> Tuple[Vector, Vector]:
+        if anchor is None or not anchor.components.has(PositionComponent):
+            return Vector.zero(), Vector.zero()
+
+        position: PositionComponent = anchor.components.get(PositionComponent)
+        return position.position, position.interpolated_position
+
+    def _origins(self) -> 'np.ndarray':
+        np: Any = self._numpy
+        origins: np.ndarray = np.zeros((len(self._anchors), 4), dtype=np.float64)
+        kinematics: Kinematics | None = self.app.kinematics
+        indices: List[int] = []
+        slots: List[int] = []
+
+        for index, anchor in enumerate(self._anchors):
+            if kinematics is not None and anchor is not None:
+                try:
+                    slots.append(kinematics.slot(anchor.identifier))
+                except (ValueError, KeyError):
+                    pass
+                else:
+                    indices.append(index)
+                    continue
+
+            position, interpolated = self._anchor_positions(anchor)
+            origins[index] = (*position.as_tuple, *interpolated.as_tuple)
+
+        if slots:
+            origins[indices, :2] = kinematics.positions[slots]
+            origins[indices, 2:] = kinematics.interpolated_positions(self.app.interpolation)[slots]
+
+        return origins
+
+    def _propagate_arrays(self) -> None:
+        np: Any = self._numpy
+        offsets: np.ndarray = np.tile(self._locals, 2)
+        worlds: np.ndarray = np.empty_like(offsets)
+
+        start, end = self._levels[0]
+        worlds[start:end] = self._origins()[self._anchor_indices] + offsets[start:end]
+
+        for start, end in self._levels[1:]:
+            worlds[start:end] = worlds[self._parents[start:end]] + offsets[start:end]
+
+        self._positions = worlds[:, :2].tolist()
+        self._interpolated_positions = worlds[:, 2:].tolist()
+
+    def _propagate_vectors(self) -> None:
+        anchors: List[Tuple[Vector, Vector]] = [self._anchor_positions(anchor) for anchor in self._anchors]
+        positions: List[Vector] = []
+        interpolated_positions: List[Vector] = []
+
+        for row, (parent, local) in enumerate(zip(self._parents, self._locals)):
+            if parent < 0:
+                position, interpolated = anchors[self._anchor_indices[row]]
+            else:
+                position, interpolated = positions[parent], interpolated_positions[parent]
+
+            positions.append(position + local)
+            interpolated_positions.append(interpolated + local)
+
+        self._positions = positions
+        self._interpolated_positions = interpolated_positions
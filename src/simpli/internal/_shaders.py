@@ -191,3 +191,59 @@ class Shaders:
             final_color = vec4(modulated_color, vertex_colors.a);
         }
     """
+
+    CIRCLE_VERTEX_SHADER = """
+        #version 150 core
+
+        in vec2 position;
+        in vec2 center;
+        in float radius;
+        in vec4 color;
+
+        out vec2 local_position;
+        out float circle_radius;
+        out vec4 vertex_colors;
+
+        uniform WindowBlock
+        {
+            mat4 projection;
+            mat4 view;
+        } window;
+        uniform vec2 u_window_size;
+        uniform vec2 u_camera_position;
+        uniform float u_zoom;
+
+        void main()
+        {
+            float extent = radius + 1.0 / u_zoom;
+
+            local_position = position * extent;
+            circle_radius = radius;
+            vertex_colors = color;
+
+            vec2 world_position = center + local_position;
+
+            gl_Position = window.projection * window.view * vec4((world_position - u_camera_position) * u_zoom + (u_window_size * 0.5), 0.0, 1.0);
+        }
+    """
+
+    CIRCLE_FRAGMENT_SHADER = """
+        #version 150 core
+
+        in vec2 local_position;
+        in float circle_radius;
+        in vec4 vertex_colors;
+
+        out vec4 final_color;
+
+        uniform float u_zoom;
+
+        void main()
+        {
+            float edge_distance = (length(local_position) - circle_radius) * u_zoom;
+            float coverage = clamp(0.5 - edge_distance, 0.0, 1.0);
+
+            final_color = vec4(vertex_colors.rgb, vertex_colors.a * coverage);
+            if (final_color.a < 0.01) discard;
+        }
+    """
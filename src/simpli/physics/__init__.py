@@ -0,0 +1,11 @@
+from ._barnes_hut import BarnesHutTree
+from ._interactions import PairwiseInteractions
+from ._kinematics import Kinematics
+from ._parallel import ParallelInteractions
+
+__all__ = [
+    Kinematics,
+    PairwiseInteractions,
+    ParallelInteractions,
+    BarnesHutTree,
+]
@@ -0,0 +1,235 @@
+from random import Random
+from typing import List, Tuple
+
+from ._laws import add_law_forces, scatter_forces
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class _Level:
+    __slots__ = (
+        "starts",
+        "ends",
+        "masses",
+        "centers",
+        "lows",
+        "highs",
+        "widths",
+        "min_ranges",
+        "max_ranges",
+        "mean_ranges",
+        "mean_power_factors",
+        "leaves",
+        "child_starts",
+        "child_ends",
+    )
+
+
+class BarnesHutTree:
+    def __init__(
+            self,
+            positions: 'np.ndarray',
+            strengths: 'np.ndarray',
+            ranges: 'np.ndarray',
+            power_factors: 'np.ndarray',
+            slots: 'np.ndarray',
+            *,
+            max_depth: int = 16,
+            leaf_size: int = 8,
+            rng: Random | None = None,
+    ) -> None:
+        if np is None:
+            raise ImportError("Barnes-Hut attraction requires numpy, install simpli[numpy]")
+
+        if not 0 < max_depth <= 16:
+            raise ValueError("Max depth must be between 1 and 16")
+
+        self._max_depth: int = max_depth
+        self._leaf_size: int = leaf_size
+        self._rng: Random | None = rng
+
+        codes: np.ndarray = self._morton_codes(positions)
+        order: np.ndarray = np.argsort(codes, kind="stable")
+
+        self._codes: np.ndarray = codes[order]
+        self._positions: np.ndarray = positions[order]
+        self._strengths: np.ndarray = strengths[order]
+        self._ranges: np.ndarray = ranges[order]
+        self._power_factors: np.ndarray = power_factors[order]
+        self._slots: np.ndarray = slots[order]
+
+        self._levels: List[_Level] = self._build_levels()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    @property
+    def depth(self) -> int:
+        return len(self._levels)
+
+    def attraction(self, targets: 'np.ndarray', theta: float) -> 'np.ndarray':
+        forces: np.ndarray = np.zeros((len(targets), 2), dtype=np.float64)
+
+        if len(self._positions) == 0 or len(targets) == 0:
+            return forces
+
+        target_indices: np.ndarray = np.arange(len(targets))
+        node_indices: np.ndarray = np.zeros(len(targets), dtype=np.int64)
+
+        for depth, level in enumerate(self._levels):
+            if len(target_indices) == 0:
+                break
+
+            points: np.ndarray = targets[target_indices]
+            lows: np.ndarray = level.lows[node_indices]
+            highs: np.ndarray = level.highs[node_indices]
+
+            nearest: np.ndarray = np.clip(points, lows, highs) - points
+            farthest: np.ndarray = np.maximum(np.abs(lows - points), np.abs(highs - points))
+            nearest_distances: np.ndarray = np.sqrt(nearest[:, 0] ** 2 + nearest[:, 1] ** 2)
+            farthest_distances: np.ndarray = np.sqrt(farthest[:, 0] ** 2 + farthest[:, 1] ** 2)
+
+            offsets: np.ndarray = level.centers[node_indices] - points
+            distances: np.ndarray = np.sqrt(offsets[:, 0] ** 2 + offsets[:, 1] ** 2)
+
+            reachable: np.ndarray = nearest_distances < level.max_ranges[node_indices]
+            accepted: np.ndarray = (
+                    reachable
+                    & (nearest_distances > 0)
+                    & (farthest_distances < level.min_ranges[node_indices])
+                    & (level.widths[node_indices] < theta * distances)
+            )
+            opened: np.ndarray = reachable & ~accepted
+            leaves: np.ndarray = opened & level.leaves[node_indices]
+
+            if accepted.any():
+                accepted_nodes: np.ndarray = node_indices[accepted]
+                accepted_distances: np.ndarray = distances[accepted]
+                magnitudes: np.ndarray = (
+                        (1 - np.power(
+                            accepted_distances / level.mean_ranges[accepted_nodes],
+                            level.mean_power_factors[accepted_nodes],
+                        ))
+                        * level.masses[accepted_nodes]
+                        / accepted_distances
+                )
+                scatter_forces(forces, target_indices[accepted], offsets[accepted] * magnitudes[:, None])
+
+            if leaves.any():
+                self._add_exact(forces, targets, target_indices[leaves], node_indices[leaves], level)
+
+            descend: np.ndarray = opened & ~level.leaves[node_indices]
+
+            if depth + 1 == len(self._levels) or not descend.any():
+                break
+
+            starts: np.ndarray = level.child_starts[node_indices[descend]]
+            counts: np.ndarray = level.child_ends[node_indices[descend]] - starts
+            target_indices, node_indices = self._expand(target_indices[descend], starts, counts)
+
+        return forces
+
+    def _add_exact(
+            self,
+            forces: 'np.ndarray',
+            targets: 'np.ndarray',
+            target_indices: 'np.ndarray',
+            node_indices: 'np.ndarray',
+            level: _Level,
+    ) -> None:
+        starts: np.ndarray = level.starts[node_indices]
+        target_indices, source_indices = self._expand(target_indices, starts, level.ends[node_indices] - starts)
+
+        not_self: np.ndarray = self._slots[source_indices] != target_indices
+        target_indices = target_indices[not_self]
+        source_indices = source_indices[not_self]
+
+        offsets: np.ndarray = self._positions[source_indices] - targets[target_indices]
+        distances: np.ndarray = np.sqrt(offsets[:, 0] ** 2 + offsets[:, 1] ** 2)
+        in_range: np.ndarray = distances < self._ranges[source_indices]
+
+        add_law_forces(
+            forces,
+            target_indices[in_range],
+            offsets[in_range],
+            self._strengths[source_indices[in_range]],
+            self._ranges[source_indices[in_range]],
+            self._power_factors[source_indices[in_range]],
+            rng=self._rng,
+        )
+
+    def _build_levels(self) -> List[_Level]:
+        levels: List[_Level] = []
+        count: int = len(self._positions)
+
+        if count == 0:
+            return levels
+
+        weights: np.ndarray = self._strengths
+        total_weights: np.ndarray = np.abs(weights) + 1e-12
+
+        for depth in range(self._max_depth + 1):
+            keys: np.ndarray = self._codes >> np.uint64(2 * (self._max_depth - depth))
+            starts: np.ndarray = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+            ends: np.ndarray = np.r_[starts[1:], count]
+
+            level: _Level = _Level()
+            level.starts = starts
+            level.ends = ends
+            level.masses = np.add.reduceat(weights, starts)
+
+            mass_weights: np.ndarray = np.add.reduceat(total_weights, starts)
+            level.centers = np.add.reduceat(self._positions * total_weights[:, None], starts) / mass_weights[:, None]
+            level.lows = np.minimum.reduceat(self._positions, starts)
+            level.highs = np.maximum.reduceat(self._positions, starts)
+            level.widths = (level.highs - level.lows).max(axis=1)
+            level.min_ranges = np.minimum.reduceat(self._ranges, starts)
+            level.max_ranges = np.maximum.reduceat(self._ranges, starts)
+            level.mean_ranges = np.add.reduceat(self._ranges * total_weights, starts) / mass_weights
+            level.mean_power_factors = np.add.reduceat(self._power_factors * total_weights, starts) / mass_weights
+            level.leaves = (ends - starts <= self._leaf_size) | (depth == self._max_depth)
+
+            if levels:
+                parent: _Level = levels[-1]
+                parents_of_children: np.ndarray = keys[starts] >> np.uint64(2)
+                parent_keys: np.ndarray = self._codes[parent.starts] >> np.uint64(2 * (self._max_depth - depth + 1))
+                parent.child_starts = np.searchsorted(parents_of_children, parent_keys, side="left")
+                parent.child_ends = np.searchsorted(parents_of_children, parent_keys, side="right")
+
+            levels.append(level)
+
+            if level.leaves.all():
+                break
+
+        levels[-1].child_starts = levels[-1].starts * 0
+        levels[-1].child_ends = levels[-1].starts * 0
+        return levels
+
+    def _morton_codes(self, positions: 'np.ndarray') -> 'np.ndarray':
+        if len(positions) == 0:
+            return np.zeros(0, dtype=np.uint64)
+
+        low: np.ndarray = positions.min(axis=0)
+        span: float = float((positions.max(axis=0) - low).max()) or 1.0
+        cells: int = (1 << self._max_depth) - 1
+        quantized: np.ndarray = ((positions - low) / span * cells).astype(np.uint64)
+
+        return self._spread_bits(quantized[:, 0]) | (self._spread_bits(quantized[:, 1]) << np.uint64(1))
+
+    @staticmethod
+    def _spread_bits(values: 'np.ndarray') -> 'np.ndarray':
+        values = (values | (values << np.uint64(8))) & np.uint64(0x00FF00FF)
+        values = (values | (values << np.uint64(4))) & np.uint64(0x0F0F0F0F)
+        values = (values | (values << np.uint64(2))) & np.uint64(0x33333333)
+        values = (values | (values << np.uint64(1))) & np.uint64(0x55555555)
+        return values
+
+    @staticmethod
+    def _expand(indices: 'np.ndarray', starts: 'np.ndarray', counts: 'np.ndarray') -> 'Tuple[np.ndarray, np.ndarray]':
+        total: int = int(counts.sum())
+        first: np.ndarray = np.repeat(np.cumsum(counts) - counts, counts)
+
+        return np.repeat(indices, counts), np.repeat(starts, counts) + np.arange(total) - first
@@ -0,0 +1,211 @@
+from random import Random
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from simpli.components import PositionComponent, AttractionComponent, RepulsionComponent
+from simpli.interfaces import AppDependant
+from ._barnes_hut import BarnesHutTree
+from ._kinematics import Kinematics
+from ._laws import add_law_forces
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+else:
+    Simpli = Any
+
+
+class PairwiseInteractions(AppDependant):
+    def __init__(self, *, app: Simpli, kinematics: Kinematics, barnes_hut_theta: float | None = None) -> None:
+        self._app: Simpli = app
+        self._kinematics: Kinematics = kinematics
+        self._barnes_hut_theta: float | None = None
+        self.barnes_hut_theta = barnes_hut_theta
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+    @property
+    def barnes_hut_theta(self) -> float | None:
+        return self._barnes_hut_theta
+
+    @barnes_hut_theta.setter
+    def barnes_hut_theta(self, value: float | None) -> None:
+        if value is not None and value < 0:
+            raise ValueError("Opening angle cannot be negative")
+
+        self._barnes_hut_theta = value
+
+    def apply(self) -> None:
+        targets: np.ndarray = self._kinematics.positions
+
+        if len(targets) == 0:
+            return
+
+        slots, sources, attraction, repulsion = self._gather_sources()
+
+        if len(slots) == 0:
+            return
+
+        forces: np.ndarray = np.zeros((len(targets), 2), dtype=np.float64)
+
+        if self._barnes_hut_theta is None:
+            self._add_forces(forces, slots, sources, targets, attraction, repulsion)
+        else:
+            self._add_forces(forces, slots, sources, targets, None, repulsion)
+
+            attracting: np.ndarray = attraction[:, 1] > 0
+            strength, interaction_range, power_factor = attraction[attracting].T
+            tree: BarnesHutTree = BarnesHutTree(
+                sources[attracting],
+                strength,
+                interaction_range,
+                power_factor,
+                slots[attracting],
+                rng=self.app.rng("physics"),
+            )
+            forces += tree.attraction(targets, self._barnes_hut_theta)
+
+        self._kinematics.velocities[:] += forces * self.app.tick_scale
+        self._kinematics._invalidate()
+
+    @classmethod
+    def add_pairwise_forces(
+            cls,
+            forces: 'np.ndarray',
+            slots: 'np.ndarray',
+            sources: 'np.ndarray',
+            targets: 'np.ndarray',
+            attraction: 'np.ndarray | None',
+            repulsion: 'np.ndarray | None',
+            *,
+            rng: Random | None = None,
+    ) -> None:
+        laws: List[Tuple[np.ndarray, float]] = [
+            (parameters, direction)
+            for parameters, direction in ((attraction, -1.0), (repulsion, 1.0))
+            if parameters is not None
+        ]
+        cell_size: float = max((float(parameters[:, 1].max()) for parameters, _ in laws), default=0.0)
+
+        if cell_size <= 0:
+            return
+
+        source_indices, target_indices = cls.candidate_pairs(sources, targets, cell_size)
+
+        not_self: np.ndarray = slots[source_indices] != target_indices
+        source_indices = source_indices[not_self]
+        target_indices = target_indices[not_self]
+
+        offsets: np.ndarray = targets[target_indices] - sources[source_indices]
+        distances: np.ndarray = np.sqrt(offsets[:, 0] ** 2 + offsets[:, 1] ** 2)
+
+        for parameters, direction in laws:
+            strength, interaction_range, power_factor = parameters[source_indices].T
+            in_range: np.ndarray = distances < interaction_range
+
+            add_law_forces(
+                forces,
+                target_indices[in_range],
+                offsets[in_range] * direction,
+                strength[in_range],
+                interaction_range[in_range],
+                power_factor[in_range],
+                rng=rng,
+            )
+
+    @staticmethod
+    def candidate_pairs(
+            sources: 'np.ndarray',
+            targets: 'np.ndarray',
+            cell_size: float,
+    ) -> 'Tuple[np.ndarray, np.ndarray]':
+        source_cells: np.ndarray = np.floor(sources / cell_size).astype(np.int64)
+        target_cells: np.ndarray = np.floor(targets / cell_size).astype(np.int64)
+
+        low: np.ndarray = np.minimum(target_cells.min(axis=0), source_cells.min(axis=0) - 1)
+        high: np.ndarray = np.maximum(target_cells.max(axis=0), source_cells.max(axis=0) + 1)
+        height: int = int(high[1] - low[1] + 1)
+
+        target_keys: np.ndarray = (target_cells[:, 0] - low[0]) * height + (target_cells[:, 1] - low[1])
+        order: np.ndarray = np.argsort(target_keys, kind="stable")
+        sorted_keys: np.ndarray = target_keys[order]
+
+        source_indices: List[np.ndarray] = []
+        target_indices: List[np.ndarray] = []
+
+        for cell_x in (-1, 0, 1):
+            for cell_y in (-1, 0, 1):
+                keys: np.ndarray = (
+                        (source_cells[:, 0] + cell_x - low[0]) * height
+                        + (source_cells[:, 1] + cell_y - low[1])
+                )
+                starts: np.ndarray = np.searchsorted(sorted_keys, keys, side="left")
+                counts: np.ndarray = np.searchsorted(sorted_keys, keys, side="right") - starts
+                total: int = int(counts.sum())
+
+                if total == 0:
+                    continue
+
+                first: np.ndarray = np.repeat(np.cumsum(counts) - counts, counts)
+                source_indices.append(np.repeat(np.arange(len(sources)), counts))
+                target_indices.append(order[np.repeat(starts, counts) + np.arange(total) - first])
+
+        if not source_indices:
+            return np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64)
+
+        return np.concatenate(source_indices), np.concatenate(target_indices)
+
+    def _add_forces(
+            self,
+            forces: 'np.ndarray',
+            slots: 'np.ndarray',
+            sources: 'np.ndarray',
+            targets: 'np.ndarray',
+            attraction: 'np.ndarray | None',
+            repulsion: 'np.ndarray | None',
+    ) -> None:
+        self.add_pairwise_forces(forces, slots, sources, targets, attraction, repulsion, rng=self.app.rng("physics"))
+
+    def _gather_sources(self) -> 'Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]':
+        rows: Dict[int, List[Any]] = {}
+
+        for column, component_type in ((3, AttractionComponent), (6, RepulsionComponent)):
+            for entity in self.app.entities.by_components(PositionComponent, component_type):
+                row: List[Any] | None = rows.get(entity.identifier)
+
+                if row is None:
+                    try:
+                        slot: int = self._kinematics.slot(entity.identifier)
+                        x, y = 0.0, 0.0
+                    except KeyError:
+                        slot: int = -1
+                        x, y = entity.components.get(PositionComponent).position.as_tuple
+
+                    row = [slot, x, y, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0]
+                    rows[entity.identifier] = row
+
+                component: AttractionComponent | RepulsionComponent = entity.components.get(component_type)
+                row[column] = component.strength.real
+                row[column + 1] = component.range.real
+                row[column + 2] = component.power_factor.real
+
+        table: np.ndarray = self._source_table(len(rows))
+
+        if rows:
+            table[:] = list(rows.values())
+
+        slots: np.ndarray = table[:, 0].astype(np.int64)
+        sources: np.ndarray = table[:, 1:3]
+
+        in_kinematics: np.ndarray = slots >= 0
+        sources[in_kinematics] = self._kinematics.positions[slots[in_kinematics]]
+
+        return slots, sources, table[:, 3:6], table[:, 6:9]
+
+    def _source_table(self, rows: int) -> 'np.ndarray':
+        return np.empty((rows, 9), dtype=np.float64)
@@ -0,0 +1,307 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from simpli.components import PositionComponent, VelocityComponent, AirFrictionComponent
+from simpli.interfaces import AppDependant
+from simpli.utils import Vector
+from ._shared_block import SharedBlock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+    from simpli.entities import AbstractEntity
+else:
+    Simpli = Any
+    AbstractEntity = Any
+
+
+class Kinematics(AppDependant):
+    def __init__(self, *, app: Simpli, capacity: int = 1024) -> None:
+        if np is None:
+            raise ImportError("Vectorized kinematics require numpy, install simpli[numpy]")
+
+        self._app: Simpli = app
+        self._version: int = 0
+        self._count: int = 0
+        self._snapshot_tick: int = -1
+
+        self._positions: np.ndarray = np.zeros((capacity, 2), dtype=np.float64)
+        self._previous_positions: np.ndarray = np.zeros((capacity, 2), dtype=np.float64)
+        self._velocities: np.ndarray = np.zeros((capacity, 2), dtype=np.float64)
+        self._air_frictions: np.ndarray = np.zeros(capacity, dtype=np.float64)
+        self._damped: np.ndarray = np.zeros(capacity, dtype=np.bool_)
+        self._blocks: Tuple[SharedBlock, SharedBlock] | None = None
+
+        self._slots: Dict[int, int] = {}
+        self._entities: List[AbstractEntity] = []
+        self._components: List[Tuple[PositionComponent, VelocityComponent, AirFrictionComponent | None]] = []
+
+        app.entities.observe((PositionComponent, VelocityComponent), self._insert, self._discard, self._insert_many)
+        app.entities.observe(
+            (PositionComponent, VelocityComponent, AirFrictionComponent),
+            self._damp,
+            self._undamp,
+            self._damp_many,
+        )
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    @property
+    def positions(self) -> 'np.ndarray':
+        return self._positions[:self._count]
+
+    @property
+    def velocities(self) -> 'np.ndarray':
+        return self._velocities[:self._count]
+
+    @property
+    def entities(self) -> List[AbstractEntity]:
+        return self._entities
+
+    def slot(self, identifier: int) -> int:
+        return self._slots[identifier]
+
+    def position(self, slot: int) -> Vector:
+        return Vector(*self._positions[slot].tolist())
+
+    def set_position(self, slot: int, value: Vector) -> None:
+        self._remember_positions()
+        self._positions[slot] = value.as_tuple
+
+    def interpolated_position(self, slot: int, alpha: float) -> Vector:
+        if alpha >= 1 or self._snapshot_tick != self.app.ticks:
+            return self.position(slot)
+
+        previous: np.ndarray = self._previous_positions[slot]
+        return Vector(*(previous + (self._positions[slot] - previous) * alpha).tolist())
+
+    def interpolated_positions(self, alpha: float) -> 'np.ndarray':
+        positions: np.ndarray = self.positions
+
+        if alpha >= 1 or self._snapshot_tick != self.app.ticks:
+            return positions
+
+        previous: np.ndarray = self._previous_positions[:self._count]
+        return previous + (positions - previous) * alpha
+
+    def velocity(self, slot: int) -> Vector:
+        return Vector(*self._velocities[slot].tolist())
+
+    def set_velocity(self, slot: int, value: Vector) -> None:
+        self._velocities[slot] = value.as_tuple
+
+    def set_air_friction(self, slot: int, value: float) -> None:
+        self._air_frictions[slot] = value
+
+    def integrate(self) -> None:
+        count: int = self._count
+        self._remember_positions()
+        self._positions[:count] += self._velocities[:count] * self.app.tick_scale
+        self._invalidate()
+        self.app.entities._positions_invalidated()
+
+        if not self.app.headless:
+            for slot in np.flatnonzero(self._velocities[:count].any(axis=1)).tolist():
+                self.app.shapes._entity_changed(self._entities[slot])
+
+    def apply_air_friction(self) -> None:
+        count: int = self._count
+        damped: np.ndarray = self._damped[:count]
+        velocities: np.ndarray = self._velocities[:count]
+
+        velocities[damped] *= ((1 - self._air_frictions[:count][damped]) ** self.app.tick_scale)[:, None]
+
+        stopped: np.ndarray = damped & ((velocities ** 2).sum(axis=1) < 0.01)
+        velocities[stopped] = 0
+
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._version += 1
+        self.app.invalidate_bindings()
+
+    def _share(self, positions: SharedBlock, velocities: SharedBlock) -> None:
+        capacity: int = len(self._positions)
+        self._positions = positions.array(capacity, 2, keep=self._positions)
+        self._velocities = velocities.array(capacity, 2, keep=self._velocities)
+        self._blocks = (positions, velocities)
+
+    def _unshare(self) -> None:
+        if self._blocks is None:
+            return
+
+        self._positions = self._positions.copy()
+        self._velocities = self._velocities.copy()
+        self._blocks = None
+
+    def _remember_positions(self) -> None:
+        if self._snapshot_tick == self.app.ticks:
+            return
+
+        count: int = self._count
+        self._previous_positions[:count] = self._positions[:count]
+        self._snapshot_tick = self.app.ticks
+
+    def _insert(self, entity: AbstractEntity) -> None:
+        if self._count == len(self._positions):
+            self._grow()
+
+        slot: int = self._count
+        self._count += 1
+
+        position: PositionComponent = entity.components.get(PositionComponent)
+        velocity: VelocityComponent = entity.components.get(VelocityComponent)
+
+        self._positions[slot] = position.position.as_tuple
+        self._previous_positions[slot] = self._positions[slot]
+        self._velocities[slot] = velocity.velocity.as_tuple
+        self._air_frictions[slot] = 0
+        self._damped[slot] = False
+
+        self._slots[entity.identifier] = slot
+        self._entities.append(entity)
+        self._components.append((position, velocity, None))
+
+        position._bind(self, slot)
+        velocity._bind(self, slot)
+
+    def _insert_many(self, entities: List[AbstractEntity]) -> None:
+        start: int = self._count
+        end: int = start + len(entities)
+
+        while end > len(self._positions):
+            self._grow()
+
+        positions: List[PositionComponent] = [entity.components.get(PositionComponent) for entity in entities]
+        velocities: List[VelocityComponent] = [entity.components.get(VelocityComponent) for entity in entities]
+
+        self._positions[start:end] = [position.position.as_tuple for position in positions]
+        self._previous_positions[start:end] = self._positions[start:end]
+        self._velocities[start:end] = [velocity.velocity.as_tuple for velocity in velocities]
+        self._air_frictions[start:end] = 0
+        self._damped[start:end] = False
+
+        self._slots.update(zip((entity.identifier for entity in entities), range(start, end)))
+        self._entities.extend(entities)
+        self._components.extend(zip(positions, velocities, [None] * len(entities)))
+        self._count = end
+
+        for slot, position, velocity in zip(range(start, end), positions, velocities):
+            position._bind(self, slot)
+            velocity._bind(self, slot)
+
+    def _restore_positions(self, entities: List[AbstractEntity], positions: 'np.ndarray') -> None:
+        indices, slots = self._held(entities)
+        self._positions[slots] = positions[indices]
+        self._previous_positions[slots] = positions[indices]
+        self._invalidate()
+        self.app.entities._positions_invalidated()
+
+    def _restore_velocities(self, entities: List[AbstractEntity], velocities: 'np.ndarray') -> None:
+        indices, slots = self._held(entities)
+        self._velocities[slots] = velocities[indices]
+        self._invalidate()
+
+    def _held(self, entities: List[AbstractEntity]) -> Tuple[List[int], List[int]]:
+        indices: List[int] = []
+        slots: List[int] = []
+
+        for index, entity in enumerate(entities):
+            slot: int | None = self._slots.get(entity.identifier)
+
+            if slot is not None:
+                indices.append(index)
+                slots.append(slot)
+
+        return indices, slots
+
+    def _discard(self, entity: AbstractEntity) -> None:
+        slot: int = self._slots.pop(entity.identifier)
+        last: int = self._count - 1
+
+        for component in self._components[slot]:
+            if component is not None:
+                component._unbind()
+
+        if slot != last:
+            self._positions[slot] = self._positions[last]
+            self._previous_positions[slot] = self._previous_positions[last]
+            self._velocities[slot] = self._velocities[last]
+            self._air_frictions[slot] = self._air_frictions[last]
+            self._damped[slot] = self._damped[last]
+
+            self._entities[slot] = self._entities[last]
+            self._components[slot] = self._components[last]
+            self._slots[self._entities[slot].identifier] = slot
+
+            for component in self._components[slot]:
+                if component is not None:
+                    component._move(slot)
+
+        self._entities.pop()
+        self._components.pop()
+        self._count = last
+
+    def _damp(self, entity: AbstractEntity) -> None:
+        slot: int = self._slots[entity.identifier]
+        position, velocity, _ = self._components[slot]
+        air_friction: AirFrictionComponent = entity.components.get(AirFrictionComponent)
+
+        self._air_frictions[slot] = air_friction.air_friction
+        self._damped[slot] = True
+        self._components[slot] = (position, velocity, air_friction)
+
+        air_friction._bind(self, slot)
+
+    def _damp_many(self, entities: List[AbstractEntity]) -> None:
+        slots: List[int] = [self._slots[entity.identifier] for entity in entities]
+        air_frictions: List[AirFrictionComponent] = [
+            entity.components.get(AirFrictionComponent) for entity in entities
+        ]
+
+        self._air_frictions[slots] = [air_friction.air_friction for air_friction in air_frictions]
+        self._damped[slots] = True
+
+        for slot, air_friction in zip(slots, air_frictions):
+            position, velocity, _ = self._components[slot]
+            self._components[slot] = (position, velocity, air_friction)
+            air_friction._bind(self, slot)
+
+    def _undamp(self, entity: AbstractEntity) -> None:
+        slot: int | None = self._slots.get(entity.identifier)
+
+        if slot is None:
+            return
+
+        position, velocity, air_friction = self._components[slot]
+
+        self._air_frictions[slot] = 0
+        self._damped[slot] = False
+        self._components[slot] = (position, velocity, None)
+
+        if air_friction is not None:
+            air_friction._unbind()
+
+    def _grow(self) -> None:
+        capacity: int = len(self._positions) * 2
+
+        if self._blocks is None:
+            self._positions = np.resize(self._positions, (capacity, 2))
+            self._velocities = np.resize(self._velocities, (capacity, 2))
+        else:
+            positions, velocities = self._blocks
+            self._positions = positions.array(capacity, 2, keep=self._positions)
+            self._velocities = velocities.array(capacity, 2, keep=self._velocities)
+
+        self._previous_positions = np.resize(self._previous_positions, (capacity, 2))
+        self._air_frictions = np.resize(self._air_frictions, capacity)
+        self._damped = np.resize(self._damped, capacity)
@@ -0,0 +1,32 @@
+from math import pi, cos, sin
+from random import Random, random
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def add_law_forces(
+        forces: 'np.ndarray',
+        target_indices: 'np.ndarray',
+        offsets: 'np.ndarray',
+        strengths: 'np.ndarray',
+        ranges: 'np.ndarray',
+        power_factors: 'np.ndarray',
+        *,
+        rng: Random | None = None,
+) -> None:
+    for index in np.flatnonzero(offsets[:, 0] ** 2 + offsets[:, 1] ** 2 < 0.001):
+        angle: float = 2 * pi * (random() if rng is None else rng.random())
+        offsets[index] = (cos(angle) * 0.1, sin(angle) * 0.1)
+
+    lengths: np.ndarray = np.sqrt(offsets[:, 0] ** 2 + offsets[:, 1] ** 2)
+    magnitudes: np.ndarray = (1 - np.power(lengths / ranges, power_factors)) * strengths / lengths
+
+    scatter_forces(forces, target_indices, offsets * magnitudes[:, None])
+
+
+def scatter_forces(forces: 'np.ndarray', target_indices: 'np.ndarray', values: 'np.ndarray') -> None:
+    forces[:, 0] += np.bincount(target_indices, values[:, 0], minlength=len(forces))
+    forces[:, 1] += np.bincount(target_indices, values[:, 1], minlength=len(forces))
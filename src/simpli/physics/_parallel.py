@@ -0,0 +1,192 @@
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
+from multiprocessing import get_all_start_methods, get_context
+from multiprocessing.shared_memory import SharedMemory
+from os import cpu_count
+from random import Random
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+from weakref import finalize
+
+from ._interactions import PairwiseInteractions
+from ._kinematics import Kinematics
+from ._shared_block import SharedBlock
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+else:
+    Simpli = Any
+
+_COLUMNS: int = 9
+
+_attached: Dict[str, SharedMemory] = {}
+
+
+class ParallelInteractions(PairwiseInteractions):
+    def __init__(
+            self,
+            *,
+            app: Simpli,
+            kinematics: Kinematics,
+            barnes_hut_theta: float | None = None,
+            workers: int | None = None,
+            region_size: int = 2048,
+    ) -> None:
+        if workers is not None and workers < 1:
+            raise ValueError("At least one physics worker is required")
+
+        if region_size < 1:
+            raise ValueError("Regions must hold at least one target")
+
+        super().__init__(app=app, kinematics=kinematics, barnes_hut_theta=barnes_hut_theta)
+        self._workers: int = workers or cpu_count() or 1
+        self._region_size: int = region_size
+
+        self._table: SharedBlock = SharedBlock()
+        self._positions: SharedBlock = SharedBlock()
+        self._velocities: SharedBlock = SharedBlock()
+        self._forces: SharedBlock = SharedBlock()
+        kinematics._share(self._positions, self._velocities)
+
+        method: str = "forkserver" if "forkserver" in get_all_start_methods() else "spawn"
+        self._executor: Executor = ProcessPoolExecutor(max_workers=self._workers, mp_context=get_context(method))
+        self._finalizer: finalize = finalize(
+            self,
+            _shutdown,
+            self._executor,
+            kinematics,
+            (self._table, self._positions, self._velocities, self._forces),
+        )
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def region_size(self) -> int:
+        return self._region_size
+
+    def close(self) -> None:
+        self._finalizer()
+
+    def regions(self, targets: 'np.ndarray') -> List[Tuple[float, float]]:
+        count: int = min(self._workers, -(-len(targets) // self._region_size))
+
+        if count <= 1:
+            return [(-np.inf, np.inf)]
+
+        bounds: List[float] = np.quantile(targets[:, 0], np.linspace(0, 1, count + 1)[1:-1]).tolist()
+        return list(zip([-np.inf, *bounds], [*bounds, np.inf]))
+
+    def _add_forces(
+            self,
+            forces: 'np.ndarray',
+            slots: 'np.ndarray',
+            sources: 'np.ndarray',
+            targets: 'np.ndarray',
+            attraction: 'np.ndarray | None',
+            repulsion: 'np.ndarray | None',
+    ) -> None:
+        regions: List[Tuple[float, float]] = self.regions(targets)
+
+        if len(regions) == 1 or not self._finalizer.alive:
+            super()._add_forces(forces, slots, sources, targets, attraction, repulsion)
+            return
+
+        laws: Tuple[np.ndarray | None, ...] = (attraction, repulsion)
+        halo: float = max((float(parameters[:, 1].max()) for parameters in laws if parameters is not None), default=0.0)
+
+        shared_forces: np.ndarray = self._forces.array(len(targets), 2)
+        shared_forces[:] = 0
+
+        names: Tuple[str, str, str] = (self._table.name, self._positions.name, self._forces.name)
+        rng: Random = self.app.rng("physics")
+        futures: List[Future] = [
+            self._executor.submit(
+                _region_forces,
+                names,
+                len(slots),
+                len(targets),
+                low,
+                high,
+                halo,
+                attraction is not None,
+                repulsion is not None,
+                rng.getrandbits(64),
+            )
+            for low, high in regions
+        ]
+
+        for future in futures:
+            future.result()
+
+        forces += shared_forces
+
+    def _source_table(self, rows: int) -> 'np.ndarray':
+        if not self._finalizer.alive:
+            return super()._source_table(rows)
+
+        return self._table.array(rows, _COLUMNS)
+
+
+def _region_forces(
+        names: Tuple[str, str, str],
+        source_count: int,
+        target_count: int,
+        low: float,
+        high: float,
+        halo: float,
+        attract: bool,
+        repel: bool,
+        seed: int,
+) -> None:
+    memories: List[SharedMemory] = _attach(names)
+
+    table: np.ndarray = np.ndarray((source_count, _COLUMNS), dtype=np.float64, buffer=memories[0].buf)
+    targets: np.ndarray = np.ndarray((target_count, 2), dtype=np.float64, buffer=memories[1].buf)
+    forces: np.ndarray = np.ndarray((target_count, 2), dtype=np.float64, buffer=memories[2].buf)
+
+    target_indices: np.ndarray = np.flatnonzero((targets[:, 0] >= low) & (targets[:, 0] < high))
+    source_indices: np.ndarray = np.flatnonzero((table[:, 1] >= low - halo) & (table[:, 1] < high + halo))
+
+    if len(target_indices) > 0 and len(source_indices) > 0:
+        local: np.ndarray = np.full(target_count, -1, dtype=np.int64)
+        local[target_indices] = np.arange(len(target_indices))
+
+        sources: np.ndarray = table[source_indices]
+        slots: np.ndarray = sources[:, 0].astype(np.int64)
+        region_forces: np.ndarray = np.zeros((len(target_indices), 2), dtype=np.float64)
+
+        PairwiseInteractions.add_pairwise_forces(
+            region_forces,
+            np.where(slots >= 0, local[slots], -1),
+            sources[:, 1:3],
+            targets[target_indices],
+            sources[:, 3:6] if attract else None,
+            sources[:, 6:9] if repel else None,
+            rng=Random(seed),
+        )
+
+        forces[target_indices] = region_forces
+
+
+def _attach(names: Tuple[str, ...]) -> List[SharedMemory]:
+    for name in [name for name in _attached if name not in names]:
+        _attached.pop(name).close()
+
+    for name in names:
+        if name not in _attached:
+            _attached[name] = SharedMemory(name=name, track=False)
+
+    return [_attached[name] for name in names]
+
+
+def _shutdown(executor: Executor, kinematics: Kinematics, blocks: Tuple[SharedBlock, ...]) -> None:
+    executor.shutdown(wait=True, cancel_futures=True)
+    kinematics._unshare()
+
+    for block in blocks:
+        block.release()
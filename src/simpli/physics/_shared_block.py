@@ -0,0 +1,61 @@
+from multiprocessing.shared_memory import SharedMemory
+from typing import List
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class SharedBlock:
+    __slots__ = (
+        "_memory",
+        "_retired",
+    )
+
+    def __init__(self) -> None:
+        self._memory: SharedMemory | None = None
+        self._retired: List[SharedMemory] = []
+
+    @property
+    def name(self) -> str:
+        return self._memory.name
+
+    def array(self, rows: int, columns: int, *, keep: 'np.ndarray | None' = None) -> 'np.ndarray':
+        size: int = max(rows * columns, 1) * np.dtype(np.float64).itemsize
+
+        if self._memory is None or self._memory.size < size:
+            memory: SharedMemory = SharedMemory(create=True, size=size * 2)
+
+            if keep is not None:
+                np.ndarray(keep.shape, dtype=np.float64, buffer=memory.buf)[:] = keep
+
+            self._retire()
+            self._memory = memory
+
+        return np.ndarray((rows, columns), dtype=np.float64, buffer=self._memory.buf)
+
+    def release(self) -> None:
+        self._retire()
+        self._close_retired()
+
+    def _retire(self) -> None:
+        self._close_retired()
+
+        if self._memory is None:
+            return
+
+        self._memory.unlink()
+        self._retired.append(self._memory)
+        self._memory = None
+
+    def _close_retired(self) -> None:
+        retired: List[SharedMemory] = []
+
+        for memory in self._retired:
+            try:
+                memory.close()
+            except BufferError:
+                retired.append(memory)
+
+        self._retired = retired
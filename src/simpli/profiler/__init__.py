@@ -0,0 +1,8 @@
+from ._profiler import AbstractProfiler, Profiler, ProfilerSnapshot, SectionStatistics
+
+__all__ = [
+    AbstractProfiler,
+    Profiler,
+    ProfilerSnapshot,
+    SectionStatistics,
+]
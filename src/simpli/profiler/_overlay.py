@@ -0,0 +1,54 @@
+from time import perf_counter
+from typing import List
+
+from pyglet.text import Label
+
+from ._profiler import Profiler, ProfilerSnapshot
+
+
+class ProfilerOverlay:
+    def __init__(self, *, profiler: Profiler, refresh_interval: float = 0.25) -> None:
+        self._profiler: Profiler = profiler
+        self._refresh_interval: float = refresh_interval
+        self._refreshed: float = 0.0
+
+        self._label: Label = Label(
+            "",
+            font_name="monospace",
+            font_size=10,
+            color=(20, 20, 20, 255),
+            multiline=True,
+            width=520,
+            anchor_y="top",
+        )
+
+    def draw(self) -> None:
+        now: float = perf_counter()
+
+        if now - self._refreshed >= self._refresh_interval:
+            self._refreshed = now
+            self._label.text = self.format(self._profiler.snapshot())
+
+        self._label.x = 10
+        self._label.y = self._profiler.app.window_height - 10
+        self._label.draw()
+
+    def delete(self) -> None:
+        self._label.delete()
+
+    @staticmethod
+    def format(snapshot: ProfilerSnapshot) -> str:
+        lines: List[str] = [
+            f"entities {snapshot.entities}  shapes {snapshot.shapes}  ticks {snapshot.ticks}",
+            f"{'section':<28}{'p50':>9}{'p95':>9}{'p99':>9}  ms",
+        ]
+
+        for section, statistics in sorted(snapshot.sections.items()):
+            lines.append(
+                f"{section:<28}"
+                f"{statistics.p50 * 1000:>9.3f}"
+                f"{statistics.p95 * 1000:>9.3f}"
+                f"{statistics.p99 * 1000:>9.3f}"
+            )
+
+        return "\n".join(lines)
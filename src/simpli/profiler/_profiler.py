@@ -0,0 +1,176 @@
+from abc import ABC, abstractmethod
+from collections import deque
+from dataclasses import dataclass
+from time import perf_counter
+from typing import TYPE_CHECKING, Any, Callable, Deque, Dict, List
+
+from simpli.interfaces import AppDependant
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+else:
+    Simpli = Any
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class SectionStatistics:
+    samples: int
+    mean: float
+    p50: float
+    p95: float
+    p99: float
+    max: float
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class ProfilerSnapshot:
+    sections: Dict[str, SectionStatistics]
+    entities: int
+    shapes: int
+    ticks: int
+
+
+class AbstractProfiler(AppDependant, ABC):
+    @property
+    @abstractmethod
+    def enabled(self) -> bool:
+        raise NotImplementedError
+
+    @enabled.setter
+    @abstractmethod
+    def enabled(self, value: bool) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def overlay_visible(self) -> bool:
+        raise NotImplementedError
+
+    @overlay_visible.setter
+    @abstractmethod
+    def overlay_visible(self, value: bool) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def record(self, section: str, seconds: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def measure(self, section: str, function: Callable[[], Any]) -> Any:
+        raise NotImplementedError
+
+    @abstractmethod
+    def snapshot(self) -> ProfilerSnapshot:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reset(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def draw(self) -> None:
+        raise NotImplementedError
+
+    def __init__(self, *, app: Simpli) -> None:
+        self._app: Simpli = app
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+
+class Profiler(AbstractProfiler):
+    def __init__(self, *, app: Simpli, enabled: bool = False, window: int = 240) -> None:
+        super().__init__(app=app)
+
+        if window < 1:
+            raise ValueError("Profiler window must hold at least one sample")
+
+        self._enabled: bool = enabled
+        self._window: int = window
+        self._samples: Dict[str, Deque[float]] = {}
+        self._overlay: Any = None
+
+    @property
+    def enabled(self) -> bool:
+        return self._enabled
+
+    @enabled.setter
+    def enabled(self, value: bool) -> None:
+        self._enabled = value
+
+        if not value:
+            self.overlay_visible = False
+
+    @property
+    def window(self) -> int:
+        return self._window
+
+    @property
+    def overlay_visible(self) -> bool:
+        return self._overlay is not None
+
+    @overlay_visible.setter
+    def overlay_visible(self, value: bool) -> None:
+        if not value:
+            if self._overlay is not None:
+                self._overlay.delete()
+                self._overlay = None
+
+            return
+
+        if self.app.headless:
+            raise ValueError("Profiler overlay requires a window")
+
+        if self._overlay is None:
+            from ._overlay import ProfilerOverlay
+
+            self._enabled = True
+            self._overlay = ProfilerOverlay(profiler=self)
+
+    def record(self, section: str, seconds: float) -> None:
+        samples: Deque[float] | None = self._samples.get(section)
+
+        if samples is None:
+            samples = self._samples.setdefault(section, deque(maxlen=self._window))
+
+        samples.append(seconds)
+
+    def measure(self, section: str, function: Callable[[], Any]) -> Any:
+        start: float = perf_counter()
+        result: Any = function()
+        self.record(section, perf_counter() - start)
+        return result
+
+    def snapshot(self) -> ProfilerSnapshot:
+        return ProfilerSnapshot(
+            sections={
+                section: self._statistics(samples)
+                for section, samples in self._samples.items()
+                if samples
+            },
+            entities=len(self.app.entities),
+            shapes=len(self.app.shapes),
+            ticks=self.app.ticks,
+        )
+
+    def reset(self) -> None:
+        self._samples.clear()
+
+    def draw(self) -> None:
+        if self._overlay is not None:
+            self._overlay.draw()
+
+    @staticmethod
+    def _statistics(samples: Deque[float]) -> SectionStatistics:
+        ordered: List[float] = sorted(samples)
+        count: int = len(ordered)
+
+        return SectionStatistics(
+            samples=count,
+            mean=sum(ordered) / count,
+            p50=ordered[min(int(count * 0.50), count - 1)],
+            p95=ordered[min(int(count * 0.95), count - 1)],
+            p99=ordered[min(int(count * 0.99), count - 1)],
+            max=ordered[-1],
+        )
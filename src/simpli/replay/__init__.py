@@ -0,0 +1,7 @@
+from ._journal import InputEvent, AbstractInputJournal, InputJournal
+
+__all__ = [
+    InputEvent,
+    AbstractInputJournal,
+    InputJournal,
+]
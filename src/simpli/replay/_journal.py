@@ -0,0 +1,148 @@
+from abc import ABC, abstractmethod
+from dataclasses import dataclass
+from json import dump, load
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple
+
+from simpli.interfaces import AppDependant
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+else:
+    Simpli = Any
+
+
+@dataclass(kw_only=True, slots=True, frozen=True)
+class InputEvent:
+    tick: int
+    kind: str
+    arguments: Tuple[float, ...]
+
+
+class AbstractInputJournal(AppDependant, ABC):
+    @property
+    @abstractmethod
+    def recording(self) -> bool:
+        raise NotImplementedError
+
+    @recording.setter
+    @abstractmethod
+    def recording(self, value: bool) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def seed(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def ticks(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def events(self) -> List[InputEvent]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def record(self, kind: str, *arguments: float) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def at(self, tick: int) -> List[InputEvent]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def save(self, path: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, path: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _ticked(self, tick: int) -> None:
+        raise NotImplementedError
+
+    def __init__(self, *, app: Simpli) -> None:
+        self._app: Simpli = app
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+
+class InputJournal(AbstractInputJournal):
+    def __init__(self, *, app: Simpli, recording: bool = False) -> None:
+        super().__init__(app=app)
+        self._recording: bool = recording
+        self._seed: int = app.seed
+        self._ticks: int = 0
+        self._events: List[InputEvent] = []
+        self._by_tick: Dict[int, List[InputEvent]] = {}
+
+    @property
+    def recording(self) -> bool:
+        return self._recording
+
+    @recording.setter
+    def recording(self, value: bool) -> None:
+        self._recording = value
+
+    @property
+    def seed(self) -> int:
+        return self._seed
+
+    @property
+    def ticks(self) -> int:
+        return self._ticks
+
+    @property
+    def events(self) -> List[InputEvent]:
+        return self._events
+
+    def record(self, kind: str, *arguments: float) -> None:
+        if not self._recording:
+            return
+
+        self._add(InputEvent(tick=self.app.ticks, kind=kind, arguments=arguments))
+
+    def at(self, tick: int) -> List[InputEvent]:
+        return self._by_tick.get(tick, [])
+
+    def save(self, path: str) -> None:
+        with open(path, "w") as file:
+            dump({
+                "seed": self._seed,
+                "ticks": self._ticks,
+                "events": [[event.tick, event.kind, event.arguments] for event in self._events],
+            }, file, separators=(",", ":"))
+
+    def load(self, path: str) -> None:
+        with open(path) as file:
+            journal: Dict[str, Any] = load(file)
+
+        self.clear()
+        self._recording = False
+        self._seed = journal["seed"]
+        self._ticks = journal["ticks"]
+
+        for tick, kind, arguments in journal["events"]:
+            self._add(InputEvent(tick=tick, kind=kind, arguments=tuple(arguments)))
+
+    def clear(self) -> None:
+        self._ticks = 0
+        self._events.clear()
+        self._by_tick.clear()
+
+    def _ticked(self, tick: int) -> None:
+        if self._recording:
+            self._ticks = tick
+
+    def _add(self, event: InputEvent) -> None:
+        self._events.append(event)
+        self._by_tick.setdefault(event.tick, []).append(event)
@@ -1,81 +1,204 @@
 from dataclasses import dataclass
-from typing import Any
-
-from pyglet.graphics import Group
-from pyglet.shapes import Circle as CircleBase, Rectangle as RectangleBase
+from typing import Any, TYPE_CHECKING, Tuple, Sequence, List
 
 from simpli.enums import LayerGroup
-from simpli.utils import Vector, Color, Value
+from simpli.utils import Vector, Color, Value, resolve
+from ._level_of_detail import LevelOfDetail
 from ._shape import Shape
 from ._shape_holder import AbstractShapeHolder, ShapeHolder
 
+if TYPE_CHECKING:
+    from pyglet.shapes import Circle as CircleBase
+else:
+    CircleBase = Any
+
+CIRCLE_LEVEL_OF_DETAIL: LevelOfDetail = LevelOfDetail()
+
 
 @dataclass(kw_only=True, slots=True)
 class Circle(Shape):
     position: Vector = Vector.zero()
     radius: float = 0
     color: Color = Color.black()
+    level_of_detail: LevelOfDetail = CIRCLE_LEVEL_OF_DETAIL
 
     _previous_position: Vector = None
     _previous_radius: float = None
     _previous_color: Color = None
-    _previous_zoom: float = None
+    _level: int = None
 
     def __post_init__(self) -> None:
         self._previous_visible = self.visible
         self._previous_layer_group = LayerGroup(self.layer_group.value)
-        self._previous_position = Vector(*self.position.as_tuple)
-        self._previous_radius = self.radius.real
-        self._previous_color = Color(*self.color.as_tuple)
-        self._previous_zoom = self.app.camera.zoom
 
-        self._base = self.create()
+        if self.app.headless or self.app.shapes.deferring:
+            return
+
+        self._remember()
+        self._level = self.level(self._previous_radius, self.app.camera.zoom)
+
+        self._base = self.create_base()
 
     @property
     def is_visible(self) -> bool:
         return self.app.camera.captures_radius(self.position, self.radius)
 
+    @property
+    def bounds(self) -> Tuple[Vector, float]:
+        return resolve(self.position), resolve(self.radius)
+
     @property
     def segments(self) -> int:
-        return int(self.radius ** 0.5 * 3.5 * self.app.camera.zoom) + 5
+        return self.level_of_detail.segments[self._level]
+
+    def level(self, radius: float, zoom: float) -> int:
+        return self.level_of_detail.level(radius ** 0.5 * 3.5 * zoom + 5, self._level)
 
     def create(self) -> CircleBase:
+        from pyglet.graphics import Group
+        from pyglet.shapes import Circle as CircleBase
+
+        position: Vector = resolve(self.position)
+
         return CircleBase(
-            self.position.x,
-            self.position.y,
-            self.radius,
+            position.x,
+            position.y,
+            resolve(self.radius),
             self.segments,
-            self.color.as_int_tuple,
+            resolve(self.color).as_int_tuple,
             batch=self.app.batch,
             group=Group(self.layer_group),
             program=self.app.program,
         )
 
+    def _remember(self) -> None:
+        self._previous_position = resolve(self.position)
+        self._previous_radius = resolve(self.radius)
+        self._previous_color = resolve(self.color)
+
+    def rebuild(self) -> None:
+        self._remember()
+        self._level = self.level(self._previous_radius, self.app.camera.zoom)
+        Shape.rebuild(self)
+
     def update(self) -> None:
-        self.visible = self.is_visible
+        position: Vector = resolve(self.position)
+        radius: float = resolve(self.radius)
+        color: Color = resolve(self.color)
 
-        if (
-                self.layer_group == self._previous_layer_group
-                and self.radius == self._previous_radius
-                and self.app.camera.zoom == self._previous_zoom
-        ):
+        if self.layer_group == self._previous_layer_group:
+            if self.level(radius, self.app.camera.zoom) != self._level:
+                self.app.shapes.schedule_rebuild(self)
             if self.visible != self._previous_visible:
                 self._base.visible = self.visible
-            if self.position != self._previous_position:
-                self._base.position = self.position.as_tuple
-            if self.color != self._previous_color:
-                self._base.color = self.color.as_int_tuple
+            if position != self._previous_position:
+                self._base.position = position.as_tuple
+            if radius != self._previous_radius:
+                self._base.radius = radius
+            if color != self._previous_color:
+                self._base.color = color.as_int_tuple
+        else:
+            self.rebuild()
+
+        self._previous_visible = self.visible
+        self._previous_layer_group = LayerGroup(self.layer_group.value)
+        self._previous_position = position
+        self._previous_radius = radius
+        self._previous_color = color
+
+
+@dataclass(kw_only=True, slots=True)
+class InstancedCircle(Shape):
+    position: Vector = Vector.zero()
+    radius: float = 0
+    color: Color = Color.black()
+
+    _previous_position: Vector = None
+    _previous_radius: float = None
+    _previous_color: Color = None
+
+    def __post_init__(self) -> None:
+        self._previous_visible = self.visible
+        self._previous_layer_group = LayerGroup(self.layer_group.value)
+
+        if self.app.headless or self.app.shapes.deferring:
+            return
+
+        self._remember()
+        self._base = self.create_base()
+
+    @property
+    def is_visible(self) -> bool:
+        return self.app.camera.captures_radius(self.position, self.radius)
+
+    @property
+    def bounds(self) -> Tuple[Vector, float]:
+        return resolve(self.position), resolve(self.radius)
+
+    @classmethod
+    def rebuild_many(cls, shapes: Sequence['InstancedCircle']) -> None:
+        if not shapes or shapes[0].app.headless or shapes[0].app.shapes.deferring:
+            for shape in shapes:
+                shape.rebuild()
+
+            return
+
+        for shape in shapes:
+            shape.remove()
+            shape._remember()
+
+        bases: List[Any] = shapes[0].app.circle_renderer.new_many([
+            (shape._previous_position, shape._previous_radius, shape._previous_color, shape.layer_group)
+            for shape in shapes
+        ])
+
+        for shape, base in zip(shapes, bases):
+            shape._base = base
+
+            if not shape.visible:
+                base.visible = False
+
+    def _remember(self) -> None:
+        self._previous_position = resolve(self.position)
+        self._previous_radius = resolve(self.radius)
+        self._previous_color = resolve(self.color)
+
+    def rebuild(self) -> None:
+        self._remember()
+        Shape.rebuild(self)
+
+    def create(self) -> Any:
+        return self.app.circle_renderer.new(
+            resolve(self.position),
+            resolve(self.radius),
+            resolve(self.color),
+            self.layer_group,
+        )
+
+    def update(self) -> None:
+        position: Vector = resolve(self.position)
+        radius: float = resolve(self.radius)
+        color: Color = resolve(self.color)
+
+        if self.layer_group == self._previous_layer_group:
+            if self.visible != self._previous_visible:
+                self._base.visible = self.visible
+            if position != self._previous_position:
+                self._base.position = position.as_tuple
+            if radius != self._previous_radius:
+                self._base.radius = radius
+            if color != self._previous_color:
+                self._base.color = color.as_int_tuple
         else:
             self.remove()
-            self._base = self.create()
+            self._base = self.create_base()
             self._base.visible = self.visible
 
         self._previous_visible = self.visible
-        self._previous_layer_group = LayerGroup(self._previous_layer_group.value)
-        self._previous_position = Vector(*self.position.as_tuple)
-        self._previous_radius = self.radius.real
-        self._previous_color = Color(*self.color.as_tuple)
-        self._previous_zoom = self.app.camera.zoom
+        self._previous_layer_group = LayerGroup(self.layer_group.value)
+        self._previous_position = position
+        self._previous_radius = radius
+        self._previous_color = color
 
 
 @dataclass(kw_only=True, slots=True)
@@ -98,13 +221,16 @@ class Rectangle(Shape):
         self._previous_height = self.height.real
         self._previous_color = Color(*self.color.as_tuple)
 
-        self._base = self.create()
+        self._base = self.create_base()
 
     @property
     def is_visible(self) -> bool:
         return True
 
     def create(self) -> Any:
+        from pyglet.graphics import Group
+        from pyglet.shapes import Rectangle as RectangleBase
+
         return RectangleBase(
             self.position.x,
             self.position.y,
@@ -132,7 +258,7 @@ class Rectangle(Shape):
                 self._base.color = self.color.as_int_tuple
         else:
             self.remove()
-            self._base = self.create()
+            self._base = self.create_base()
             self._base.visible = self.visible
 
         self._previous_visible = self.visible
@@ -147,6 +273,10 @@ class Rectangle(Shape):
 class BackgroundRectangle(Rectangle):
     layer_group: LayerGroup = LayerGroup.BACKGROUND
 
+    @classmethod
+    def snapshot_fields(cls) -> Tuple[str, ...]:
+        return ("layer_group",)
+
     def __post_init__(self) -> None:
         self.visible = self.is_visible
 
@@ -162,13 +292,16 @@ class BackgroundRectangle(Rectangle):
         self._previous_height = float(self.height.real)
         self._previous_color = Color(*self.color.as_tuple)
 
-        self._base = self.create()
+        self._base = self.create_base()
 
     @property
     def is_visible(self) -> bool:
         return True
 
     def create(self) -> Any:
+        from pyglet.graphics import Group
+        from pyglet.shapes import Rectangle as RectangleBase
+
         return RectangleBase(
             self.position.x,
             self.position.y,
@@ -183,9 +316,11 @@ class BackgroundRectangle(Rectangle):
 
 __all__ = [
     Shape,
+    LevelOfDetail,
     AbstractShapeHolder,
     ShapeHolder,
     Circle,
+    InstancedCircle,
     Rectangle,
     BackgroundRectangle,
 ]
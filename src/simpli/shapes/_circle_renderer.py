@@ -0,0 +1,200 @@
+from typing import TYPE_CHECKING, Any, Dict, List, Tuple, Sequence
+
+from pyglet.gl import GL_BLEND, GL_ONE_MINUS_SRC_ALPHA, GL_SRC_ALPHA, GL_TRIANGLES, glBlendFunc, glDisable, glEnable
+from pyglet.graphics import Group
+from pyglet.graphics.shader import ShaderProgram
+from pyglet.graphics.vertexdomain import VertexInstance, VertexList
+
+from simpli.enums import LayerGroup
+from simpli.interfaces import AppDependant
+from simpli.utils import Vector, Color
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+else:
+    Simpli = Any
+
+_QUAD: Tuple[float, ...] = (
+    -1.0, -1.0, 1.0, -1.0, 1.0, 1.0,
+    -1.0, -1.0, 1.0, 1.0, -1.0, 1.0,
+)
+
+
+class _CircleGroup(Group):
+    def __init__(self, program: ShaderProgram, layer_group: LayerGroup) -> None:
+        super().__init__(order=layer_group)
+        self._program: ShaderProgram = program
+
+    def set_state(self) -> None:
+        self._program.use()
+        glEnable(GL_BLEND)
+        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+
+    def unset_state(self) -> None:
+        glDisable(GL_BLEND)
+        self._program.stop()
+
+
+class CircleInstance:
+    __slots__ = (
+        "_layer",
+        "_index",
+        "_position",
+        "_radius",
+        "_color",
+        "_visible",
+    )
+
+    def __init__(self, layer: '_CircleLayer', position: Vector, radius: float, color: Color) -> None:
+        self._layer: _CircleLayer | None = layer
+        self._index: int = -1
+        self._position: Tuple[float, float] = position.as_tuple
+        self._radius: float = radius
+        self._color: Tuple[int, int, int, int] = color.as_int_tuple
+        self._visible: bool = True
+
+    @property
+    def position(self) -> Tuple[float, float]:
+        return self._position
+
+    @position.setter
+    def position(self, value: Tuple[float, float]) -> None:
+        self._position = value
+        self._layer.instance(self).center = value
+
+    @property
+    def radius(self) -> float:
+        return self._radius
+
+    @radius.setter
+    def radius(self, value: float) -> None:
+        self._radius = value
+        self._layer.instance(self).radius = (self.drawn_radius,)
+
+    @property
+    def color(self) -> Tuple[int, int, int, int]:
+        return self._color
+
+    @color.setter
+    def color(self, value: Tuple[int, int, int, int]) -> None:
+        self._color = value
+        self._layer.instance(self).color = value
+
+    @property
+    def visible(self) -> bool:
+        return self._visible
+
+    @visible.setter
+    def visible(self, value: bool) -> None:
+        self._visible = value
+        self._layer.instance(self).radius = (self.drawn_radius,)
+
+    @property
+    def drawn_radius(self) -> float:
+        return self._radius if self._visible else 0.0
+
+    def delete(self) -> None:
+        if self._layer is not None:
+            self._layer.remove(self)
+            self._layer = None
+
+
+class _CircleLayer:
+    __slots__ = (
+        "_vertex_list",
+        "_instances",
+        "_circles",
+    )
+
+    def __init__(self, app: Simpli, layer_group: LayerGroup) -> None:
+        self._vertex_list: VertexList = app.circle_program.vertex_list_instanced(
+            len(_QUAD) // 2,
+            GL_TRIANGLES,
+            ("center", "radius", "color"),
+            batch=app.batch,
+            group=_CircleGroup(app.circle_program, layer_group),
+            position=("f", _QUAD),
+            center=("f", (0.0, 0.0) * (len(_QUAD) // 2)),
+            radius=("f", (0.0,) * (len(_QUAD) // 2)),
+            color=("Bn", (0, 0, 0, 0) * (len(_QUAD) // 2)),
+        )
+        self._instances: List[VertexInstance] = []
+        self._circles: List[CircleInstance] = []
+
+    def instance(self, circle: CircleInstance) -> VertexInstance:
+        return self._instances[circle._index]
+
+    def add(self, circle: CircleInstance) -> None:
+        circle._index = len(self._circles)
+        self._circles.append(circle)
+        self._instances.append(self._vertex_list.add_instance(
+            center=circle.position,
+            radius=(circle.drawn_radius,),
+            color=circle.color,
+        ))
+
+    def add_many(self, circles: Sequence[CircleInstance]) -> None:
+        for circle in circles:
+            self.add(circle)
+
+    def remove(self, circle: CircleInstance) -> None:
+        index: int = circle._index
+        last: CircleInstance = self._circles[-1]
+
+        if last is not circle:
+            self._circles[index] = last
+            last._index = index
+
+            instance: VertexInstance = self._instances[index]
+            instance.center = last.position
+            instance.radius = (last.drawn_radius,)
+            instance.color = last.color
+
+        self._circles.pop()
+        self._instances.pop().delete()
+        circle._index = -1
+
+    def __len__(self) -> int:
+        return len(self._circles)
+
+
+class CircleRenderer(AppDependant):
+    def __init__(self, *, app: Simpli) -> None:
+        self._app: Simpli = app
+        self._layers: Dict[LayerGroup, _CircleLayer] = {}
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+    def new(self, position: Vector, radius: float, color: Color, layer_group: LayerGroup) -> CircleInstance:
+        layer: _CircleLayer = self._layer(layer_group)
+        circle: CircleInstance = CircleInstance(layer, position, radius.real, color)
+        layer.add(circle)
+        return circle
+
+    def new_many(self, circles: Sequence[Tuple[Vector, float, Color, LayerGroup]]) -> List[CircleInstance]:
+        layers: Dict[LayerGroup, List[CircleInstance]] = {}
+        instances: List[CircleInstance] = []
+
+        for position, radius, color, layer_group in circles:
+            circle: CircleInstance = CircleInstance(self._layer(layer_group), position, radius.real, color)
+            layers.setdefault(layer_group, []).append(circle)
+            instances.append(circle)
+
+        for layer_group, layer_circles in layers.items():
+            self._layers[layer_group].add_many(layer_circles)
+
+        return instances
+
+    def _layer(self, layer_group: LayerGroup) -> _CircleLayer:
+        layer: _CircleLayer | None = self._layers.get(layer_group)
+
+        if layer is None:
+            layer = _CircleLayer(self.app, layer_group)
+            self._layers[layer_group] = layer
+
+        return layer
+
+    def __len__(self) -> int:
+        return sum(len(layer) for layer in self._layers.values())
@@ -0,0 +1,29 @@
+from bisect import bisect_left
+from dataclasses import dataclass
+from typing import Tuple
+
+
+@dataclass(frozen=True, slots=True)
+class LevelOfDetail:
+    segments: Tuple[int, ...] = (8, 12, 16, 24, 32, 48, 64, 96, 128)
+    hysteresis: float = 0.15
+
+    def __post_init__(self) -> None:
+        if not self.segments:
+            raise ValueError("At least one level of detail is required")
+
+        if list(self.segments) != sorted(set(self.segments)):
+            raise ValueError("Segment counts must be strictly increasing")
+
+        if not 0 <= self.hysteresis < 1:
+            raise ValueError("Hysteresis must be between 0 and 1")
+
+    def level(self, desired: float, current: int | None = None) -> int:
+        if current is not None:
+            lower: float = self.segments[current - 1] if current > 0 else 0
+            upper: float = self.segments[current] if current < len(self.segments) - 1 else float("inf")
+
+            if lower * (1 - self.hysteresis) < desired <= upper * (1 + self.hysteresis):
+                return current
+
+        return min(bisect_left(self.segments, desired), len(self.segments) - 1)
@@ -1,9 +1,10 @@
 from abc import ABC, abstractmethod
-from dataclasses import dataclass
-from typing import Any, TYPE_CHECKING, TypeAlias, Callable, TypeVar
+from dataclasses import dataclass, fields
+from typing import Any, TYPE_CHECKING, TypeAlias, Callable, TypeVar, Tuple, Sequence
 
 from simpli.enums import LayerGroup
 from simpli.interfaces import AppDependant, Identifiable
+from simpli.utils import Vector
 
 if TYPE_CHECKING:
     from simpli import Simpli
@@ -30,7 +31,7 @@ class Shape(AppDependant, Identifiable, ABC):
         self._previous_visible = self.visible
         self._previous_layer_group = LayerGroup(self.layer_group.value)
 
-        self._base = self.create()
+        self._base = self.create_base()
 
     @property
     @abstractmethod
@@ -45,6 +46,10 @@ class Shape(AppDependant, Identifiable, ABC):
     def update(self) -> None:
         raise NotImplementedError
 
+    @property
+    def bounds(self) -> Tuple[Vector, float] | None:
+        return None
+
     @property
     def app(self) -> Simpli:
         return self._app
@@ -65,5 +70,39 @@ class Shape(AppDependant, Identifiable, ABC):
 
         self._identifier = identifier
 
+    def create_base(self) -> Any:
+        if self.app.headless or self.app.shapes.deferring:
+            return None
+
+        return self.create()
+
+    def hide(self) -> None:
+        self.visible = False
+
+        if self._base is not None and self._previous_visible:
+            self._base.visible = False
+
+        self._previous_visible = False
+
+    @classmethod
+    def snapshot_fields(cls) -> Tuple[str, ...]:
+        return tuple(
+            field.name for field in fields(cls)
+            if field.init and not field.name.startswith("_") and field.name != "visible"
+        )
+
+    @classmethod
+    def rebuild_many(cls, shapes: Sequence['Shape']) -> None:
+        for shape in shapes:
+            shape.rebuild()
+
+    def rebuild(self) -> None:
+        self.remove()
+        self._base = self.create_base()
+
+        if self._base is not None:
+            self._base.visible = self.visible
+
     def remove(self) -> None:
-        self._base.delete()
+        if self._base is not None:
+            self._base.delete()
@@ -1,12 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import Type, TYPE_CHECKING, Any, Iterable, TypeVar
+from contextlib import contextmanager
+from itertools import chain, islice
+from threading import Lock
+from typing import Type, TYPE_CHECKING, Any, Iterable, TypeVar, Dict, List, Set, Tuple, Iterator, Sequence
 
 from simpli.interfaces import AppDependant
 from simpli.shapes import Shape
-from simpli.utils import Holder
+from simpli.utils import Holder, Vector, AbstractSpatialIndex, SpatialHash
 
 if TYPE_CHECKING:
     from simpli import Simpli
+    from simpli.entities import AbstractEntity
 else:
     Simpli = Any
     AbstractEntity = Any
@@ -16,13 +20,65 @@ _ST = TypeVar("_ST", bound=Shape)
 
 class AbstractShapeHolder(AppDependant, ABC):
     @abstractmethod
-    def new(self, shape_type: Type[_ST], **kwargs: Any) -> _ST:
+    def new(self, shape_type: Type[_ST], *, watch: AbstractEntity | None = None, **kwargs: Any) -> _ST:
+        raise NotImplementedError
+
+    @abstractmethod
+    def new_many(
+            self,
+            shape_type: Type[_ST],
+            count: int,
+            *,
+            watch: Sequence[AbstractEntity | None] | None = None,
+            **columns: Any,
+    ) -> List[_ST]:
         raise NotImplementedError
 
     @abstractmethod
     def remove(self, identifier: int) -> None:
         raise NotImplementedError
 
+    @abstractmethod
+    def watched(self, identifier: int) -> AbstractEntity | None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def deferring(self) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def deferred(self) -> Iterator[None]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_dirty(self, shape: Shape) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def mark_all_dirty(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def take_dirty(self) -> Iterable[Shape]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def schedule_rebuild(self, shape: Shape) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def take_rebuilds(self, limit: int) -> List[Shape]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _entity_changed(self, entity: AbstractEntity) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def _entity_removed(self, entity: AbstractEntity) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def __getitem__(self, identifier: int) -> Shape:
         raise NotImplementedError
@@ -48,17 +104,292 @@ class AbstractShapeHolder(AppDependant, ABC):
 
 
 class ShapeHolder(AbstractShapeHolder):
-    def __init__(self, *, app: Simpli) -> None:
+    def __init__(self, *, app: Simpli, cell_size: float = 256) -> None:
         super().__init__(app=app)
         self._shapes: Holder[Shape] = Holder()
+        self._polled: Set[int] = set()
+        self._watchers: Dict[AbstractEntity, List[int]] = {}
+        self._watched: Dict[int, AbstractEntity] = {}
+        self._dirty: Dict[int, int] = {}
+        self._dirty_lock: Lock = Lock()
+        self._rendered_tick: int = 0
+        self._all_dirty: bool = False
+        self._rebuilds: Dict[int, None] = {}
+
+        self._bounds_index: AbstractSpatialIndex = SpatialHash(cell_size)
+        self._bounds: Dict[int, Tuple[Vector, float]] = {}
+        self._max_radius: float = 0
+        self._unbounded: Set[int] = set()
+        self._visible: Set[int] = set()
+        self._view: Tuple[Vector, Vector] | None = None
 
-    def new(self, shape_type: Type[_ST], **kwargs: Any) -> _ST:
+        self._deferring: int = 0
+        self._unbuilt: Set[int] = set()
+        self._unindexed: Dict[int, None] = {}
+
+    def new(self, shape_type: Type[_ST], *, watch: AbstractEntity | None = None, **kwargs: Any) -> _ST:
         shape: _ST = shape_type(_app=self.app, **kwargs)
-        self._shapes.add(shape)
+        identifier: int = self._shapes.add(shape)
+
+        if watch is None:
+            self._polled.add(identifier)
+        else:
+            self._watchers.setdefault(watch, []).append(identifier)
+            self._watched[identifier] = watch
+
+        if self.deferring and not self.app.headless:
+            self._unbuilt.add(identifier)
+            self._unindexed[identifier] = None
+        else:
+            self._classify(identifier, None if self.app.headless else shape.bounds)
+
+        self.mark_dirty(shape)
         return shape
 
+    def new_many(
+            self,
+            shape_type: Type[_ST],
+            count: int,
+            *,
+            watch: Sequence[AbstractEntity | None] | None = None,
+            **columns: Any,
+    ) -> List[_ST]:
+        if count < 0:
+            raise ValueError("Count cannot be negative")
+
+        if watch is None:
+            watch = [None] * count
+        elif len(watch) != count:
+            raise ValueError(f"Watch has {len(watch)} values, expected {count}")
+
+        for name, column in columns.items():
+            if not isinstance(column, (list, tuple)):
+                columns[name] = [column] * count
+            elif len(column) != count:
+                raise ValueError(f"Column \"{name}\" has {len(column)} values, expected {count}")
+
+        app: Simpli = self.app
+        shapes: List[_ST] = [
+            shape_type(_app=app, **dict(zip(columns, row))) for row in zip(*columns.values())
+        ] if columns else [shape_type(_app=app) for _ in range(count)]
+        identifiers: List[int] = self._shapes.add_many(shapes)
+
+        for identifier, entity in zip(identifiers, watch):
+            if entity is None:
+                self._polled.add(identifier)
+            else:
+                self._watchers.setdefault(entity, []).append(identifier)
+                self._watched[identifier] = entity
+
+        if app.headless:
+            for identifier in identifiers:
+                self._classify(identifier, None)
+
+            return shapes
+
+        if self.deferring:
+            self._unbuilt.update(identifiers)
+            self._unindexed.update(dict.fromkeys(identifiers))
+        else:
+            for identifier, shape in zip(identifiers, shapes):
+                self._classify(identifier, shape.bounds)
+
+        with self._dirty_lock:
+            self._dirty.update(dict.fromkeys(identifiers, app.ticks))
+
+        return shapes
+
     def remove(self, identifier: int) -> Shape:
-        return self._shapes.remove(identifier)
+        shape: Shape = self._shapes.remove(identifier)
+        self._polled.discard(identifier)
+
+        with self._dirty_lock:
+            self._dirty.pop(identifier, None)
+            self._rebuilds.pop(identifier, None)
+
+        self._bounds_index.discard(identifier)
+        self._bounds.pop(identifier, None)
+        self._unbounded.discard(identifier)
+        self._visible.discard(identifier)
+        self._unbuilt.discard(identifier)
+        self._unindexed.pop(identifier, None)
+
+        entity: AbstractEntity | None = self._watched.pop(identifier, None)
+
+        if entity is not None:
+            watchers: List[int] = self._watchers[entity]
+            watchers.remove(identifier)
+
+            if not watchers:
+                del self._watchers[entity]
+
+        shape.remove()
+        return shape
+
+    def watched(self, identifier: int) -> AbstractEntity | None:
+        return self._watched.get(identifier)
+
+    @property
+    def deferring(self) -> bool:
+        return self._deferring > 0
+
+    @contextmanager
+    def deferred(self) -> Iterator[None]:
+        self._deferring += 1
+
+        try:
+            yield
+        finally:
+            self._deferring -= 1
+
+    def mark_dirty(self, shape: Shape) -> None:
+        if not self.app.headless:
+            with self._dirty_lock:
+                self._dirty[shape.identifier] = self.app.ticks
+
+    def mark_all_dirty(self) -> None:
+        self._all_dirty = not self.app.headless
+
+    def take_dirty(self) -> Iterable[Shape]:
+        with self._dirty_lock:
+            oldest: int = self._rendered_tick - 1
+            self._rendered_tick = self.app.ticks
+
+            for identifier in [identifier for identifier, tick in self._dirty.items() if tick < oldest]:
+                del self._dirty[identifier]
+
+            dirty: List[int] = list(self._dirty)
+
+        unindexed: Dict[int, None] = self._unindexed
+        self._unindexed = {}
+
+        for identifier in unindexed:
+            self._classify(identifier, self._shapes[identifier].bounds)
+
+        changed: List[int] = [
+            identifier for identifier in dict.fromkeys(chain(self._polled, dirty, unindexed))
+            if identifier not in self._unbounded
+        ]
+
+        for identifier in changed:
+            self._index(identifier, self._shapes[identifier].bounds)
+
+        entering, leaving = self._cull(changed)
+
+        for identifier in leaving:
+            self._shapes[identifier].hide()
+
+        for identifier in entering:
+            self._shapes[identifier].visible = True
+
+        if self._all_dirty:
+            self._all_dirty = False
+            return self._build(chain(self._unbounded, self._visible))
+
+        updated: Dict[int, None] = dict.fromkeys(entering)
+
+        for identifier in chain(self._polled, dirty):
+            if identifier in self._visible or identifier in self._unbounded:
+                updated[identifier] = None
+
+        return self._build(updated)
+
+    def schedule_rebuild(self, shape: Shape) -> None:
+        if not self.app.headless:
+            with self._dirty_lock:
+                self._rebuilds[shape.identifier] = None
+
+    def take_rebuilds(self, limit: int) -> List[Shape]:
+        with self._dirty_lock:
+            identifiers: List[int] = list(islice(self._rebuilds, limit))
+
+            for identifier in identifiers:
+                del self._rebuilds[identifier]
+
+        return [self._shapes[identifier] for identifier in identifiers]
+
+    def _entity_changed(self, entity: AbstractEntity) -> None:
+        watchers: List[int] | None = self._watchers.get(entity)
+
+        if watchers is None or self.app.headless:
+            return
+
+        ticks: int = self.app.ticks
+
+        with self._dirty_lock:
+            for identifier in watchers:
+                self._dirty[identifier] = ticks
+
+    def _entity_removed(self, entity: AbstractEntity) -> None:
+        for identifier in self._watchers.pop(entity, ()):
+            del self._watched[identifier]
+
+    def _build(self, identifiers: Iterable[int]) -> List[Shape]:
+        shapes: List[Shape] = [self._shapes[identifier] for identifier in identifiers]
+
+        if self._unbuilt:
+            unbuilt: Dict[Type[Shape], List[Shape]] = {}
+
+            for shape in shapes:
+                if shape.identifier in self._unbuilt:
+                    self._unbuilt.discard(shape.identifier)
+                    unbuilt.setdefault(type(shape), []).append(shape)
+
+            for shape_type, shape_group in unbuilt.items():
+                shape_type.rebuild_many(shape_group)
+
+        return shapes
+
+    def _classify(self, identifier: int, bounds: Tuple[Vector, float] | None) -> None:
+        if bounds is None:
+            self._unbounded.add(identifier)
+        else:
+            self._index(identifier, bounds)
+            self._visible.add(identifier)
+
+    def _index(self, identifier: int, bounds: Tuple[Vector, float]) -> None:
+        self._bounds_index.insert(identifier, bounds[0])
+        self._bounds[identifier] = bounds
+        self._max_radius = max(self._max_radius, bounds[1])
+
+    def _cull(self, changed: List[int]) -> Tuple[Set[int], Set[int]]:
+        view: Tuple[Vector, Vector] = self.app.camera.view_bounds
+        low, high = view
+
+        if view != self._view:
+            self._view = view
+            margin: Vector = Vector(self._max_radius, self._max_radius)
+            visible: Set[int] = {
+                identifier for identifier in self._bounds_index.query_rectangle(low - margin, high + margin)
+                if self._in_view(identifier, low, high)
+            }
+
+            entering: Set[int] = visible - self._visible
+            leaving: Set[int] = self._visible - visible
+            self._visible = visible
+            return entering, leaving
+
+        entering: Set[int] = set()
+        leaving: Set[int] = set()
+
+        for identifier in changed:
+            if self._in_view(identifier, low, high):
+                if identifier not in self._visible:
+                    entering.add(identifier)
+                    self._visible.add(identifier)
+            elif identifier in self._visible:
+                leaving.add(identifier)
+                self._visible.discard(identifier)
+
+        return entering, leaving
+
+    def _in_view(self, identifier: int, low: Vector, high: Vector) -> bool:
+        position, radius = self._bounds[identifier]
+
+        return (
+                low.x - radius < position.x < high.x + radius
+                and low.y - radius < position.y < high.y + radius
+        )
 
     def __getitem__(self, identifier: int) -> Shape:
         try:
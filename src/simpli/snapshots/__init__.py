@@ -0,0 +1,6 @@
+from ._snapshotter import AbstractSnapshotter, Snapshotter
+
+__all__ = [
+    AbstractSnapshotter,
+    Snapshotter,
+]
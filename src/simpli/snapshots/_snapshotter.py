@@ -0,0 +1,590 @@
+from abc import ABC, abstractmethod
+from array import array
+from dataclasses import MISSING, fields, is_dataclass
+from enum import Enum
+from importlib import import_module
+from json import dumps, loads
+from mmap import ACCESS_READ, mmap
+from struct import Struct
+from sys import byteorder
+from typing import TYPE_CHECKING, Any, Dict, List, Sequence, Set, Tuple, Type
+
+from simpli.components import Component, PositionComponent, VelocityComponent
+from simpli.entities import AbstractEntity, Entity
+from simpli.interfaces import AppDependant
+from simpli.shapes import Shape
+from simpli.utils import Vector, Color, Value, FieldBinding
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+else:
+    Simpli = Any
+
+_MAGIC: bytes = b"SIMPLI\x00\x01"
+_LENGTH: Struct = Struct("<Q")
+_ALIGNMENT: int = 8
+_NONE: int = -1
+
+_Kind = Tuple[str, ...]
+_Fields = Tuple[Tuple[str, _Kind], ...]
+
+_CODES: Dict[str, str] = {
+    "bool": "B",
+    "int": "q",
+    "enum": "q",
+    "float": "d",
+    "str": "q",
+    "vector": "dd",
+    "color": "dddd",
+    "shape": "q",
+    "none": "",
+    "default": "",
+}
+
+_FACTOR_CODES: Dict[str, str] = {
+    "none": "",
+    "float": "d",
+    "vector": "dd",
+}
+
+
+def _path(value: type) -> str:
+    return f"{value.__module__}:{value.__qualname__}"
+
+
+def _import(path: str, base: type) -> type:
+    module, _, qualname = path.partition(":")
+    value: Any = import_module(module)
+
+    for name in qualname.split("."):
+        value = getattr(value, name)
+
+    if not isinstance(value, type) or not issubclass(value, base):
+        raise TypeError(f"\"{path}\" is not a {base.__name__} type")
+
+    return value
+
+
+def _defaults(value_type: type) -> Dict[str, Any]:
+    if not is_dataclass(value_type):
+        return {}
+
+    return {field.name: field.default for field in fields(value_type) if field.default is not MISSING}
+
+
+def _codes(kind: _Kind) -> str:
+    if kind[0] == "binding":
+        return "q" + _FACTOR_CODES[kind[3]] + _FACTOR_CODES[kind[4]]
+
+    return _CODES[kind[0]]
+
+
+def _component_types() -> List[Type[Component]]:
+    pending: List[type] = [Component]
+    component_types: List[Type[Component]] = []
+
+    while pending:
+        component_type: type = pending.pop()
+        pending.extend(component_type.__subclasses__())
+
+        if "tag" in component_type.__dict__:
+            component_types.append(component_type)
+
+    return component_types
+
+
+class _ColumnWriter:
+    def __init__(self) -> None:
+        self._blobs: List[bytes] = []
+        self._columns: List[Tuple[str, int, int]] = []
+        self._size: int = 0
+
+    @property
+    def columns(self) -> List[Tuple[str, int, int]]:
+        return self._columns
+
+    def add(self, code: str, values: List[Any]) -> int:
+        blob: bytes = array(code, values).tobytes()
+        padding: int = -len(blob) % _ALIGNMENT
+
+        self._columns.append((code, self._size, len(values)))
+        self._blobs.append(blob + bytes(padding))
+        self._size += len(blob) + padding
+        return len(self._columns) - 1
+
+    def write(self, file: Any) -> None:
+        for blob in self._blobs:
+            file.write(blob)
+
+
+class _SnapshotWriter:
+    def __init__(self, *, app: Simpli) -> None:
+        self._app: Simpli = app
+        self._entities: List[AbstractEntity] = list(app.entities)
+        self._rows: Dict[int, int] = {entity.identifier: row for row, entity in enumerate(self._entities)}
+        self._types: Dict[str, int] = {}
+        self._strings: Dict[str, int] = {}
+        self._shapes: Dict[int, int] = {}
+        self._shape_groups: Dict[Tuple[type, _Fields], List[Tuple[int, int, Tuple[Any, ...]]]] = {}
+        self._component_groups: Dict[Tuple[type, _Fields], List[Tuple[int, Tuple[Any, ...]]]] = {}
+        self._schemas: Dict[type, Tuple[Tuple[str, ...], Tuple[Any, ...]]] = {}
+
+    def write(self, path: str) -> None:
+        entities: List[AbstractEntity] = self._entities
+        rows: Dict[int, int] = self._rows
+        component_types: List[Type[Component]] = _component_types()
+
+        for row, entity in enumerate(entities):
+            for component_type in component_types:
+                if not entity.components.has(component_type):
+                    continue
+
+                component: Component = entity.components.get(component_type)
+                encoded, values = self._fields(component_type, component)
+
+                self._component_groups.setdefault((component_type, encoded), []).append(
+                    (row, self._save_shapes(encoded, values)),
+                )
+
+        writer: _ColumnWriter = _ColumnWriter()
+        groups: List[Dict[str, Any]] = []
+
+        entity_columns: List[int] = [
+            writer.add("Q", [entity.identifier for entity in entities]),
+            writer.add("q", [self._type(type(entity), Entity) for entity in entities]),
+            writer.add("q", [self._string(getattr(entity, "name", None)) for entity in entities]),
+            writer.add("q", [
+                _NONE if entity.parent is None else rows[entity.parent.identifier] for entity in entities
+            ]),
+        ]
+
+        for (shape_type, encoded), members in self._shape_groups.items():
+            groups.append({
+                "kind": "shape",
+                "type": self._type(shape_type, Shape),
+                "fields": encoded,
+                "rows": len(members),
+                "columns": [
+                    writer.add("q", [index for index, _, _ in members]),
+                    writer.add("q", [watch for _, watch, _ in members]),
+                    *self._write_fields(writer, encoded, [values for _, _, values in members]),
+                ],
+            })
+
+        for (component_type, encoded), members in self._component_groups.items():
+            groups.append({
+                "kind": "component",
+                "type": self._type(component_type, Component),
+                "fields": encoded,
+                "rows": len(members),
+                "columns": [
+                    writer.add("q", [row for row, _ in members]),
+                    *self._write_fields(writer, encoded, [values for _, values in members]),
+                ],
+            })
+
+        header: bytes = dumps({
+            "byteorder": byteorder,
+            "entities": len(entities),
+            "shapes": len(self._shapes),
+            "types": list(self._types),
+            "strings": list(self._strings),
+            "entity_columns": entity_columns,
+            "columns": writer.columns,
+            "groups": groups,
+        }, separators=(",", ":")).encode()
+        header += b" " * (-(len(_MAGIC) + _LENGTH.size + len(header)) % _ALIGNMENT)
+
+        with open(path, "wb") as file:
+            file.write(_MAGIC)
+            file.write(_LENGTH.pack(len(header)))
+            file.write(header)
+            writer.write(file)
+
+    def _save_shapes(self, encoded: _Fields, values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+        return tuple(
+            self._save_shape(value) if kind[0] == "shape" else value
+            for (_, kind), value in zip(encoded, values)
+        )
+
+    def _save_shape(self, shape: Shape) -> int:
+        if shape.identifier in self._shapes:
+            return self._shapes[shape.identifier]
+
+        index: int = len(self._shapes)
+        self._shapes[shape.identifier] = index
+
+        shape_type: Type[Shape] = type(shape)
+        encoded, values = self._fields(shape_type, shape)
+        watch: AbstractEntity | None = self._app.shapes.watched(shape.identifier)
+
+        self._shape_groups.setdefault((shape_type, encoded), []).append((
+            index,
+            _NONE if watch is None else self._rows[watch.identifier],
+            self._save_shapes(encoded, values),
+        ))
+        return index
+
+    def _fields(self, owner: type, value: Any) -> Tuple[_Fields, Tuple[Any, ...]]:
+        try:
+            names, defaults = self._schemas[owner]
+        except KeyError:
+            names, defaults = self._schemas[owner] = self._schema(owner)
+
+        values: Tuple[Any, ...] = tuple(getattr(value, name) for name in names)
+        encoded: _Fields = tuple(
+            (name, self._kind(field_value, default))
+            for name, field_value, default in zip(names, values, defaults)
+        )
+        return encoded, values
+
+    @staticmethod
+    def _schema(owner: Type[Component] | Type[Shape]) -> Tuple[Tuple[str, ...], Tuple[Any, ...]]:
+        names: Tuple[str, ...] = owner.snapshot_fields()
+        defaults: Dict[str, Any] = _defaults(owner)
+        return names, tuple(defaults.get(name, MISSING) for name in names)
+
+    def _kind(self, value: Any, default: Any = MISSING) -> _Kind:
+        if isinstance(value, FieldBinding):
+            return (
+                "binding",
+                _path(value.component_type),
+                value.field,
+                self._factor(value.offset),
+                self._factor(value.scale),
+            )
+
+        if isinstance(value, Value):
+            raise TypeError(f"Cannot snapshot computed value of type \"{type(value).__name__}\"")
+
+        if isinstance(value, Shape):
+            return ("shape",)
+
+        if value is None:
+            return ("none",)
+        if isinstance(value, bool):
+            return ("bool",)
+        if isinstance(value, Enum):
+            return "enum", _path(type(value))
+        if isinstance(value, int):
+            return ("int",)
+        if isinstance(value, float):
+            return ("float",)
+        if isinstance(value, str):
+            return ("str",)
+        if isinstance(value, Vector):
+            return ("vector",)
+        if isinstance(value, Color):
+            return ("color",)
+        if value is default:
+            return ("default",)
+
+        raise TypeError(f"Cannot snapshot value of type \"{type(value).__name__}\"")
+
+    @staticmethod
+    def _factor(value: Any) -> str:
+        if value is None:
+            return "none"
+        if isinstance(value, Vector):
+            return "vector"
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            return "float"
+
+        raise TypeError(f"Cannot snapshot binding factor of type \"{type(value).__name__}\"")
+
+    def _write_fields(self, writer: _ColumnWriter, encoded: _Fields, rows: List[Tuple[Any, ...]]) -> List[int]:
+        columns: List[int] = []
+
+        for position, (_, kind) in enumerate(encoded):
+            values: List[Any] = [row[position] for row in rows]
+            codes: str = _codes(kind)
+
+            if not codes:
+                continue
+
+            for code, column in zip(codes, self._encode(kind, values)):
+                columns.append(writer.add(code, column))
+
+        return columns
+
+    def _encode(self, kind: _Kind, values: List[Any]) -> List[List[Any]]:
+        if kind[0] == "binding":
+            columns: List[List[Any]] = [[self._rows[value.entity.identifier] for value in values]]
+            columns.extend(self._encode_factors(kind[3], [value.offset for value in values]))
+            columns.extend(self._encode_factors(kind[4], [value.scale for value in values]))
+            return columns
+
+        if kind[0] == "float":
+            return [values]
+        if kind[0] in ("bool", "int", "enum", "shape"):
+            return [[int(value) for value in values]]
+        if kind[0] == "str":
+            return [[self._string(value) for value in values]]
+        if kind[0] == "vector" or kind[0] == "color":
+            return list(map(list, zip(*(value.as_tuple for value in values))))
+
+        raise TypeError(f"Cannot encode \"{kind[0]}\" columns")
+
+    @staticmethod
+    def _encode_factors(kind: str, values: List[Any]) -> List[List[Any]]:
+        if kind == "vector":
+            return list(map(list, zip(*(value.as_tuple for value in values))))
+        if kind == "float":
+            return [[float(value) for value in values]]
+
+        return []
+
+    def _type(self, value_type: type, base: type) -> int:
+        if not issubclass(value_type, base):
+            raise TypeError(f"\"{value_type.__name__}\" is not a {base.__name__} type")
+
+        return self._types.setdefault(_path(value_type), len(self._types))
+
+    def _string(self, value: str | None) -> int:
+        if value is None:
+            return _NONE
+
+        return self._strings.setdefault(value, len(self._strings))
+
+
+class _SnapshotReader:
+    def __init__(self, *, app: Simpli, header: Dict[str, Any], columns: List[memoryview]) -> None:
+        self._app: Simpli = app
+        self._header: Dict[str, Any] = header
+        self._columns: List[memoryview] = columns
+        self._types: List[str] = header["types"]
+        self._strings: List[str] = header["strings"]
+        self._entities: List[Entity] = []
+        self._shapes: List[Shape | None] = [None] * header["shapes"]
+        self._bound: Set[int] = set()
+        self._kinematics: List[Tuple[Type[Component], List[Entity], np.ndarray]] = []
+
+    def read(self) -> Dict[int, AbstractEntity]:
+        app: Simpli = self._app
+        entities: List[Entity] = self._entities
+        identifiers, type_indices, names, parents = (self._columns[index] for index in self._header["entity_columns"])
+        groups: List[Dict[str, Any]] = self._header["groups"]
+        component_groups: List[Dict[str, Any]] = [group for group in groups if group["kind"] == "component"]
+        early: List[Dict[str, Any]] = []
+        late: List[Dict[str, Any]] = []
+
+        for group in component_groups:
+            if any(kind[0] == "shape" for _, kind in group["fields"]):
+                late.append(group)
+            else:
+                early.append(group)
+
+        app.entities.remove_many([entity.identifier for entity in app.entities])
+
+        if app.kinematics is not None:
+            self._bound = self._kinematic_rows(component_groups)
+
+        entity_types: Dict[int, type] = {index: _import(self._types[index], Entity) for index in set(type_indices)}
+
+        for type_index, name in zip(type_indices, names):
+            entity_type: Type[Entity] = entity_types[type_index]
+            entity: Entity = entity_type.__new__(entity_type)
+            Entity.__init__(entity, app=app, name=None if name == _NONE else self._strings[name])
+            entities.append(entity)
+
+        with app.shapes.deferred(), app.entities._batched():
+            app.entities._reserve(len(entities))
+
+            for group in early:
+                self._restore_components(group)
+
+            for entity in entities:
+                app.entities._register(entity)
+
+            for entity, parent in zip(entities, parents):
+                if parent != _NONE:
+                    entities[parent].set_child(entity)
+
+            for group in groups:
+                if group["kind"] == "shape":
+                    self._restore_shapes(group)
+
+            for group in late:
+                self._restore_components(group)
+
+        for component_type, members, values in self._kinematics:
+            if component_type is PositionComponent:
+                app.kinematics._restore_positions(members, values)
+            else:
+                app.kinematics._restore_velocities(members, values)
+
+        app.invalidate_bindings()
+        return dict(zip(identifiers, entities))
+
+    def _kinematic_rows(self, groups: List[Dict[str, Any]]) -> Set[int]:
+        rows: Dict[type, Set[int]] = {PositionComponent: set(), VelocityComponent: set()}
+
+        for group in groups:
+            component_type: Type[Component] = _import(self._types[group["type"]], Component)
+
+            if component_type in rows:
+                rows[component_type].update(self._columns[group["columns"][0]])
+
+        return rows[PositionComponent] & rows[VelocityComponent]
+
+    def _restore_shapes(self, group: Dict[str, Any]) -> None:
+        shape_type: Type[Shape] = _import(self._types[group["type"]], Shape)
+        indices, watches, *field_columns = (self._columns[index] for index in group["columns"])
+        entities: List[Entity] = self._entities
+
+        rows: List[Dict[str, Any]] = self._read_fields(group, field_columns)
+        columns: Dict[str, List[Any]] = {name: [row[name] for row in rows] for name in rows[0]} if rows else {}
+        shapes: List[Shape] = self._app.shapes.new_many(
+            shape_type,
+            len(indices),
+            watch=[None if watch == _NONE else entities[watch] for watch in watches],
+            **columns,
+        )
+
+        for index, shape in zip(indices, shapes):
+            self._shapes[index] = shape
+
+    def _restore_components(self, group: Dict[str, Any]) -> None:
+        component_type: Type[Component] = _import(self._types[group["type"]], Component)
+        rows, *field_columns = (self._columns[index] for index in group["columns"])
+
+        kinds: List[_Kind] = [kind for _, kind in group["fields"]]
+
+        if self._bound and component_type in (PositionComponent, VelocityComponent) and kinds == [["vector"]]:
+            self._restore_kinematic(component_type, group["fields"][0][0], rows, field_columns)
+            return
+
+        for row, kwargs in zip(rows, self._read_fields(group, field_columns)):
+            self._entities[row].components.add(component_type, **kwargs)
+
+    def _restore_kinematic(
+            self,
+            component_type: Type[Component],
+            name: str,
+            rows: memoryview,
+            columns: List[memoryview],
+    ) -> None:
+        bound: Set[int] = self._bound
+        members: List[Entity] = [self._entities[row] for row in rows]
+
+        for row, entity, x, y in zip(rows, members, *columns):
+            if row in bound:
+                entity.components.add(component_type)
+            else:
+                entity.components.add(component_type, **{name: Vector(x, y)})
+
+        self._kinematics.append((component_type, members, np.column_stack(columns)))
+
+    def _read_fields(self, group: Dict[str, Any], columns: List[memoryview]) -> List[Dict[str, Any]]:
+        count: int = group["rows"]
+        values: List[Dict[str, Any]] = [{} for _ in range(count)]
+        position: int = 0
+
+        for name, kind in group["fields"]:
+            width: int = len(_codes(kind))
+            field_columns: List[memoryview] = columns[position:position + width]
+            position += width
+
+            decoded: Sequence[Any]
+
+            if kind[0] == "default":
+                continue
+            elif kind[0] == "none":
+                decoded = [None] * count
+            elif kind[0] == "bool":
+                decoded = [bool(value) for value in field_columns[0]]
+            elif kind[0] == "enum":
+                enum_type: Type[Enum] = _import(kind[1], Enum)
+                decoded = list(map(enum_type, field_columns[0]))
+            elif kind[0] == "str":
+                decoded = [self._strings[value] for value in field_columns[0]]
+            elif kind[0] == "vector":
+                decoded = list(map(Vector, *field_columns))
+            elif kind[0] == "color":
+                decoded = list(map(Color, *field_columns))
+            elif kind[0] == "shape":
+                decoded = [self._shapes[value] for value in field_columns[0]]
+            elif kind[0] == "binding":
+                decoded = self._read_bindings(kind, field_columns)
+            else:
+                decoded = field_columns[0]
+
+            for kwargs, value in zip(values, decoded):
+                kwargs[name] = value
+
+        return values
+
+    def _read_bindings(self, kind: _Kind, columns: List[memoryview]) -> List[FieldBinding]:
+        component_type: Type[Component] = _import(kind[1], Component)
+        offset_width: int = len(_FACTOR_CODES[kind[3]])
+        offsets: Sequence[Any] = self._read_factors(kind[3], columns[1:1 + offset_width], len(columns[0]))
+        scales: Sequence[Any] = self._read_factors(kind[4], columns[1 + offset_width:], len(columns[0]))
+
+        return [
+            FieldBinding(self._entities[row], component_type, kind[2], scale=scale, offset=offset)
+            for row, offset, scale in zip(columns[0], offsets, scales)
+        ]
+
+    @staticmethod
+    def _read_factors(kind: str, columns: List[memoryview], count: int) -> Sequence[Any]:
+        if kind == "vector":
+            return list(map(Vector, columns[0], columns[1]))
+        if kind == "float":
+            return columns[0]
+
+        return [None] * count
+
+
+class AbstractSnapshotter(AppDependant, ABC):
+    @abstractmethod
+    def save(self, path: str) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def load(self, path: str) -> Dict[int, AbstractEntity]:
+        raise NotImplementedError
+
+    def __init__(self, *, app: Simpli) -> None:
+        self._app: Simpli = app
+
+    @property
+    def app(self) -> Simpli:
+        return self._app
+
+
+class Snapshotter(AbstractSnapshotter):
+    def save(self, path: str) -> None:
+        _SnapshotWriter(app=self.app).write(path)
+
+    def load(self, path: str) -> Dict[int, AbstractEntity]:
+        with open(path, "rb") as file, mmap(file.fileno(), 0, access=ACCESS_READ) as mapped:
+            if mapped[:len(_MAGIC)] != _MAGIC:
+                raise ValueError(f"\"{path}\" is not a simpli snapshot")
+
+            start: int = len(_MAGIC) + _LENGTH.size
+            length: int = _LENGTH.unpack_from(mapped, len(_MAGIC))[0]
+            header: Dict[str, Any] = loads(mapped[start:start + length])
+
+            if header["byteorder"] != byteorder:
+                raise ValueError(f"Snapshot was written on a {header['byteorder']} endian machine")
+
+            data: int = start + length
+            columns: List[memoryview] = []
+
+            with memoryview(mapped) as view:
+                for code, offset, count in header["columns"]:
+                    size: int = count * array(code).itemsize
+
+                    with view[data + offset:data + offset + size] as raw:
+                        columns.append(raw.cast(code))
+
+                try:
+                    return _SnapshotReader(app=self.app, header=header, columns=columns).read()
+                finally:
+                    for column in columns:
+                        column.release()
@@ -1,29 +1,45 @@
-from simpli.components import VelocityComponent, PositionComponent, AirFrictionComponent, RepulsionComponent, \
-    AttractionComponent
+from typing import Tuple, Type
+
+from simpli.components import Component, VelocityComponent, PositionComponent, AirFrictionComponent, \
+    RepulsionComponent, AttractionComponent
 from simpli.utils import Vector, safe_power
-from ._system import System, TickSystem
+from ._system import System, TickSystem, RenderSystem
 from ._system_holder import AbstractSystemHolder, SystemHolder
 
 
-class ShapeUpdateSystem(TickSystem):
+class ShapeUpdateSystem(RenderSystem):
     @classmethod
     def tag(cls) -> str:
         return "shape_update"
 
-    def tick(self) -> None:
-        for shape in self.app.shapes:
+    def render(self) -> None:
+        if self.app.headless:
+            return
+
+        for shape in self.app.shapes.take_dirty():
             shape.update()
 
+        for shape in self.app.shapes.take_rebuilds(self.app.tessellation_budget):
+            shape.rebuild()
+
 
 class VelocitySystem(TickSystem):
     @classmethod
     def tag(cls) -> str:
         return "velocity"
 
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...]:
+        return (VelocityComponent,)
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...]:
+        return (PositionComponent,)
+
     def tick(self) -> None:
-        for entity in self.app.entities.by_components(PositionComponent, VelocityComponent):
-            velocity: Vector = entity.components.get(VelocityComponent).velocity
-            entity.components.get(PositionComponent).position += velocity
+        for position, velocity in self.app.entities.query(PositionComponent, VelocityComponent):
+            if velocity.velocity:
+                position.position += velocity.velocity * self.app.tick_scale
 
 
 class AirFrictionSystem(TickSystem):
@@ -31,16 +47,78 @@ class AirFrictionSystem(TickSystem):
     def tag(cls) -> str:
         return "air_friction"
 
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...]:
+        return (AirFrictionComponent,)
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...]:
+        return (VelocityComponent,)
+
     def tick(self) -> None:
-        for entity in self.app.entities.by_components(VelocityComponent, AirFrictionComponent):
-            velocity: Vector = entity.components.get(VelocityComponent).velocity
-            air_friction: float = entity.components.get(AirFrictionComponent).air_friction
+        for velocity_component, air_friction_component in self.app.entities.query(
+                VelocityComponent,
+                AirFrictionComponent,
+        ):
+            velocity: Vector = velocity_component.velocity * (
+                    (1 - air_friction_component.air_friction) ** self.app.tick_scale
+            )
 
-            velocity *= 1 - air_friction
             if velocity.length_squared < 0.01:
                 velocity = Vector.zero()
 
-            entity.components.get(VelocityComponent).velocity = velocity
+            velocity_component.velocity = velocity
+
+
+class VectorizedVelocitySystem(TickSystem):
+    @classmethod
+    def tag(cls) -> str:
+        return "velocity"
+
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...]:
+        return (VelocityComponent,)
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...]:
+        return (PositionComponent,)
+
+    def tick(self) -> None:
+        self.app.kinematics.integrate()
+
+
+class VectorizedAirFrictionSystem(TickSystem):
+    @classmethod
+    def tag(cls) -> str:
+        return "air_friction"
+
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...]:
+        return (AirFrictionComponent,)
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...]:
+        return (VelocityComponent,)
+
+    def tick(self) -> None:
+        self.app.kinematics.apply_air_friction()
+
+
+class PairwiseInteractionSystem(TickSystem):
+    @classmethod
+    def tag(cls) -> str:
+        return "pairwise_interaction"
+
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...]:
+        return (PositionComponent, AttractionComponent, RepulsionComponent)
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...]:
+        return (VelocityComponent,)
+
+    def tick(self) -> None:
+        self.app.interactions.apply()
 
 
 class AttractionSystem(TickSystem):
@@ -48,6 +126,14 @@ class AttractionSystem(TickSystem):
     def tag(cls) -> str:
         return "attraction"
 
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...]:
+        return (PositionComponent, AttractionComponent)
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...]:
+        return (VelocityComponent,)
+
     def tick(self) -> None:
         for entity in self.app.entities.by_components(PositionComponent, AttractionComponent):
             position: Vector = entity.components.get(PositionComponent).position
@@ -65,7 +151,7 @@ class AttractionSystem(TickSystem):
                 distance: Vector = position - nearby_entity.components.get(PositionComponent).position
 
                 if distance.length_squared < 0.001:
-                    distance = Vector.random() * 0.1
+                    distance = Vector.random(self.app.rng("physics")) * 0.1
 
                 distance_ratio: float = distance.length / attraction.range
 
@@ -73,6 +159,7 @@ class AttractionSystem(TickSystem):
                         distance.normalized
                         * (1 - safe_power(distance_ratio, attraction.power_factor))
                         * attraction.strength
+                        * self.app.tick_scale
                 )
 
 
@@ -81,6 +168,14 @@ class RepulsionSystem(TickSystem):
     def tag(cls) -> str:
         return "repulsion"
 
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...]:
+        return (PositionComponent, RepulsionComponent)
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...]:
+        return (VelocityComponent,)
+
     def tick(self) -> None:
         for entity in self.app.entities.by_components(PositionComponent, RepulsionComponent):
             position: Vector = entity.components.get(PositionComponent).position
@@ -98,7 +193,7 @@ class RepulsionSystem(TickSystem):
                 distance: Vector = nearby_entity.components.get(PositionComponent).position - position
 
                 if distance.length_squared < 0.001:
-                    distance = Vector.random() * 0.1
+                    distance = Vector.random(self.app.rng("physics")) * 0.1
 
                 distance_ratio: float = distance.length / repulsion.range
 
@@ -106,12 +201,14 @@ class RepulsionSystem(TickSystem):
                         distance.normalized
                         * (1 - safe_power(distance_ratio, repulsion.power_factor))
                         * repulsion.strength
+                        * self.app.tick_scale
                 )
 
 
 __all__ = [
     System,
     TickSystem,
+    RenderSystem,
     AbstractSystemHolder,
     SystemHolder,
 ]
@@ -1,12 +1,14 @@
 from abc import ABC, abstractmethod
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, FrozenSet, Tuple, Type
 
 from simpli.interfaces import Tagged, Identifiable, AppDependant
 
 if TYPE_CHECKING:
     from simpli import Simpli
+    from simpli.components import Component
 else:
     Simpli = Any
+    Component = Any
 
 
 class System(AppDependant, Identifiable, Tagged, ABC):
@@ -15,6 +17,31 @@ class System(AppDependant, Identifiable, Tagged, ABC):
     def system_tag(cls) -> str:
         raise NotImplementedError
 
+    @classmethod
+    def reads(cls) -> Tuple[Type[Component], ...] | None:
+        return None
+
+    @classmethod
+    def writes(cls) -> Tuple[Type[Component], ...] | None:
+        return None
+
+    @classmethod
+    def conflicts_with(cls, other: Type['System']) -> bool:
+        reads, writes = cls.reads(), cls.writes()
+        other_reads, other_writes = other.reads(), other.writes()
+
+        if reads is None or writes is None or other_reads is None or other_writes is None:
+            return True
+
+        written: FrozenSet[str] = frozenset(component.tag() for component in writes)
+        other_written: FrozenSet[str] = frozenset(component.tag() for component in other_writes)
+
+        return not (
+            written.isdisjoint(other_written)
+            and written.isdisjoint(component.tag() for component in other_reads)
+            and other_written.isdisjoint(component.tag() for component in reads)
+        )
+
     def __init__(self, app: Simpli) -> None:
         self._app: Simpli = app
         self._identifier: int | None = None
@@ -48,3 +75,13 @@ class TickSystem(System, ABC):
     @classmethod
     def system_tag(cls) -> str:
         return "tick"
+
+
+class RenderSystem(System, ABC):
+    @abstractmethod
+    def render(self) -> None:
+        raise NotImplementedError
+
+    @classmethod
+    def system_tag(cls) -> str:
+        return "render"
@@ -1,6 +1,10 @@
 from abc import abstractmethod, ABC
 from collections import defaultdict
-from typing import Type, TypeVar, Iterable, TYPE_CHECKING, Any, Dict
+from concurrent.futures import Executor, ThreadPoolExecutor
+from os import cpu_count
+from sysconfig import get_config_var
+from typing import Type, TypeVar, Iterable, TYPE_CHECKING, Any, Callable, Dict, List, Sequence, Tuple
+from weakref import finalize
 
 from simpli.interfaces import AppDependant
 from simpli.systems import System
@@ -23,6 +27,33 @@ class AbstractSystemHolder(AppDependant, ABC):
     def by_system(self, system_type: Type[_TS]) -> Iterable[_TS]:
         raise NotImplementedError
 
+    @abstractmethod
+    def stages(self, system_type: Type[_TS]) -> Tuple[Tuple[_TS, ...], ...]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def execute(self, stage: Sequence[_TS], call: Callable[[_TS], Any]) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def close(self) -> None:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def workers(self) -> int:
+        raise NotImplementedError
+
+    @property
+    @abstractmethod
+    def deterministic(self) -> bool:
+        raise NotImplementedError
+
+    @deterministic.setter
+    @abstractmethod
+    def deterministic(self, value: bool) -> None:
+        raise NotImplementedError
+
     def __init__(self, *, app: Simpli) -> None:
         self._app: Simpli = app
 
@@ -32,9 +63,40 @@ class AbstractSystemHolder(AppDependant, ABC):
 
 
 class SystemHolder(AbstractSystemHolder):
-    def __init__(self, *, app: Simpli) -> None:
+    def __init__(self, *, app: Simpli, workers: int | None = None, deterministic: bool = False) -> None:
+        if workers is not None and workers < 1:
+            raise ValueError("At least one system worker is required")
+
+        if workers is None:
+            workers = (cpu_count() or 1) if get_config_var("Py_GIL_DISABLED") else 1
+
         super().__init__(app=app)
         self._systems: Dict[str, Holder[_TS]] = defaultdict(Holder)
+        self._stages: Dict[str, Tuple[Tuple[_TS, ...], ...]] = {}
+        self._workers: int = workers
+        self._deterministic: bool = deterministic
+        self._executor: Executor | None = None
+        self._finalizer: finalize | None = None
+
+    @property
+    def workers(self) -> int:
+        return self._workers
+
+    @property
+    def deterministic(self) -> bool:
+        return self._deterministic
+
+    @deterministic.setter
+    def deterministic(self, value: bool) -> None:
+        self._deterministic = value
+        self._stages.clear()
+
+    def close(self) -> None:
+        if self._finalizer is not None:
+            self._finalizer()
+
+        self._executor = None
+        self._finalizer = None
 
     def add(self, *systems: Type[_TS]) -> None:
         for system in systems:
@@ -42,6 +104,56 @@ class SystemHolder(AbstractSystemHolder):
 
     def _add(self, system: Type[_TS]) -> None:
         self._systems[system.system_tag()].add(system(self._app))
+        self._stages.pop(system.system_tag(), None)
 
     def by_system(self, system_type: Type[_TS]) -> Iterable[_TS]:
         return self._systems[system_type.system_tag()].__iter__()
+
+    def stages(self, system_type: Type[_TS]) -> Tuple[Tuple[_TS, ...], ...]:
+        system_tag: str = system_type.system_tag()
+        stages: Tuple[Tuple[_TS, ...], ...] | None = self._stages.get(system_tag)
+
+        if stages is None:
+            stages = self._schedule(tuple(self._systems[system_tag]))
+            self._stages[system_tag] = stages
+
+        return stages
+
+    def execute(self, stage: Sequence[_TS], call: Callable[[_TS], Any]) -> None:
+        if len(stage) == 1 or self._workers == 1 or self._deterministic:
+            for system in stage:
+                call(system)
+
+            return
+
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=self._workers, thread_name_prefix="simpli-system")
+            self._finalizer = finalize(self, self._executor.shutdown)
+
+        for _ in self._executor.map(call, stage):
+            pass
+
+    def _schedule(self, systems: Tuple[_TS, ...]) -> Tuple[Tuple[_TS, ...], ...]:
+        if self._deterministic:
+            return tuple((system,) for system in systems)
+
+        levels: List[int] = []
+        stages: List[List[_TS]] = []
+
+        for index, system in enumerate(systems):
+            level: int = max(
+                (
+                    levels[previous] + 1
+                    for previous in range(index)
+                    if type(system).conflicts_with(type(systems[previous]))
+                ),
+                default=0,
+            )
+            levels.append(level)
+
+            if level == len(stages):
+                stages.append([])
+
+            stages[level].append(system)
+
+        return tuple(tuple(stage) for stage in stages)
@@ -1,7 +1,11 @@
+from typing import Any
+
 from ._color import Color
 from ._holder import AbstractHolder, Holder
 from ._identifier_holder import AbstractIdentifierHolder, IdentifierHolder
+from ._spatial_hash import AbstractSpatialIndex, SpatialHash
 from ._value import Value
+from ._binding import Binding, FieldBinding, resolve
 from ._vector import Vector
 
 
@@ -10,12 +14,27 @@ def safe_power(value: float, power: float) -> float:
     return module_value ** power * (value // module_value)
 
 
+def __getattr__(name: str) -> Any:
+    if name != "VectorArray":
+        raise AttributeError(f"module \"simpli.utils\" has no attribute \"{name}\"")
+
+    from ._vector_array import VectorArray
+
+    globals()[name] = VectorArray
+    return VectorArray
+
+
 __all__ = [
     Color,
     AbstractHolder,
     Holder,
     AbstractIdentifierHolder,
     IdentifierHolder,
+    AbstractSpatialIndex,
+    SpatialHash,
     Value,
+    Binding,
+    FieldBinding,
+    resolve,
     Vector,
 ]
@@ -0,0 +1,104 @@
+from functools import cache
+from operator import attrgetter
+from typing import TYPE_CHECKING, Any, Callable, Generic, Type, TypeVar
+
+from ._value import Value
+
+if TYPE_CHECKING:
+    from simpli import Simpli
+    from simpli.components import Component, AbstractComponentHolder
+    from simpli.entities import AbstractEntity
+else:
+    Simpli = Any
+    Component = Any
+    AbstractComponentHolder = Any
+    AbstractEntity = Any
+
+_T = TypeVar("_T", bound=object)
+
+_field_accessor: Callable[[str], Callable[[Any], Any]] = cache(attrgetter)
+
+
+def resolve(value: _T | Value[_T]) -> _T:
+    if isinstance(value, Value):
+        return value.value
+
+    return value
+
+
+class Binding(Value, Generic[_T]):
+    def __init__(self, getter: Callable[[], _T] | None, *, app: Simpli) -> None:
+        self._getter: Callable[[], _T] | None = getter
+        self._app: Simpli = app
+        self._epoch: int = -1
+        self._cached: _T | None = None
+
+    @property
+    def value(self) -> _T:
+        epoch: int = self._app.epoch
+
+        if self._epoch != epoch:
+            self._cached = self._getter()
+            self._epoch = epoch
+
+        return self._cached
+
+    def invalidate(self) -> None:
+        self._epoch = -1
+
+
+class FieldBinding(Binding, Generic[_T]):
+    def __init__(
+            self,
+            entity: AbstractEntity,
+            component_type: Type[Component],
+            field: str,
+            *,
+            scale: Any = None,
+            offset: Any = None,
+    ) -> None:
+        super().__init__(None, app=entity.app)
+        self._entity: AbstractEntity = entity
+        self._component_type: Type[Component] = component_type
+        self._field: str = field
+        self._scale: Any = scale
+        self._offset: Any = offset
+        self._components: AbstractComponentHolder = entity.components
+        self._accessor: Callable[[Component], _T] = _field_accessor(field)
+
+    @property
+    def value(self) -> _T:
+        epoch: int = self._app.epoch
+
+        if self._epoch != epoch:
+            value: _T = self._accessor(self._components.get(self._component_type))
+
+            if self._scale is not None:
+                value = value * self._scale
+            if self._offset is not None:
+                value = value + self._offset
+
+            self._cached = value
+            self._epoch = epoch
+
+        return self._cached
+
+    @property
+    def entity(self) -> AbstractEntity:
+        return self._entity
+
+    @property
+    def component_type(self) -> Type[Component]:
+        return self._component_type
+
+    @property
+    def field(self) -> str:
+        return self._field
+
+    @property
+    def scale(self) -> Any:
+        return self._scale
+
+    @property
+    def offset(self) -> Any:
+        return self._offset
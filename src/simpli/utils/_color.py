@@ -1,5 +1,5 @@
 from dataclasses import dataclass
-from random import random, shuffle
+from random import Random, random, shuffle
 from typing import Tuple, Self, List
 
 
@@ -19,15 +19,19 @@ class Color:
         return int(self.red * 255), int(self.green * 255), int(self.blue * 255), int(self.alpha * 255)
 
     @classmethod
-    def random(cls) -> Self:
-        values: List[float] = [0, random(), 1]
-        shuffle(values)
+    def random(cls, rng: Random | None = None) -> Self:
+        values: List[float] = [0, random() if rng is None else rng.random(), 1]
+
+        if rng is None:
+            shuffle(values)
+        else:
+            rng.shuffle(values)
 
         return cls(values[0], values[1], values[2])
 
     @classmethod
-    def random_bright(cls) -> Self:
-        color: Self = cls.random()
+    def random_bright(cls, rng: Random | None = None) -> Self:
+        color: Self = cls.random(rng)
 
         return cls(
             color.red + (1 - color.red) / 2,
@@ -36,8 +40,8 @@ class Color:
         )
 
     @classmethod
-    def random_dark(cls) -> Self:
-        color: Self = cls.random()
+    def random_dark(cls, rng: Random | None = None) -> Self:
+        color: Self = cls.random(rng)
 
         return cls(color.red / 2, color.green / 2, color.blue / 2)
 
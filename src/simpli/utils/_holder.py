@@ -1,22 +1,42 @@
 from abc import abstractmethod, ABC
 from array import array
 from functools import partial
-from typing import Generic, TypeVar, List, Iterable
+from threading import RLock
+from typing import Generic, TypeVar, List, Iterable, Callable, Sequence
 
 from simpli.interfaces import Identifiable
 
 _IT = TypeVar('_IT', bound=Identifiable)
 
+_SLOT_BITS: int = 32
+_SLOT_MASK: int = (1 << _SLOT_BITS) - 1
+
 
 class AbstractHolder(ABC, Generic[_IT]):
     @abstractmethod
     def add(self, item: _IT) -> int:
         raise NotImplementedError
 
+    @abstractmethod
+    def add_many(self, items: Sequence[_IT]) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def reserve(self, count: int) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def remove(self, identifier: int) -> _IT:
         raise NotImplementedError
 
+    @abstractmethod
+    def remove_many(self, identifiers: Iterable[int]) -> List[_IT]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def defer(self, operation: Callable[[], None]) -> None:
+        raise NotImplementedError
+
     @abstractmethod
     def __getitem__(self, identifier: int) -> _IT:
         raise NotImplementedError
@@ -37,77 +57,131 @@ class AbstractHolder(ABC, Generic[_IT]):
 class Holder(AbstractHolder, Generic[_IT]):
     __slots__ = (
         "_items",
-        "_ids",
-        "_indices"
+        "_slots",
+        "_indices",
+        "_generations",
     )
 
     def __init__(self) -> None:
         self._items: List[_IT] = []
-        self._ids: array = array('I')
+        self._slots: array = array('I')
         self._indices: array = array('I')
+        self._generations: array = array('I')
 
         self._current_iterations: int = 0
         self._pending_operations: List[partial] = []
+        self._lock: RLock = RLock()
 
     def add(self, item: _IT) -> int:
         self._items.append(item)
         index: int = len(self._items) - 1
 
         try:
-            identifier: int = self._ids[index]
+            slot: int = self._slots[index]
         except IndexError:
-            self._ids.append(index)
+            self._slots.append(index)
             self._indices.append(index)
-            identifier: int = index
+            self._generations.append(0)
+            slot: int = index
 
+        identifier: int = self._generations[slot] << _SLOT_BITS | slot
         item.set_identifier_if_none(identifier)
         return identifier
 
+    def add_many(self, items: Sequence[_IT]) -> List[int]:
+        start: int = len(self._items)
+        self.reserve(len(items))
+        self._items.extend(items)
+
+        generations: array = self._generations
+        identifiers: List[int] = [
+            generations[slot] << _SLOT_BITS | slot for slot in self._slots[start:start + len(items)]
+        ]
+
+        for item, identifier in zip(items, identifiers):
+            item.set_identifier_if_none(identifier)
+
+        return identifiers
+
+    def reserve(self, count: int) -> None:
+        start: int = len(self._slots)
+        end: int = len(self._items) + count
+
+        if end <= start:
+            return
+
+        self._slots.extend(range(start, end))
+        self._indices.extend(range(start, end))
+        self._generations.extend(array('I', (0,)) * (end - start))
+
     def remove(self, identifier: int) -> _IT:
-        try:
-            index: int = self._indices[identifier]
-        except IndexError:
-            raise KeyError(f"Id {identifier} is not in holder")
+        return self._remove_at(self._index(identifier))
 
-        self._items[index], self._items[-1] = self._items[-1], self._items[index]
-        self._ids[index], self._ids[-1] = self._ids[-1], self._ids[identifier]
-        (
-            self._indices[self._ids[index]],
-            self._indices[self._ids[-1]]
-        ) = (
-            self._indices[self._ids[-1]],
-            self._indices[self._ids[index]]
-        )
+    def remove_many(self, identifiers: Iterable[int]) -> List[_IT]:
+        indices: List[int] = sorted({self._index(identifier) for identifier in identifiers}, reverse=True)
+        return [self._remove_at(index) for index in indices]
 
-        return self._items.pop()
+    def defer(self, operation: Callable[[], None]) -> None:
+        with self._lock:
+            if self._current_iterations > 0:
+                self._pending_operations.append(partial(operation))
+            else:
+                operation()
 
     def __getitem__(self, identifier: int) -> _IT:
-        try:
-            return self._items[self._indices[identifier]]
-        except IndexError:
-            raise KeyError(f"ID {identifier} is not in holder")
+        return self._items[self._index(identifier)]
 
     def __contains__(self, identifier: int) -> bool:
-        try:
-            return self._indices[identifier] < len(self._items)
-        except IndexError:
-            return False
+        slot: int = identifier & _SLOT_MASK
+        return (
+                slot < len(self._generations)
+                and self._generations[slot] == identifier >> _SLOT_BITS
+                and self._indices[slot] < len(self._items)
+        )
 
     def __len__(self) -> int:
         return len(self._items)
 
     def __iter__(self) -> Iterable[_IT]:
-        self._current_iterations += 1
+        with self._lock:
+            self._current_iterations += 1
 
         try:
             for item in self._items:
                 yield item
         finally:
-            self._current_iterations -= 1
+            with self._lock:
+                self._current_iterations -= 1
+
+                if self._current_iterations <= 0:
+                    self._current_iterations = 0
+                    self._flush_pending_operations()
+
+    def _index(self, identifier: int) -> int:
+        slot: int = identifier & _SLOT_MASK
 
-            if self._current_iterations <= 0:
-                self._current_iterations = 0
-                self._flush_pending_operations()
+        if slot >= len(self._generations) or self._generations[slot] != identifier >> _SLOT_BITS:
+            raise KeyError(f"Id {identifier} is not in holder")
+
+        index: int = self._indices[slot]
+
+        if index >= len(self._items):
+            raise KeyError(f"Id {identifier} is not in holder")
+
+        return index
+
+    def _remove_at(self, index: int) -> _IT:
+        last: int = len(self._items) - 1
+
+        self._items[index], self._items[last] = self._items[last], self._items[index]
+        self._slots[index], self._slots[last] = self._slots[last], self._slots[index]
+        self._indices[self._slots[index]] = index
+        self._indices[self._slots[last]] = last
+
+        slot: int = self._slots[last]
+        self._generations[slot] = (self._generations[slot] + 1) & _SLOT_MASK
+
+        return self._items.pop()
 
     def _flush_pending_operations(self):
         for operation in self._pending_operations:
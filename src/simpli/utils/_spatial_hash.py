@@ -0,0 +1,176 @@
+from abc import ABC, abstractmethod
+from math import sqrt
+from typing import Dict, Set, Tuple, List, TypeAlias
+
+from ._vector import Vector
+
+_Cell: TypeAlias = Tuple[int, int]
+
+
+class AbstractSpatialIndex(ABC):
+    @abstractmethod
+    def insert(self, identifier: int, position: Vector) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def move(self, identifier: int, position: Vector) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def discard(self, identifier: int) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def query(self, position: Vector, radius: float) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def query_rectangle(self, low: Vector, high: Vector) -> List[int]:
+        raise NotImplementedError
+
+    @abstractmethod
+    def clear(self) -> None:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __contains__(self, identifier: int) -> bool:
+        raise NotImplementedError
+
+    @abstractmethod
+    def __len__(self) -> int:
+        raise NotImplementedError
+
+
+class SpatialHash(AbstractSpatialIndex):
+    __slots__ = (
+        "_cell_size",
+        "_cells",
+        "_keys",
+        "_positions",
+    )
+
+    def __init__(self, cell_size: float = 50) -> None:
+        if cell_size <= 0:
+            raise ValueError("Cell size must be positive")
+
+        self._cell_size: float = cell_size
+        self._cells: Dict[_Cell, Set[int]] = {}
+        self._keys: Dict[int, _Cell] = {}
+        self._positions: Dict[int, Vector] = {}
+
+    @property
+    def cell_size(self) -> float:
+        return self._cell_size
+
+    @cell_size.setter
+    def cell_size(self, value: float) -> None:
+        if value <= 0:
+            raise ValueError("Cell size must be positive")
+
+        self._cell_size = value
+        self._cells.clear()
+        self._keys.clear()
+
+        for identifier, position in self._positions.items():
+            key: _Cell = self._key(position)
+            self._keys[identifier] = key
+            self._cells.setdefault(key, set()).add(identifier)
+
+    def insert(self, identifier: int, position: Vector) -> None:
+        if identifier in self._keys:
+            self.move(identifier, position)
+            return
+
+        key: _Cell = self._key(position)
+        self._keys[identifier] = key
+        self._positions[identifier] = position
+        self._cells.setdefault(key, set()).add(identifier)
+
+    def move(self, identifier: int, position: Vector) -> None:
+        key: _Cell = self._key(position)
+        previous_key: _Cell = self._keys[identifier]
+        self._positions[identifier] = position
+
+        if key != previous_key:
+            self._remove_from_cell(identifier, previous_key)
+            self._keys[identifier] = key
+            self._cells.setdefault(key, set()).add(identifier)
+
+    def discard(self, identifier: int) -> None:
+        key: _Cell | None = self._keys.pop(identifier, None)
+
+        if key is None:
+            return
+
+        del self._positions[identifier]
+        self._remove_from_cell(identifier, key)
+
+    def query(self, position: Vector, radius: float) -> List[int]:
+        x, y = position.x, position.y
+        cell_size: float = self._cell_size
+        positions: Dict[int, Vector] = self._positions
+        found: List[int] = []
+
+        for cell_x in range(int((x - radius) // cell_size), int((x + radius) // cell_size) + 1):
+            for cell_y in range(int((y - radius) // cell_size), int((y + radius) // cell_size) + 1):
+                cell: Set[int] | None = self._cells.get((cell_x, cell_y))
+
+                if cell is None:
+                    continue
+
+                for identifier in cell:
+                    other: Vector = positions[identifier]
+
+                    if sqrt((other.x - x) ** 2 + (other.y - y) ** 2) < radius:
+                        found.append(identifier)
+
+        return found
+
+    def query_rectangle(self, low: Vector, high: Vector) -> List[int]:
+        low_x, low_y, high_x, high_y = low.x, low.y, high.x, high.y
+        cell_size: float = self._cell_size
+        positions: Dict[int, Vector] = self._positions
+        found: List[int] = []
+
+        for cell_x in range(int(low_x // cell_size), int(high_x // cell_size) + 1):
+            for cell_y in range(int(low_y // cell_size), int(high_y // cell_size) + 1):
+                cell: Set[int] | None = self._cells.get((cell_x, cell_y))
+
+                if cell is None:
+                    continue
+
+                if (
+                        low_x <= cell_x * cell_size and (cell_x + 1) * cell_size <= high_x
+                        and low_y <= cell_y * cell_size and (cell_y + 1) * cell_size <= high_y
+                ):
+                    found.extend(cell)
+                    continue
+
+                for identifier in cell:
+                    other: Vector = positions[identifier]
+
+                    if low_x <= other.x <= high_x and low_y <= other.y <= high_y:
+                        found.append(identifier)
+
+        return found
+
+    def clear(self) -> None:
+        self._cells.clear()
+        self._keys.clear()
+        self._positions.clear()
+
+    def __contains__(self, identifier: int) -> bool:
+        return identifier in self._keys
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def _key(self, position: Vector) -> _Cell:
+        return int(position.x // self._cell_size), int(position.y // self._cell_size)
+
+    def _remove_from_cell(self, identifier: int, key: _Cell) -> None:
+        cell: Set[int] = self._cells[key]
+        cell.discard(identifier)
+
+        if not cell:
+            del self._cells[key]
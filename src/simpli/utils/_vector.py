@@ -1,6 +1,6 @@
 from dataclasses import dataclass
 from math import pi, cos, sin, sqrt
-from random import random
+from random import Random, random
 from typing import Self, Tuple
 
 
@@ -35,8 +35,8 @@ class Vector:
         return Vector(0, 0)
 
     @classmethod
-    def random(cls) -> Self:
-        angle: float = 2 * pi * random()
+    def random(cls, rng: Random | None = None) -> Self:
+        angle: float = 2 * pi * (random() if rng is None else rng.random())
 
         return Vector(cos(angle), sin(angle))
 
@@ -0,0 +1,156 @@
+from itertools import starmap
+from typing import Self, Iterable, Iterator, List, Any
+
+from ._vector import Vector
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class VectorArray:
+    __slots__ = ("_data",)
+
+    def __init__(self, data: Any = None, *, copy: bool = False) -> None:
+        if np is None:
+            raise ImportError("Vector arrays require numpy, install simpli[numpy]")
+
+        if data is None:
+            data = np.zeros((0, 2), dtype=np.float64)
+
+        array: np.ndarray = np.array(data, dtype=np.float64, copy=True if copy else None)
+
+        if array.size == 0:
+            array = array.reshape(0, 2)
+
+        if array.ndim != 2 or array.shape[1] != 2:
+            raise ValueError("Vector array data must have shape (count, 2)")
+
+        self._data: np.ndarray = array
+
+    @property
+    def x(self) -> 'np.ndarray':
+        return self._data[:, 0]
+
+    @property
+    def y(self) -> 'np.ndarray':
+        return self._data[:, 1]
+
+    @property
+    def lengths(self) -> 'np.ndarray':
+        return np.sqrt(self.lengths_squared)
+
+    @property
+    def lengths_squared(self) -> 'np.ndarray':
+        return self.x ** 2 + self.y ** 2
+
+    @property
+    def normalized(self) -> Self:
+        lengths: np.ndarray = self.lengths
+        normalized: np.ndarray = np.zeros_like(self._data)
+        np.divide(self._data, lengths[:, None], out=normalized, where=lengths[:, None] != 0)
+
+        return VectorArray(normalized)
+
+    @property
+    def as_numpy(self) -> 'np.ndarray':
+        return self._data
+
+    @classmethod
+    def zeros(cls, count: int) -> Self:
+        return cls(np.zeros((count, 2), dtype=np.float64))
+
+    @classmethod
+    def from_numpy(cls, array: 'np.ndarray') -> Self:
+        return cls(array)
+
+    @classmethod
+    def from_vectors(cls, vectors: Iterable[Vector]) -> Self:
+        return cls(np.fromiter(
+            ((vector.x, vector.y) for vector in vectors),
+            dtype=np.dtype((np.float64, 2)),
+        ))
+
+    def to_vectors(self) -> List[Vector]:
+        return list(starmap(Vector, self._data.tolist()))
+
+    def dot(self, other: Self | Vector) -> 'np.ndarray':
+        return self.x * other.x + self.y * other.y
+
+    def mask(self, condition: 'np.ndarray') -> Self:
+        return VectorArray(self._data[condition])
+
+    def copy(self) -> Self:
+        return VectorArray(self._data, copy=True)
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None) -> 'np.ndarray':
+        if dtype is None and not copy:
+            return self._data
+
+        return np.array(self._data, dtype=dtype, copy=True if copy else None)
+
+    def __repr__(self) -> str:
+        return f"VectorArray({self._data.tolist()})"
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __iter__(self) -> Iterator[Vector]:
+        return iter(self.to_vectors())
+
+    def __getitem__(self, key: Any) -> Vector | Self:
+        if isinstance(key, (int, np.integer)):
+            return Vector(*self._data[key].tolist())
+
+        return VectorArray(self._data[key])
+
+    def __setitem__(self, key: Any, value: Vector | Self) -> None:
+        self._data[key] = self._operand(value)
+
+    def __add__(self, other: Self | Vector) -> Self:
+        return VectorArray(self._data + self._operand(other))
+
+    def __sub__(self, other: Self | Vector) -> Self:
+        return VectorArray(self._data - self._operand(other))
+
+    def __mul__(self, value: 'float | np.ndarray') -> Self:
+        return VectorArray(self._data * self._scale(value))
+
+    def __rmul__(self, value: 'float | np.ndarray') -> Self:
+        return self.__mul__(value)
+
+    def __truediv__(self, value: 'float | np.ndarray') -> Self:
+        return VectorArray(self._data / self._scale(value))
+
+    def __iadd__(self, other: Self | Vector) -> Self:
+        self._data += self._operand(other)
+        return self
+
+    def __isub__(self, other: Self | Vector) -> Self:
+        self._data -= self._operand(other)
+        return self
+
+    def __imul__(self, value: 'float | np.ndarray') -> Self:
+        self._data *= self._scale(value)
+        return self
+
+    def __neg__(self) -> Self:
+        return VectorArray(-self._data)
+
+    @staticmethod
+    def _operand(value: Self | Vector) -> Any:
+        if isinstance(value, Vector):
+            return value.x, value.y
+
+        if isinstance(value, VectorArray):
+            return value._data
+
+        return value
+
+    @staticmethod
+    def _scale(value: 'float | np.ndarray') -> Any:
+        if isinstance(value, np.ndarray) and value.ndim == 1:
+            return value[:, None]
+
+        return value
@@ -0,0 +1,41 @@
+from typing import Dict, List, Tuple
+
+import pytest
+
+from simpli.interfaces import Identifiable
+from simpli.utils import Holder
+
+
+class _Item(Identifiable):
+    def __init__(self, name: str) -> None:
+        self.name: str = name
+        self._identifier: int | None = None
+
+    @property
+    def identifier(self) -> int:
+        return self._identifier
+
+    def set_identifier_if_none(self, identifier: int) -> None:
+        if self._identifier is None:
+            self._identifier = identifier
+
+
+@pytest.mark.parametrize("order", ((0, 1, 2, 3), (3, 2, 1, 0), (1, 3, 0, 2), (2, 0, 3, 1)))
+def test_remove_keeps_remaining_lookups_valid(order: Tuple[int, ...]) -> None:
+    holder: Holder[_Item] = Holder()
+    items: List[_Item] = [_Item(str(index)) for index in range(6)]
+    identifiers: Dict[str, int] = {item.name: holder.add(item) for item in items}
+
+    for position, index in enumerate(order):
+        removed: _Item = holder.remove(identifiers[str(index)])
+
+        assert removed is items[index]
+        assert identifiers[str(index)] not in holder
+
+        remaining: List[_Item] = [item for item in items if int(item.name) not in order[:position + 1]]
+
+        assert len(holder) == len(remaining)
+        assert all(holder[item.identifier] is item for item in remaining)
+
+    with pytest.raises(KeyError):
+        holder.remove(identifiers[str(order[0])])
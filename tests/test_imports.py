@@ -0,0 +1,12 @@
+import pytest
+
+from simpli.bench import IMPORT_MODULES, measure_imports
+
+IMPORT_BUDGET_SECONDS: float = 0.2
+
+
+@pytest.mark.parametrize("module", IMPORT_MODULES)
+def test_import_is_fast_and_does_not_load_gl_window_or_graphics(module: str) -> None:
+    result, = measure_imports((module,), repeats=3)
+
+    assert result.seconds < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,54 @@
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+import pytest
+
+from simpli import Simpli
+from simpli.components import PositionComponent, VelocityComponent, ShapeComponent
+from simpli.entities import AbstractEntity, CellEntity
+from simpli.utils import Vector
+
+
+def _state(app: Simpli) -> List[Tuple[Any, ...]]:
+    state: List[Tuple[Any, ...]] = []
+
+    for entity in app.entities:
+        row: List[Any] = [type(entity).__name__, entity.name, None if entity.parent is None else entity.parent.name]
+
+        if entity.components.has(PositionComponent):
+            row.append(entity.components.get(PositionComponent).position.as_tuple)
+
+        if entity.components.has(VelocityComponent):
+            row.append(entity.components.get(VelocityComponent).velocity.as_tuple)
+
+        if entity.components.has(ShapeComponent):
+            shape: Any = entity.components.get(ShapeComponent).shape
+            row.append((type(shape).__name__, shape.layer_group, shape.bounds))
+
+        state.append(tuple(row))
+
+    return state
+
+
+@pytest.mark.parametrize("vectorized", (False, True))
+def test_snapshot_round_trip_restores_entities_components_and_shapes(tmp_path: Path, vectorized: bool) -> None:
+    path: str = str(tmp_path / "world.snap")
+    app: Simpli = Simpli(headless=True, vectorized=vectorized, seed=1)
+
+    for index in range(50):
+        app.entities.new(CellEntity, Vector(index * 10, index % 7), 5 + index % 3, initial_velocity=Vector(1, 0.5))
+
+    app.step(3)
+    app.snapshots.save(path)
+
+    restored: Simpli = Simpli(headless=True, vectorized=vectorized, seed=1)
+    identifiers: Dict[int, AbstractEntity] = restored.snapshots.load(path)
+
+    assert _state(restored) == _state(app)
+    assert len(identifiers) == len(app.entities)
+    assert len(restored.shapes) == len(app.shapes)
+
+    app.step(2)
+    restored.step(2)
+
+    assert _state(restored) == _state(app)